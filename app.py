@@ -1,22 +1,30 @@
+import copy
 import datetime
 import logging
-import re
-from urllib.parse import unquote
+import time
 
-import pandas as pd
-import requests
 import streamlit as st
-from bs4 import BeautifulSoup
-from deep_translator import GoogleTranslator
 
-from rss_fetcher import fetch_folder_articles, fetch_keyword_search_articles
-from config import LLM_SCORING_ENABLED
-from scorer import get_criteria_for_folder, select_top_articles
-from utils import dataframes_to_excel
+import http_replay
+import jobs
+import perf
+from collector import collect_folder_cached, date_window, default_week
+from config import COLLECT_MAX_WORKERS, LLM_SCORING_ENABLED
+from scorer import get_criteria_for_folder
+from exporters import EXPORT_FORMATS, ExportCache, analyze_for_export, available_formats
+from archive import get_archive
+from article_store import get_article_store
+from feed_health import STATUS_OK, STATUS_OPEN, get_feed_health
+from feed_scheduler import get_feed_scheduler
+from result_cache import get_result_cache
 import settings_manager as sm
+from url_canon import article_key, canonical_url
 
 logger = logging.getLogger(__name__)
 
+# HTTP_REPLAY_MODE가 지정된 경우 외부 요청을 기록하거나 카세트에서 재생
+http_replay.install_from_env()
+
 st.set_page_config(page_title="바이오헬스 주간동향", layout="wide")
 
 # ── 커스텀 테마 CSS ──
@@ -110,11 +118,39 @@ hr {
 </style>
 """, unsafe_allow_html=True)
 
-# ── 설정 로드 ──
-if "settings" not in st.session_state:
-    st.session_state["settings"] = sm.load_settings()
+# ── 설정 로드 (다른 세션 · 배치가 저장한 변경도 반영) ──
+_CHANGE_LABELS = {
+    "added": "추가", "removed": "삭제", "feeds": "피드", "search_queries": "검색어",
+    "keywords": "키워드", "description": "설명", "top_n": "상위 N",
+}
+_settings_rev = sm.settings_revision()
+if "settings" not in st.session_state or st.session_state.get("settings_rev") != _settings_rev:
+    _loaded = sm.load_settings()
+    _previous = st.session_state.get("settings_snapshot")
+    if _previous is not None:
+        # 바뀐 분야의 화면 결과만 버림 — 다시 수집할 때 기사 저장소 · 스코어링 캐시 ·
+        # 번역 아카이브 덕분에 바뀐 항목에 해당하는 작업만 실행됨
+        _changes = sm.diff_folder_settings(_previous, _loaded)
+        for _fn in _changes:
+            for _prefix in ("cache_", "excel_", "excel_key_", "excel_count_"):
+                st.session_state.pop(f"{_prefix}{_fn}", None)
+        if _changes:
+            for _key in ("excel_data_all", "excel_keys_all", "excel_count_all"):
+                st.session_state.pop(_key, None)
+            st.toast("설정 변경 반영: " + ", ".join(
+                f"{_fn}({'·'.join(_CHANGE_LABELS[k] for k in sorted(_kinds))})"
+                for _fn, _kinds in _changes.items()
+            ))
+    st.session_state["settings"] = _loaded
+    st.session_state["settings_snapshot"] = copy.deepcopy(_loaded)
+    st.session_state["settings_rev"] = _settings_rev
 settings = st.session_state["settings"]
 
+# ── 성능 측정 실행 ID (전체 새로 수집 시 새로 발급) ──
+if "perf_run" not in st.session_state:
+    st.session_state["perf_run"] = perf.new_run_id()
+perf.set_run(st.session_state["perf_run"])
+
 st.title("바이오헬스 주간동향 뉴스 수집 RSS 대시보드")
 
 # ═══════════════════════════════════════════════════════════════
@@ -220,7 +256,7 @@ with st.sidebar:
                 settings = sm.update_criteria(settings, edit_folder, updated)
                 sm.save_settings(settings)
                 st.session_state["settings"] = settings
-                st.success("선별 기준이 저장되었습니다. 각 분야의 새로고침 버튼을 눌러야 반영됩니다.")
+                st.success("선별 기준이 저장되었습니다. 바뀐 항목만 다시 계산하여 자동 반영됩니다.")
                 st.rerun()
 
         # ── 3b. RSS 피드 관리 ──
@@ -274,7 +310,7 @@ with st.sidebar:
                             settings = sm.update_search_queries(settings, edit_folder, cur_queries)
                             sm.save_settings(settings)
                             st.session_state["settings"] = settings
-                            st.toast(f"검색어가 삭제되었습니다. 새로고침 시 반영됩니다.")
+                            st.toast("검색어가 삭제되었습니다. 자동으로 다시 선별됩니다.")
             else:
                 st.info("검색어 미등록 시 스코어링 키워드에서 자동 생성됩니다.")
 
@@ -292,7 +328,7 @@ with st.sidebar:
                 settings = sm.update_search_queries(settings, edit_folder, new_queries)
                 sm.save_settings(settings)
                 st.session_state["settings"] = settings
-                st.toast(f"{len(suggested)}개 추천 검색어 추가됨. 새로고침 시 반영됩니다.")
+                st.toast(f"{len(suggested)}개 추천 검색어 추가됨. 추가된 검색어만 수집하여 자동 반영됩니다.")
 
             if suggested:
                 st.caption(f"추천 검색어: {', '.join(suggested)}")
@@ -308,648 +344,657 @@ with st.sidebar:
                 settings = sm.update_search_queries(settings, edit_folder, cur_queries)
                 sm.save_settings(settings)
                 st.session_state["settings"] = settings
-                st.toast(f"'{new_query.strip()}' 검색어 추가됨. 새로고침 시 반영됩니다.")
+                st.toast(f"'{new_query.strip()}' 검색어 추가됨. 추가된 검색어만 수집하여 자동 반영됩니다.")
                 st.rerun()
 
-# ── Google Translate 헬퍼 ──
-_translator = GoogleTranslator(source="auto", target="ko")
-
-
-def _translate_ko(text: str, max_len: int = 4500) -> str:
-    """텍스트를 한국어로 번역. 이미 한국어면 그대로 반환."""
-    if not text or not text.strip():
-        return text
-    # 한국어 비율이 높으면 번역 불필요
-    korean_chars = sum(1 for c in text if '\uac00' <= c <= '\ud7a3')
-    if korean_chars / max(len(text), 1) > 0.3:
-        return text
-    try:
-        return _translator.translate(text[:max_len])
-    except Exception as e:
-        logger.warning("번역 실패: %s", e)
-        return text
-
-
-def _extract_3_sentences(text: str) -> str:
-    """텍스트에서 최대 3문장을 추출. 문장이 부족하면 있는 만큼 반환."""
-    if not text or not text.strip():
-        return text
-    # 문장 분리: 마침표/느낌표/물음표 + 공백 또는 줄바꿈 기준
-    sentences = re.split(r'(?<=[.!?。])\s+', text.strip())
-    # 빈 문장 제거
-    sentences = [s.strip() for s in sentences if s.strip()]
-    if not sentences:
-        return text
-    result = " ".join(sentences[:3])
-    # 마지막에 마침표가 없으면 추가
-    if result and result[-1] not in ".!?。":
-        result += "."
-    return result
-
-
-def _resolve_google_url(url: str) -> str:
-    """Google redirect URL에서 실제 기사 URL을 추출."""
-    if "google.com/url" in url and "url=" in url:
-        real_url = url.split("url=")[1].split("&")[0]
-        return unquote(real_url)
-    return url
-
-
-def _fetch_article_text(url: str, max_chars: int = 3000) -> str:
-    """URL에서 기사 본문 텍스트를 추출 (requests + BeautifulSoup)."""
-    try:
-        resolved_url = _resolve_google_url(url)
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-        }
-        resp = requests.get(resolved_url, headers=headers, timeout=10, allow_redirects=True)
-        resp.raise_for_status()
+# ═══════════════════════════════════════════════════════════════
+# 우수 기사 선별
+# ═══════════════════════════════════════════════════════════════
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+# ── 백그라운드 수집 실행기 (프로세스 전체에서 공유) ──
+@st.cache_resource
+def _get_job_runner() -> jobs.JobRunner:
+    # 분야별 수집을 동시에 실행 (외부 요청 수는 limiters가 전체 분야에 걸쳐 제한)
+    return jobs.JobRunner(max_workers=COLLECT_MAX_WORKERS)
 
-        # 비본문 요소 제거
-        for tag in soup(["script", "style", "nav", "footer", "header", "aside", "form", "iframe"]):
-            tag.decompose()
 
-        # <article> 또는 본문 영역 우선 탐색
-        article_el = soup.find("article") or soup.find(
-            class_=re.compile(r"article|story|content|post-body", re.I)
-        )
-        target = article_el if article_el else soup
-
-        # <p> 태그에서 본문 추출 (짧은 네비게이션 텍스트 제외)
-        paragraphs = target.find_all("p")
-        text_parts = []
-        for p in paragraphs:
-            text = p.get_text(strip=True)
-            if len(text) > 30:
-                text_parts.append(text)
-
-        full_text = " ".join(text_parts)
-        return full_text[:max_chars] if full_text else ""
-    except Exception:
-        return ""
-
-
-# ── 국가 감지 (URL 도메인 + 텍스트 키워드) ──
-_COUNTRY_BY_TLD = {
-    ".kr": "한국", ".jp": "일본", ".cn": "중국", ".tw": "대만",
-    ".sg": "싱가포르", ".in": "인도", ".th": "태국", ".vn": "베트남",
-    ".id": "인도네시아", ".my": "말레이시아", ".ph": "필리핀",
-    ".uk": "영국", ".de": "독일", ".fr": "프랑스", ".it": "이탈리아",
-    ".es": "스페인", ".nl": "네덜란드", ".se": "스웨덴", ".ch": "스위스",
-    ".au": "호주", ".ca": "캐나다", ".br": "브라질", ".mx": "멕시코",
-    ".sa": "사우디", ".ae": "UAE", ".qa": "카타르", ".il": "이스라엘",
-}
-_COUNTRY_KEYWORDS = {
-    "미국": ["FDA", "NIH", "CDC", "United States", "U.S.", "American"],
-    "EU": ["European Union", "EMA", "EU ", "European Commission"],
-    "영국": ["UK ", "MHRA", "NHS", "United Kingdom", "Britain"],
-    "중국": ["China", "NMPA", "Chinese", "Beijing", "Shanghai"],
-    "일본": ["Japan", "PMDA", "Japanese", "Tokyo"],
-    "한국": ["Korea", "MFDS", "식약처", "한국"],
-    "인도": ["India", "Indian", "CDSCO", "Mumbai"],
-    "사우디": ["Saudi", "사우디"],
-    "UAE": ["UAE", "Dubai", "Abu Dhabi", "두바이"],
-}
+job_runner = _get_job_runner()
+result_cache = get_result_cache()
+article_store = get_article_store()
+article_archive = get_archive()
+settings_ver = sm.settings_version(settings)
 
+# ── 내보내기 캐시 (선택 기사 해시 + 설정 버전 단위) ──
+if "export_cache" not in st.session_state:
+    st.session_state["export_cache"] = ExportCache()
+export_cache = st.session_state["export_cache"]
 
-def _detect_country(article: dict) -> str:
-    """기사에서 국가/지역을 추출. 공란 없이 반드시 값 반환."""
-    # 1) 스코어링에서 이미 감지된 국가
-    matched_countries = article.get("matched_countries", [])
-    if matched_countries:
-        # 한글 국가명으로 정규화
-        return _normalize_country(matched_countries[0])
-
-    # 2) URL 도메인의 TLD로 감지
-    url = article.get("url", "")
-    for tld, country in _COUNTRY_BY_TLD.items():
-        if tld + "/" in url or url.endswith(tld):
-            return country
-
-    # 3) 제목+요약 텍스트에서 국가 키워드 감지
-    text = (article.get("title", "") + " " + article.get("summary", "")).upper()
-    for country, keywords in _COUNTRY_KEYWORDS.items():
-        for kw in keywords:
-            if kw.upper() in text:
-                return country
-
-    # 4) URL 도메인에서 추정
-    from urllib.parse import urlparse
-    try:
-        domain = urlparse(url).netloc.lower()
-        if ".com" in domain or ".org" in domain or ".net" in domain:
-            return "글로벌"
-    except Exception:
-        pass
-
-    return "글로벌"
-
-
-_COUNTRY_NORMALIZE = {
-    "US": "미국", "USA": "미국", "UK": "영국",
-    "EU": "EU", "Saudi": "사우디아라비아",
-    "Dubai": "UAE", "Qatar": "카타르",
-}
+if "selected_articles" not in st.session_state:
+    st.session_state["selected_articles"] = {}
 
+PAGE_SIZES = [20, 50, 100]
 
-def _normalize_country(name: str) -> str:
-    """영문 국가명을 한글로 정규화."""
-    return _COUNTRY_NORMALIZE.get(name, name)
-
-
-# ── 엑셀 행 생성 헬퍼 ──
-def _build_excel_rows(articles: list[dict], progress_callback=None) -> list[dict]:
-    """기사 리스트를 엑셀 행 딕셔너리 리스트로 변환. 번역 포함."""
-    rows = []
-    total = len(articles)
-    for idx, a in enumerate(articles, 1):
-        if progress_callback:
-            progress_callback(idx, total)
-
-        pub = a.get("published")
-        title_orig = a.get("title", "")
-        summary_orig = (a.get("summary") or "")[:500]
-
-        # ── 키워드1(국가): AI → 자동 감지 (공란 없음)
-        country = a.get("country", "")
-        if not country:
-            country = _detect_country(a)
-
-        # ── 키워드2: AI oneliner → 제목 한글 번역
-        kw2 = a.get("oneliner", "")
-        if not kw2:
-            kw2 = a.get("title_kr", "")
-        if not kw2:
-            kw2 = _translate_ko(title_orig)
-
-        # ── 키워드3(해시태그): AI → 매칭 키워드를 한글 해시태그로
-        kw3 = a.get("hashtags", "")
-        if not kw3:
-            matched = a.get("matched_keywords", [])
-            translated_tags = []
-            for kw in matched:
-                kw_kr = _translate_ko(kw) if all(ord(c) < 128 for c in kw if not c.isspace()) else kw
-                translated_tags.append(f"#{kw_kr.replace(' ', '_')}")
-            kw3 = " ".join(translated_tags) if translated_tags else ""
-
-        # ── 주요내용: AI 3문장 → 기사 본문에서 3문장 추출
-        main_content = a.get("summary_3sent", "")
-        if not main_content:
-            # RSS 요약이 짧으면(200자 미만) 실제 기사 본문을 가져와서 3문장 추출
-            source_text = summary_orig
-            if len(summary_orig) < 200 and a.get("url"):
-                full_text = _fetch_article_text(a["url"])
-                if full_text and len(full_text) > len(summary_orig):
-                    source_text = full_text
-            translated = _translate_ko(source_text[:2000])
-            main_content = _extract_3_sentences(translated)
-
-        # ── 추천기준
-        kw_score = a.get("keyword_score", 0)
-        llm_score = a.get("llm_score")
-        matched_kws = a.get("matched_keywords", [])
-        if llm_score is not None:
-            criteria_text = f"KW:{kw_score:.0f} AI:{llm_score} 종합:{a.get('score', 0):.1f}"
-        else:
-            criteria_text = f"KW:{kw_score:.0f}"
-        if matched_kws:
-            criteria_text += f" [{', '.join(matched_kws[:5])}]"
-
-        rows.append({
-            "구분": idx,
-            "호수": "",
-            "채택": "",
-            "키워드1(국가)": country,
-            "키워드2": kw2,
-            "키워드3(해시태그)": kw3,
-            "원제목(원문)": title_orig,
-            "주요내용": main_content,
-            "발행기관": a.get("source", ""),
-            "발간일": pub.strftime("%Y-%m-%d") if pub else "",
-            "URL": a.get("url", ""),
-            "추천기준": criteria_text,
-        })
-    return rows
+# Streamlit 1.37+ 에서는 선택 영역을 fragment로 실행 — 선택/페이지 변경 시 해당 영역만 다시 그림
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
 
 
-# ═══════════════════════════════════════════════════════════════
-# 우수 기사 선별
-# ═══════════════════════════════════════════════════════════════
+def _session_copy(result: dict) -> dict:
+    """공유 결과를 세션용으로 복사 (내보내기 분석이 기사 dict를 수정하므로)."""
+    copied = dict(result)
+    copied["top_articles"] = [a.copy() for a in result.get("top_articles", [])]
+    return copied
 
-st.subheader("우수 기사 자동 선별")
-if LLM_SCORING_ENABLED:
-    st.caption("각 폴더별 **키워드 + AI 분석** 기준으로 자동 스코어링하여 우수 기사를 선별합니다. 체크박스로 최종 선택 후 엑셀로 내보내세요.")
-else:
-    st.caption("각 폴더별 **키워드 기준**으로 자동 스코어링하여 우수 기사를 선별합니다. 체크박스로 최종 선택 후 엑셀로 내보내세요.")
-
-# ── 날짜 범위 (최근 1주일 기본) ──
-today = datetime.date.today()
-days_since_monday = today.weekday()  # 0=월
-last_monday = today - datetime.timedelta(days=days_since_monday)
-last_sunday = last_monday + datetime.timedelta(days=6)
-
-col_d1, col_d2, col_btn = st.columns([2, 2, 2])
-with col_d1:
-    sel_start = st.date_input("시작일", value=last_monday, key="sel_start")
-with col_d2:
-    sel_end = st.date_input("종료일", value=min(last_sunday, today), key="sel_end")
-with col_btn:
-    st.write("")  # spacing for alignment
-    if st.button("전체 새로 수집", key="btn_refresh"):
-        for key in list(st.session_state.keys()):
-            if key.startswith("cache_"):
-                del st.session_state[key]
-        st.rerun()
-
-# 날짜는 명시적 새로고침 시에만 반영 — 위젯 변경 자체는 재수집 안 함
-sel_newer = int(datetime.datetime.combine(sel_start, datetime.time.min).timestamp())
-sel_older = int(datetime.datetime.combine(sel_end, datetime.time.max).timestamp())
-
-# 스코어링 대상 폴더 (settings.json 기준)
-target_folders = sm.get_folder_names(settings)
-
-# ── 분야별 캐시 무효화 처리 ──
-# (새로고침 버튼 클릭 시에만 해당 분야 캐시 삭제)
-_folder_refresh_key = st.session_state.pop("_refresh_folder", None)
-if _folder_refresh_key:
-    st.session_state.pop(f"cache_{_folder_refresh_key}", None)
-    st.session_state.pop(f"excel_{_folder_refresh_key}", None)
-    st.session_state.pop(f"excel_count_{_folder_refresh_key}", None)
 
-# ═══════════════════════════════════════════════════════════════
-# Phase 1: 데이터 수집 (캐시 없는 분야만 — 날짜/설정 변경은 무시)
-# ═══════════════════════════════════════════════════════════════
+def _mark_exported(sheets: dict[str, list[dict]]) -> None:
+    """다운로드한 기사를 아카이브에 내보냄으로 표시."""
+    for fn, rows in sheets.items():
+        article_archive.mark_exported(
+            fn, [canonical_url(r["URL"]) if r.get("URL") else r.get("원제목(원문)", "") for r in rows]
+        )
 
-folders_to_fetch = [
-    fn for fn in target_folders
-    if f"cache_{fn}" not in st.session_state
-]
 
-if folders_to_fetch:
-    _fetch_progress = st.progress(0, text="기사 수집 준비 중...")
+def _export_analyzer(folder_name: str):
+    """내보내기 대상 중 캐시에 없는 기사만 AI 분석하는 함수 반환."""
+    def _analyze(articles: list[dict]) -> list[dict]:
+        if not LLM_SCORING_ENABLED:
+            return articles
+        with st.spinner(f"'{folder_name}' AI 분석 중... ({len(articles)}건)"):
+            return analyze_for_export(articles)
+    return _analyze
+
+
+def _article_id(article: dict) -> str:
+    """선택 상태 저장용 기사 식별자."""
+    return article_key(article)
+
+
+def _filtered_articles(folder_name: str) -> list[dict]:
+    """캐시된 상위 기사 중 최소 점수 필터를 통과한 기사."""
+    cached = st.session_state.get(f"cache_{folder_name}") or {}
+    threshold = st.session_state.get(f"filter_{folder_name}", 1)
+    return [a for a in cached.get("top_articles", []) if a.get("score", 0) >= threshold]
+
+
+def _selected_for(folder_name: str) -> list[dict]:
+    """필터를 통과한 기사 중 해제되지 않은 기사 (기본값: 모두 선택)."""
+    deselected = st.session_state.get(f"desel_{folder_name}", set())
+    return [a for a in _filtered_articles(folder_name) if _article_id(a) not in deselected]
+
+
+def _set_all(folder_name: str, selected: bool) -> None:
+    """전체 선택/해제. 편집 표 상태를 초기화하기 위해 버전을 올림."""
+    if selected:
+        st.session_state[f"desel_{folder_name}"] = set()
+    else:
+        st.session_state[f"desel_{folder_name}"] = {_article_id(a) for a in _filtered_articles(folder_name)}
+    st.session_state[f"sel_ver_{folder_name}"] = st.session_state.get(f"sel_ver_{folder_name}", 0) + 1
+
+
+def _score_label(article: dict) -> str:
+    kw_s = article.get("keyword_score", article["score"])
+    llm_s = article.get("llm_score")
+    if llm_s is not None:
+        return f"{article['score']:.1f} (KW:{kw_s:.0f} AI:{llm_s})"
+    return f"{article['score']:.0f}점"
+
+
+def _render_folder(folder_name: str, export_fmt: str) -> None:
+    """선택된 분야 하나만 그림. 기사 목록은 페이지 단위 편집 표로 표시."""
+    criteria = get_criteria_for_folder(folder_name, settings)
+    kw_preview = criteria.get("keywords", [])[:4] + criteria.get("keywords_en", [])[:3]
+
+    # ── 분야별 새로고침 버튼 ──
+    col_info, col_refresh = st.columns([6, 1])
+    with col_info:
+        _cached_preview = st.session_state.get(f"cache_{folder_name}")
+        _date_label = ""
+        if _cached_preview:
+            _fs = _cached_preview.get("fetched_start", "")
+            _fe = _cached_preview.get("fetched_end", "")
+            if _fs and _fe:
+                _date_label = f" | 수집 기간: {_fs} ~ {_fe}"
+        st.info(f"선별 기준: 상위 **{criteria['top_n']}개** | 키워드: {', '.join(kw_preview)}...{_date_label}")
+    with col_refresh:
+        st.write("")  # spacing
+        if st.button("새로고침", key=f"btn_refresh_{folder_name}"):
+            st.session_state["_refresh_folder"] = folder_name
+            st.rerun()
 
-    for _fi, _fn in enumerate(folders_to_fetch):
-        _fetch_progress.progress(
-            _fi / len(folders_to_fetch),
-            text=f"'{_fn}' 수집 중... ({_fi + 1}/{len(folders_to_fetch)})",
+    # ── 캐시에서 데이터 읽기 ──
+    cached = st.session_state.get(f"cache_{folder_name}")
+    if not cached:
+        st.info("기사를 수집 중입니다... 잠시 후 새로고침해 주세요.")
+        return
+
+    top_articles = cached["top_articles"]
+    rss_count = cached["rss_count"]
+    search_count = cached["search_count"]
+    total_count = cached["total_count"]
+    search_queries_used = cached.get("search_queries_used", [])
+
+    if not top_articles:
+        st.info("해당 기간에 기사가 없습니다.")
+        return
+
+    # ── 점수 필터 (동적 — 캐시 불필요) ──
+    scores = [a.get("score", 0) for a in top_articles]
+    slider_max = max(int(max(scores)) + 1, 2)
+
+    col_filter, col_count = st.columns([3, 5])
+    with col_filter:
+        score_threshold = st.slider(
+            "최소 점수 필터",
+            min_value=1,
+            max_value=slider_max,
+            value=1,
+            step=1,
+            key=f"filter_{folder_name}",
+            help="설정한 점수 이상의 기사만 표시합니다.",
         )
 
-        # ── 피드 & 검색어 ──
-        _feed_list = sm.get_feeds(settings, _fn)
-        _search_queries = sm.get_search_queries(settings, _fn)
+    filtered_articles = _filtered_articles(folder_name)
+
+    with col_count:
+        st.write("")  # spacing
+        source_detail = f"RSS {rss_count}건"
+        if search_count > 0:
+            source_detail += f" + 검색 {search_count}건"
+        st.write(
+            f"총 {total_count}건 수집 ({source_detail}) → "
+            f"**{len(top_articles)}건** 스코어링 → "
+            f"**{len(filtered_articles)}건** 표시 (≥{score_threshold}점)"
+        )
 
-        # 검색어 미등록 시 → 스코어링 키워드에서 자동 생성
-        if not _search_queries:
-            _c = sm.get_criteria(settings, _fn)
-            _search_queries = _c.get("keywords", [])[:3] + _c.get("keywords_en", [])[:3]
+    if search_queries_used:
+        st.caption(f"검색 키워드: {', '.join(search_queries_used)}")
+
+    if not filtered_articles:
+        st.info(f"{score_threshold}점 이상 기사가 없습니다. 필터를 낮춰 주세요.")
+        return
+
+    # ── 선택 상태 관리 (해제된 기사 ID 집합 — 기본값은 모두 선택) ──
+    desel_key = f"desel_{folder_name}"
+    deselected = st.session_state.setdefault(desel_key, set())
+
+    col_all, col_none, col_size, col_page = st.columns([1, 1, 2, 2])
+    with col_all:
+        st.button("전체 선택", key=f"all_{folder_name}", on_click=_set_all, args=(folder_name, True))
+    with col_none:
+        st.button("전체 해제", key=f"none_{folder_name}", on_click=_set_all, args=(folder_name, False))
+    with col_size:
+        page_size = st.selectbox("페이지당 기사 수", PAGE_SIZES, key=f"page_size_{folder_name}")
+    page_count = max((len(filtered_articles) + page_size - 1) // page_size, 1)
+    with col_page:
+        page = st.number_input(
+            f"페이지 (총 {page_count})", min_value=1, max_value=page_count, value=1,
+            key=f"page_{folder_name}",
+        )
 
-        if not _feed_list and not _search_queries:
-            st.session_state[f"cache_{_fn}"] = {
-                "top_articles": [], "rss_count": 0,
-                "search_count": 0, "total_count": 0,
-                "search_queries_used": [],
-                "fetched_start": sel_start, "fetched_end": sel_end,
-            }
-            continue
+    # ── 현재 페이지 기사만 편집 표로 표시 ──
+    page_articles = filtered_articles[(page - 1) * page_size: page * page_size]
+    table = [
+        {
+            "선택": _article_id(a) not in deselected,
+            "점수": _score_label(a),
+            "제목": a.get("title_kr") or a.get("title", ""),
+            "원제목": a.get("title", ""),
+            "출처": a.get("source", ""),
+            "발행일": a["published"].strftime("%Y-%m-%d") if a.get("published") else "",
+            "키워드": ", ".join(a.get("matched_keywords", [])[:3]),
+            "링크": a.get("url", ""),
+        }
+        for a in page_articles
+    ]
+    edited = st.data_editor(
+        table,
+        key=f"editor_{folder_name}_{page}_{page_size}_{score_threshold}_{st.session_state.get(f'sel_ver_{folder_name}', 0)}",
+        hide_index=True,
+        disabled=["점수", "제목", "원제목", "출처", "발행일", "키워드", "링크"],
+        column_config={
+            "선택": st.column_config.CheckboxColumn("선택", width="small"),
+            "제목": st.column_config.TextColumn("제목", width="large"),
+            "링크": st.column_config.LinkColumn("링크", display_text="원문"),
+        },
+    )
+    for a, row in zip(page_articles, edited):
+        if row.get("선택"):
+            deselected.discard(_article_id(a))
+        else:
+            deselected.add(_article_id(a))
+
+    # ── 요약 보기 (선택한 기사 하나만) ──
+    with st.expander("요약 보기", expanded=False):
+        preview_idx = st.selectbox(
+            "기사",
+            range(len(page_articles)),
+            format_func=lambda i: (page_articles[i].get("title_kr") or page_articles[i]["title"])[:80],
+            key=f"preview_{folder_name}",
+        )
+        if preview_idx is not None and preview_idx < len(page_articles):
+            article = page_articles[preview_idx]
+            summary_kr = article.get("summary_kr", "")
+            summary_orig = article.get("summary", "")
+            if summary_kr:
+                st.write("**[한글 요약]**")
+                st.write(summary_kr)
+                if summary_orig and summary_kr != summary_orig:
+                    st.caption(f"원문: {summary_orig[:300]}...")
+            else:
+                st.write(summary_orig[:800] if summary_orig else "(본문 없음)")
+            if article.get("url"):
+                st.markdown(f"[원문 링크]({article['url']})")
 
-        # ── RSS 피드 수집 ──
-        _folder_articles: list[dict] = []
-        _rss_count = 0
-        _search_count = 0
+    # ── 선택 상태 저장 ──
+    selected = _selected_for(folder_name)
+    st.session_state["selected_articles"][folder_name] = selected
 
-        if _feed_list:
-            _folder_articles = fetch_folder_articles(
-                _fn, newer_than=sel_newer, older_than=sel_older, feed_list=_feed_list
+    # ── 분야별 내보내기 ──
+    st.divider()
+    sel_count = len(selected)
+    if sel_count > 0:
+        if st.button(f"'{folder_name}' 내보내기 생성하기 ({sel_count}건)", key=f"btn_excel_{folder_name}"):
+            pb = st.progress(0, text="기사 본문 수집 및 번역 중...")
+            def _update_pb(cur, tot):
+                pb.progress(cur / max(tot, 1), text=f"기사 본문 수집/번역 중... ({cur}/{tot}건)")
+            sel_key, rows = export_cache.folder_rows(
+                folder_name, selected, settings_ver,
+                analyze=_export_analyzer(folder_name),
+                progress_callback=_update_pb,
             )
-            _rss_count = len(_folder_articles)
-
-        # ── Google News 키워드 검색 수집 ──
-        if _search_queries:
-            _search_articles = fetch_keyword_search_articles(
-                _search_queries, newer_than=sel_newer, older_than=sel_older
+            pb.progress(1.0, text="완료!")
+            st.session_state[f"excel_{folder_name}"] = rows
+            st.session_state[f"excel_key_{folder_name}"] = sel_key
+            st.session_state[f"excel_count_{folder_name}"] = sel_count
+
+        if st.session_state.get(f"excel_{folder_name}"):
+            st.download_button(
+                label=f"'{folder_name}' {EXPORT_FORMATS[export_fmt]['label']} 다운로드 ({st.session_state.get(f'excel_count_{folder_name}', 0)}건)",
+                data=export_cache.render(
+                    export_fmt,
+                    {folder_name: st.session_state[f"excel_{folder_name}"]},
+                    {folder_name: st.session_state.get(f"excel_key_{folder_name}", "")},
+                ),
+                file_name=f"biohealth_{folder_name}_{datetime.date.today()}.{export_fmt}",
+                mime=EXPORT_FORMATS[export_fmt]["mime"],
+                key=f"dl_excel_{folder_name}",
+                on_click=_mark_exported,
+                args=({folder_name: st.session_state[f"excel_{folder_name}"]},),
             )
-            _existing_titles = {a.get("title", "").strip().lower() for a in _folder_articles}
-            for _art in _search_articles:
-                _title_key = _art.get("title", "").strip().lower()
-                if _title_key and _title_key not in _existing_titles:
-                    _existing_titles.add(_title_key)
-                    _folder_articles.append(_art)
-                    _search_count += 1
-
-        if not _folder_articles:
-            st.session_state[f"cache_{_fn}"] = {
-                "top_articles": [], "rss_count": _rss_count,
-                "search_count": _search_count, "total_count": 0,
-                "search_queries_used": _search_queries,
-                "fetched_start": sel_start, "fetched_end": sel_end,
-            }
+    else:
+        st.info("선택된 기사가 없습니다.")
+
+
+# ═══════════════════════════════════════════════════════════════
+# Phase 1: 데이터 수집 (캐시 없는 분야만 — 날짜/설정 변경은 무시)
+# 수집은 백그라운드 작업으로 실행되고, 페이지는 진행 상태를 조회하여
+# 끝난 분야부터 표시한다. 세션이 끊겨도 작업은 계속된다.
+# ═══════════════════════════════════════════════════════════════
+
+def _collect_folders(target_folders: list[str], sel_start, sel_end, sel_newer: int, sel_older: int) -> list:
+    """캐시 없는 분야의 수집 작업을 제출 · 조회하고, 아직 진행 중인 작업 목록을 반환."""
+    folders_to_fetch = [
+        fn for fn in target_folders
+        if f"cache_{fn}" not in st.session_state
+    ]
+
+    pending_jobs = []
+    for fn in folders_to_fetch:
+        folder_ver = sm.folder_settings_version(settings, fn)
+
+        # 다른 세션이나 배치 실행이 이미 만든 결과가 있으면 그대로 사용
+        shared = result_cache.get(fn, sel_newer, sel_older, folder_ver)
+        if shared is not None:
+            st.session_state[f"cache_{fn}"] = _session_copy(shared)
             continue
 
-        # ── 스코어링 ──
-        _top = select_top_articles(_folder_articles, _fn, settings)
+        job_key = (fn, sel_newer, sel_older, folder_ver)
+        job = job_runner.get(job_key)
+        if job is None:
+            job = job_runner.submit(
+                job_key, fn, collect_folder_cached,
+                fn, copy.deepcopy(settings), sel_newer, sel_older,
+                fetched_start=sel_start, fetched_end=sel_end,
+                cache=result_cache,
+            )
 
-        if not _top:
-            st.session_state[f"cache_{_fn}"] = {
-                "top_articles": [], "rss_count": _rss_count,
-                "search_count": _search_count,
-                "total_count": len(_folder_articles),
-                "search_queries_used": _search_queries,
+        if job.status == jobs.DONE:
+            st.session_state[f"cache_{fn}"] = _session_copy(job.result)
+        elif job.status == jobs.FAILED:
+            st.warning(f"'{fn}' 수집 실패: {job.error}")
+            job_runner.discard(job_key)
+            st.session_state[f"cache_{fn}"] = {
+                "top_articles": [], "rss_count": 0,
+                "search_count": 0, "total_count": 0,
+                "search_queries_used": [],
                 "fetched_start": sel_start, "fetched_end": sel_end,
             }
-            continue
-
-        # ── 번역 (Google Translate) ──
-        for _art in _top:
-            if not _art.get("title_kr"):
-                _art["title_kr"] = _translate_ko(_art.get("title", ""))
-            if not _art.get("summary_kr"):
-                _art["summary_kr"] = _translate_ko((_art.get("summary") or "")[:800])
-
-        # ── LLM 추가 번역 (Gemini 활성 시) ──
-        if LLM_SCORING_ENABLED:
-            try:
-                from llm_scorer import translate_summaries, _daily_quota_exhausted
-                if not _daily_quota_exhausted:
-                    _top = translate_summaries(_top)
-            except Exception:
-                pass
-
-        # ── 캐시 저장 ──
-        st.session_state[f"cache_{_fn}"] = {
-            "top_articles": _top,
-            "rss_count": _rss_count,
-            "search_count": _search_count,
-            "total_count": len(_folder_articles),
-            "search_queries_used": _search_queries,
-            "fetched_start": sel_start, "fetched_end": sel_end,
-        }
+        else:
+            pending_jobs.append(job)
+
+    if pending_jobs:
+        done_count = len(folders_to_fetch) - len(pending_jobs)
+        overall = (done_count + sum(j.progress for j in pending_jobs)) / len(folders_to_fetch)
+        status = ", ".join(f"'{j.folder}' {j.message}" for j in pending_jobs)
+        st.progress(
+            min(overall, 1.0),
+            text=f"백그라운드 수집 중... ({done_count}/{len(folders_to_fetch)}) — {status}",
+        )
+    return pending_jobs
 
-    _fetch_progress.progress(1.0, text="수집 완료!")
 
 # ═══════════════════════════════════════════════════════════════
-# Phase 2: 표시 (캐시에서 읽기 — 빠름)
+# 전체 내보내기
 # ═══════════════════════════════════════════════════════════════
 
-folder_tabs = st.tabs(target_folders)
-
-if "selected_articles" not in st.session_state:
-    st.session_state["selected_articles"] = {}
+def _render_export_all(target_folders: list[str], export_fmt: str) -> None:
+    """전체 분야 선택 합계와 한 파일로 내보내기."""
+    st.divider()
 
-for folder_idx, folder_name in enumerate(target_folders):
-    with folder_tabs[folder_idx]:
-        criteria = get_criteria_for_folder(folder_name, settings)
-        kw_preview = criteria.get("keywords", [])[:4] + criteria.get("keywords_en", [])[:3]
-
-        # ── 분야별 새로고침 버튼 ──
-        col_info, col_refresh = st.columns([6, 1])
-        with col_info:
-            _cached_preview = st.session_state.get(f"cache_{folder_name}")
-            _date_label = ""
-            if _cached_preview:
-                _fs = _cached_preview.get("fetched_start", "")
-                _fe = _cached_preview.get("fetched_end", "")
-                if _fs and _fe:
-                    _date_label = f" | 수집 기간: {_fs} ~ {_fe}"
-            st.info(f"선별 기준: 상위 **{criteria['top_n']}개** | 키워드: {', '.join(kw_preview)}...{_date_label}")
-        with col_refresh:
-            st.write("")  # spacing
-            if st.button("새로고침", key=f"btn_refresh_{folder_name}"):
-                st.session_state["_refresh_folder"] = folder_name
-                st.rerun()
+    total_selected = 0
+    summary_parts = []
+    for fn in target_folders:
+        sel_list = st.session_state.get("selected_articles", {}).get(fn, [])
+        count = len(sel_list)
+        total_selected += count
+        summary_parts.append(f"{fn}: {count}건")
+
+    st.write(f"**전체 선택 합계: {total_selected}건** ({' | '.join(summary_parts)})")
+
+    if total_selected > 0:
+        if st.button(f"전체 분야 내보내기 생성하기 ({total_selected}건)", key="btn_generate_excel_all"):
+            analyzed_sheets = {}
+            sheet_keys = {}
+            progress_bar = st.progress(0, text="내보내기 생성 준비 중...")
+            folder_count = sum(1 for fn in target_folders if st.session_state.get("selected_articles", {}).get(fn))
+
+            done = 0
+            for fn in target_folders:
+                sel_list = st.session_state.get("selected_articles", {}).get(fn, [])
+                if not sel_list:
+                    continue
 
-        # ── 캐시에서 데이터 읽기 ──
-        cached = st.session_state.get(f"cache_{folder_name}")
-        if not cached:
-            st.info("기사를 수집 중입니다... 잠시 후 새로고침해 주세요.")
-            continue
+                progress_bar.progress(
+                    done / max(folder_count, 1),
+                    text=f"'{fn}' 분석 중... ({len(sel_list)}건)",
+                )
 
-        top_articles = cached["top_articles"]
-        rss_count = cached["rss_count"]
-        search_count = cached["search_count"]
-        total_count = cached["total_count"]
-        search_queries_used = cached.get("search_queries_used", [])
+                def _update_all(cur, tot):
+                    progress_bar.progress(
+                        (done + cur / max(tot, 1)) / max(folder_count, 1),
+                        text=f"'{fn}' 기사 본문 수집/번역 중... ({cur}/{tot}건)",
+                    )
+                # 선택이 바뀌지 않은 분야는 캐시에서 그대로, 바뀐 분야도 새 기사만 분석
+                sheet_keys[fn], analyzed_sheets[fn] = export_cache.folder_rows(
+                    fn, sel_list, settings_ver,
+                    analyze=_export_analyzer(fn),
+                    progress_callback=_update_all,
+                )
+                done += 1
+
+            progress_bar.progress(1.0, text="내보내기 생성 완료!")
+
+            if analyzed_sheets:
+                st.session_state["excel_data_all"] = analyzed_sheets
+                st.session_state["excel_keys_all"] = sheet_keys
+                st.session_state["excel_count_all"] = total_selected
+                st.success(f"전체 내보내기 파일이 생성되었습니다. ({total_selected}건)")
+
+        if st.session_state.get("excel_data_all"):
+            st.download_button(
+                label=f"전체 {EXPORT_FORMATS[export_fmt]['label']} 다운로드 ({st.session_state.get('excel_count_all', 0)}건)",
+                data=export_cache.render(
+                    export_fmt,
+                    st.session_state["excel_data_all"],
+                    st.session_state.get("excel_keys_all", {}),
+                ),
+                file_name=f"biohealth_weekly_{datetime.date.today()}.{export_fmt}",
+                mime=EXPORT_FORMATS[export_fmt]["mime"],
+                key="export_all",
+                on_click=_mark_exported,
+                args=(st.session_state["excel_data_all"],),
+            )
+    else:
+        st.info("내보낼 기사가 없습니다. 위에서 기사를 선택해 주세요.")
+
+
+@_fragment
+def _render_selection(active_folder: str, target_folders: list[str], export_fmt: str) -> None:
+    """
+    분야별 선택 현황 · 선택된 분야 · 전체 내보내기.
+    선택/페이지 변경 시 이 영역만 다시 그리되, 선택 합계도 같은 영역에 있어 함께 갱신된다.
+    """
+    # 선택 현황은 선택된 분야의 편집 결과를 반영한 뒤 채움
+    counts_slot = st.empty()
+    if active_folder:
+        _render_folder(active_folder, export_fmt)
+
+    # 보이지 않는 분야의 선택 목록은 위젯 없이 상태에서 계산
+    for fn in target_folders:
+        if fn != active_folder:
+            st.session_state["selected_articles"][fn] = _selected_for(fn)
+
+    counts_slot.caption(" | ".join(
+        f"{fn}: {len(st.session_state['selected_articles'].get(fn, []))}건 선택"
+        if f"cache_{fn}" in st.session_state else f"{fn}: 수집 중"
+        for fn in target_folders
+    ))
+    _render_export_all(target_folders, export_fmt)
+
+
+def _render_select_tab() -> list:
+    """우수 기사 선별 탭. 아직 진행 중인 수집 작업 목록을 반환 (페이지 자동 재조회용)."""
+    st.subheader("우수 기사 자동 선별")
+    if LLM_SCORING_ENABLED:
+        st.caption("각 폴더별 **키워드 + AI 분석** 기준으로 자동 스코어링하여 우수 기사를 선별합니다. 체크박스로 최종 선택 후 엑셀로 내보내세요.")
+    else:
+        st.caption("각 폴더별 **키워드 기준**으로 자동 스코어링하여 우수 기사를 선별합니다. 체크박스로 최종 선택 후 엑셀로 내보내세요.")
+
+    # ── 날짜 범위 (최근 1주일 기본) ──
+    default_start, default_end = default_week()
+
+    col_d1, col_d2, col_btn = st.columns([2, 2, 2])
+    with col_d1:
+        sel_start = st.date_input("시작일", value=default_start, key="sel_start")
+    with col_d2:
+        sel_end = st.date_input("종료일", value=default_end, key="sel_end")
+    with col_btn:
+        st.write("")  # spacing for alignment
+        if st.button("전체 새로 수집", key="btn_refresh"):
+            for key in list(st.session_state.keys()):
+                if key.startswith("cache_"):
+                    del st.session_state[key]
+            for fn in sm.get_folder_names(settings):
+                job_runner.discard_folder(fn)
+            result_cache.invalidate()
+            article_store.reset_coverage()
+            get_feed_scheduler().mark_due()
+            st.session_state["perf_run"] = perf.new_run_id()
+            st.rerun()
 
-        if not top_articles:
-            st.info("해당 기간에 기사가 없습니다.")
-            continue
+    # 날짜는 명시적 새로고침 시에만 반영 — 위젯 변경 자체는 재수집 안 함
+    sel_newer, sel_older = date_window(sel_start, sel_end)
+
+    # 스코어링 대상 폴더 (settings.json 기준)
+    target_folders = sm.get_folder_names(settings)
+
+    # ── 분야별 캐시 무효화 처리 ──
+    # (새로고침 버튼 클릭 시에만 해당 분야 캐시 삭제)
+    folder_refresh_key = st.session_state.pop("_refresh_folder", None)
+    if folder_refresh_key:
+        job_runner.discard_folder(folder_refresh_key)
+        result_cache.invalidate(folder_refresh_key)
+        article_store.reset_coverage(folder_refresh_key)
+        get_feed_scheduler().mark_due(f.get("url") for f in sm.get_feeds(settings, folder_refresh_key))
+        st.session_state.pop(f"cache_{folder_refresh_key}", None)
+        st.session_state.pop(f"excel_{folder_refresh_key}", None)
+        st.session_state.pop(f"excel_key_{folder_refresh_key}", None)
+        st.session_state.pop(f"excel_count_{folder_refresh_key}", None)
+
+    pending_jobs = _collect_folders(target_folders, sel_start, sel_end, sel_newer, sel_older)
+
+    # ── Phase 2: 표시 (캐시에서 읽기 — 빠름) ──
+    export_fmt = st.radio(
+        "내보내기 형식",
+        available_formats(),
+        format_func=lambda f: EXPORT_FORMATS[f]["label"],
+        horizontal=True,
+        key="export_fmt",
+    )
 
-        # ── 점수 필터 (동적 — 캐시 불필요) ──
-        scores = [a.get("score", 0) for a in top_articles]
-        slider_max = max(int(max(scores)) + 1, 2)
-
-        col_filter, col_count = st.columns([3, 5])
-        with col_filter:
-            score_threshold = st.slider(
-                "최소 점수 필터",
-                min_value=1,
-                max_value=slider_max,
-                value=1,
-                step=1,
-                key=f"filter_{folder_name}",
-                help="설정한 점수 이상의 기사만 표시합니다.",
-            )
+    # ── 분야 선택: 보이는 분야 하나만 렌더링 (탭은 모든 분야를 한 번에 그림) ──
+    active_folder = st.radio(
+        "분야",
+        target_folders,
+        horizontal=True,
+        key="active_folder",
+    )
+    _render_selection(active_folder, target_folders, export_fmt)
+    return pending_jobs
 
-        filtered_articles = [a for a in top_articles if a.get("score", 0) >= score_threshold]
-
-        with col_count:
-            st.write("")  # spacing
-            source_detail = f"RSS {rss_count}건"
-            if search_count > 0:
-                source_detail += f" + 검색 {search_count}건"
-            st.write(
-                f"총 {total_count}건 수집 ({source_detail}) → "
-                f"**{len(top_articles)}건** 스코어링 → "
-                f"**{len(filtered_articles)}건** 표시 (≥{score_threshold}점)"
-            )
 
-        if search_queries_used:
-            st.caption(f"검색 키워드: {', '.join(search_queries_used)}")
+# ═══════════════════════════════════════════════════════════════
+# 기사 아카이브 검색
+# ═══════════════════════════════════════════════════════════════
 
-        if not filtered_articles:
-            st.info(f"{score_threshold}점 이상 기사가 없습니다. 필터를 낮춰 주세요.")
-            continue
+def _render_archive_tab(target_folders: list[str]) -> None:
+    """기사 아카이브 검색 탭."""
+    st.subheader("과거 기사 검색")
+    st.caption("지금까지 수집한 모든 기사를 제목 · 요약 · 번역문에서 검색합니다. 따옴표로 묶으면 구절 검색.")
+
+    col_q, col_f = st.columns([3, 1])
+    with col_q:
+        archive_query = st.text_input("검색어", key="archive_query", placeholder='예: Keytruda, 식약처 승인, "breakthrough device"')
+    with col_f:
+        archive_folder = st.selectbox("분야", ["전체"] + target_folders, key="archive_folder")
+
+    col_s, col_e, col_opt = st.columns([1, 1, 2])
+    with col_s:
+        archive_since = st.date_input("발행일 시작", value=None, key="archive_since")
+    with col_e:
+        archive_until = st.date_input("발행일 끝", value=None, key="archive_until")
+    with col_opt:
+        archive_scope = st.radio(
+            "범위", ["전체 수집 기사", "선별 기사", "내보낸 기사"], horizontal=True, key="archive_scope"
+        )
 
-        # ── 체크박스 상태 관리 ──
-        state_key = f"sel_{folder_name}"
-        if state_key not in st.session_state or len(st.session_state[state_key]) != len(filtered_articles):
-            st.session_state[state_key] = [True] * len(filtered_articles)
+    # 검색어나 조건을 넣기 전에는 조회하지 않음 (수집 진행 중 자동 재조회 때마다 검색하지 않도록)
+    query = archive_query.strip()
+    has_filter = archive_folder != "전체" or archive_since or archive_until or archive_scope != "전체 수집 기사"
+    if not query and not has_filter:
+        st.caption("검색어를 입력하거나 분야 · 발행일 · 범위를 지정하면 검색합니다.")
+        return
+
+    started = time.perf_counter()
+    archive_rows = article_archive.search(
+        query,
+        folder=None if archive_folder == "전체" else archive_folder,
+        since=archive_since,
+        until=archive_until,
+        selected_only=archive_scope == "선별 기사",
+        exported_only=archive_scope == "내보낸 기사",
+        limit=200,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    st.caption(f"{len(archive_rows)}건 ({elapsed_ms:.0f} ms)")
+    if archive_rows:
+        st.dataframe(
+            [
+                {
+                    "분야": r["folder"],
+                    "발행일": r["published"].strftime("%Y-%m-%d") if r["published"] else "",
+                    "제목": r["title_kr"] or r["title"],
+                    "일치 부분": r["snippet"],
+                    "출처": r["source"],
+                    "점수": r["score"],
+                    "내보냄": r["export_count"],
+                    "URL": r["url"],
+                }
+                for r in archive_rows
+            ],
+            hide_index=True,
+            column_config={"URL": st.column_config.LinkColumn("URL", display_text="원문")},
+        )
+    elif query:
+        st.info("검색 결과가 없습니다.")
 
-        col_all, col_none, _ = st.columns([1, 1, 6])
-        with col_all:
-            if st.button("전체 선택", key=f"all_{folder_name}"):
-                st.session_state[state_key] = [True] * len(filtered_articles)
-                st.rerun()
-        with col_none:
-            if st.button("전체 해제", key=f"none_{folder_name}"):
-                st.session_state[state_key] = [False] * len(filtered_articles)
-                st.rerun()
 
-        # ── 기사 목록 ──
-        for i, article in enumerate(filtered_articles):
-            col_chk, col_score, col_title = st.columns([0.5, 1, 10])
+tab_select, tab_archive = st.tabs(["우수 기사 선별", "기사 아카이브 검색"])
+with tab_select:
+    _pending_jobs = _render_select_tab()
+with tab_archive:
+    _render_archive_tab(sm.get_folder_names(settings))
 
-            with col_chk:
-                checked = st.checkbox(
-                    "선택",
-                    value=st.session_state[state_key][i] if i < len(st.session_state[state_key]) else True,
-                    key=f"chk_{folder_name}_{i}",
-                    label_visibility="collapsed",
-                )
-                st.session_state[state_key][i] = checked
-
-            with col_score:
-                kw_s = article.get("keyword_score", article["score"])
-                llm_s = article.get("llm_score")
-                if llm_s is not None:
-                    st.write(f"**{article['score']:.1f}** (KW:{kw_s:.0f} AI:{llm_s})")
-                else:
-                    st.write(f"**{article['score']:.0f}점**")
-
-            with col_title:
-                pub_str = ""
-                if article.get("published"):
-                    pub_str = article["published"].strftime(" | %Y-%m-%d")
-                source = article.get("source", "")
-                title_kr = article.get("title_kr", "")
-                matched_kws = article.get("matched_keywords", [])
-                kw_tags = " ".join(f"`{kw}`" for kw in matched_kws[:3]) if matched_kws else ""
-
-                if title_kr and title_kr != article.get("title", ""):
-                    st.write(f"**{title_kr}** — {source}{pub_str}")
-                    st.caption(f"{article['title']}  {kw_tags}")
-                else:
-                    st.write(f"**{article['title']}** — {source}{pub_str}")
-                    if kw_tags:
-                        st.caption(kw_tags)
-
-            with st.expander(f"요약 보기 — {(title_kr or article['title'])[:50]}", expanded=False):
-                summary_kr = article.get("summary_kr", "")
-                summary_orig = article.get("summary", "")
-                if summary_kr:
-                    st.write("**[한글 요약]**")
-                    st.write(summary_kr)
-                    if summary_orig and summary_kr != summary_orig:
-                        st.caption(f"원문: {summary_orig[:300]}...")
-                else:
-                    st.write(summary_orig[:800] if summary_orig else "(본문 없음)")
-                if article.get("url"):
-                    st.markdown(f"[원문 링크]({article['url']})")
-
-        # ── 선택 상태 저장 ──
-        selected = [
-            filtered_articles[i]
-            for i in range(len(filtered_articles))
-            if i < len(st.session_state[state_key]) and st.session_state[state_key][i]
-        ]
-        st.session_state["selected_articles"][folder_name] = selected
-
-        # ── 분야별 엑셀 내보내기 ──
-        st.divider()
-        sel_count = len(selected)
-        if sel_count > 0:
-            if st.button(f"'{folder_name}' 엑셀 생성하기 ({sel_count}건)", key=f"btn_excel_{folder_name}"):
-                export_list = list(selected)
-                if LLM_SCORING_ENABLED:
-                    try:
-                        from llm_scorer import analyze_articles_for_excel, _daily_quota_exhausted
-                        if not _daily_quota_exhausted:
-                            with st.spinner(f"'{folder_name}' AI 분석 중..."):
-                                export_list = analyze_articles_for_excel(export_list)
-                    except Exception:
-                        pass
-
-                pb = st.progress(0, text="기사 본문 수집 및 번역 중...")
-                def _update_pb(cur, tot):
-                    pb.progress(cur / max(tot, 1), text=f"기사 본문 수집/번역 중... ({cur}/{tot}건)")
-                rows = _build_excel_rows(export_list, progress_callback=_update_pb)
-                pb.progress(1.0, text="완료!")
-                df = pd.DataFrame(rows)
-                excel_bytes = dataframes_to_excel({folder_name: df})
-                st.session_state[f"excel_{folder_name}"] = excel_bytes
-                st.session_state[f"excel_count_{folder_name}"] = sel_count
-
-            if st.session_state.get(f"excel_{folder_name}"):
-                st.download_button(
-                    label=f"'{folder_name}' 엑셀 다운로드 ({st.session_state.get(f'excel_count_{folder_name}', 0)}건)",
-                    data=st.session_state[f"excel_{folder_name}"],
-                    file_name=f"biohealth_{folder_name}_{datetime.date.today()}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    key=f"dl_excel_{folder_name}",
-                )
+# ── 사이드바: 단계별 소요 시간 ──
+with st.sidebar:
+    st.divider()
+    with st.expander("성능 측정", expanded=False):
+        perf_current_only = st.checkbox("현재 실행만 보기", value=True, key="perf_current_only")
+        perf_run = st.session_state["perf_run"] if perf_current_only else None
+        perf_rows = perf.recorder.summary(run=perf_run)
+        if perf_rows:
+            st.dataframe(
+                [
+                    {k: v for k, v in r.items() if not (perf_current_only and k == "run")}
+                    for r in perf_rows
+                ],
+                hide_index=True,
+            )
+            st.download_button(
+                "측정 기록 내보내기 (JSONL)",
+                data=perf.recorder.to_jsonl(run=perf_run).encode("utf-8"),
+                file_name=f"perf_{st.session_state['perf_run']}.jsonl",
+                mime="application/x-ndjson",
+                key="perf_export",
+            )
         else:
-            st.info("선택된 기사가 없습니다.")
+            st.caption("아직 측정된 단계가 없습니다.")
+        if st.button("측정 기록 초기화", key="btn_perf_reset"):
+            perf.recorder.reset()
+            st.rerun()
 
-# ═══════════════════════════════════════════════════════════════
-# 전체 엑셀 내보내기
-# ═══════════════════════════════════════════════════════════════
-st.divider()
-
-total_selected = 0
-summary_parts = []
-for fn in target_folders:
-    sel_list = st.session_state.get("selected_articles", {}).get(fn, [])
-    count = len(sel_list)
-    total_selected += count
-    summary_parts.append(f"{fn}: {count}건")
-
-st.write(f"**전체 선택 합계: {total_selected}건** ({' | '.join(summary_parts)})")
-
-if total_selected > 0:
-    if st.button(f"전체 분야 엑셀 생성하기 ({total_selected}건)", key="btn_generate_excel_all"):
-        analyzed_sheets = {}
-        progress_bar = st.progress(0, text="엑셀 생성 준비 중...")
-        folder_count = sum(1 for fn in target_folders if st.session_state.get("selected_articles", {}).get(fn))
-
-        done = 0
-        for fn in target_folders:
-            sel_list = st.session_state.get("selected_articles", {}).get(fn, [])
-            if not sel_list:
-                continue
-
-            export_list = list(sel_list)
-            if LLM_SCORING_ENABLED:
-                try:
-                    from llm_scorer import analyze_articles_for_excel, _daily_quota_exhausted
-                    if not _daily_quota_exhausted:
-                        progress_bar.progress(
-                            done / max(folder_count, 1),
-                            text=f"'{fn}' AI 분석 중... ({len(export_list)}건)",
-                        )
-                        export_list = analyze_articles_for_excel(export_list)
-                except Exception:
-                    pass
-
-            def _update_all(cur, tot):
-                progress_bar.progress(
-                    (done + cur / max(tot, 1)) / max(folder_count, 1),
-                    text=f"'{fn}' 기사 본문 수집/번역 중... ({cur}/{tot}건)",
-                )
-            rows = _build_excel_rows(export_list, progress_callback=_update_all)
-            analyzed_sheets[fn] = pd.DataFrame(rows)
-            done += 1
-
-        progress_bar.progress(1.0, text="엑셀 생성 완료!")
-
-        if analyzed_sheets:
-            excel_bytes = dataframes_to_excel(analyzed_sheets)
-            st.session_state["excel_data_all"] = excel_bytes
-            st.session_state["excel_count_all"] = total_selected
-            st.success(f"전체 엑셀 파일이 생성되었습니다. ({total_selected}건)")
-
-    if st.session_state.get("excel_data_all"):
-        st.download_button(
-            label=f"전체 엑셀 다운로드 ({st.session_state.get('excel_count_all', 0)}건)",
-            data=st.session_state["excel_data_all"],
-            file_name=f"biohealth_weekly_{datetime.date.today()}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            key="export_all",
-        )
-else:
-    st.info("내보낼 기사가 없습니다. 위에서 기사를 선택해 주세요.")
+    # ── 피드 상태 (느리거나 실패하는 피드 정리용) ──
+    with st.expander("피드 상태", expanded=False):
+        feed_names = {
+            f["url"]: (fn, f.get("name", ""))
+            for fn in sm.get_folder_names(settings)
+            for f in sm.get_feeds(settings, fn) if f.get("url")
+        }
+        health_rows = get_feed_health().report(urls=list(feed_names))
+        show_all_feeds = st.checkbox("정상 피드도 보기", value=False, key="feed_health_all")
+        if not show_all_feeds:
+            health_rows = [r for r in health_rows if r["status"] != STATUS_OK]
+
+        def _fmt_ts(ts) -> str:
+            return datetime.datetime.fromtimestamp(ts).strftime("%m-%d %H:%M") if ts else ""
+
+        if health_rows:
+            st.dataframe(
+                [
+                    {
+                        "상태": r["status"],
+                        "분야": feed_names[r["url"]][0],
+                        "피드": feed_names[r["url"]][1] or r["url"],
+                        "연속 실패": r.get("consecutive_failures", 0),
+                        "누적 실패": r.get("failures", 0),
+                        "응답(ms)": r.get("latency_ms"),
+                        "항목 수": r.get("entries"),
+                        "마지막 성공": _fmt_ts(r.get("last_success")),
+                        "재시도": _fmt_ts(r.get("open_until")) if r["status"] == STATUS_OPEN else "",
+                        "최근 오류": r.get("last_error", "") if r.get("consecutive_failures") else "",
+                    }
+                    for r in health_rows
+                ],
+                hide_index=True,
+            )
+            st.caption("차단된 피드는 재시도 시각까지 수집하지 않습니다. 계속 실패하면 'RSS 피드 관리'에서 삭제하세요.")
+        else:
+            st.caption("문제가 있는 피드가 없습니다." if not show_all_feeds else "아직 수집 기록이 없습니다.")
+        if st.button("피드 상태 초기화", key="btn_feed_health_reset"):
+            get_feed_health().reset()
+            st.rerun()
 
+# ── 백그라운드 수집 진행 중이면 잠시 후 다시 조회 ──
+if _pending_jobs:
+    time.sleep(1.5)
+    st.rerun()
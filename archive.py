@@ -0,0 +1,352 @@
+"""과거 기사 아카이브 (SQLite + FTS5 전문 검색).
+
+수집 실행마다 분야의 전체 수집 기사와 선별 기사(점수 · 번역 포함)를 한 번에 기록하고,
+내보내기 여부를 함께 보관한다. 제목 · 요약 · 번역 제목 · 번역 요약에 FTS5 색인을 두어
+특정 약물이나 규제기관에 대한 과거 보도를 바로 찾을 수 있다.
+
+- 같은 분야의 같은 기사(URL, 없으면 제목)는 한 행으로 갱신 (처음/마지막 수집 시각 보존)
+- 새 값이 비어 있으면 기존 점수 · 번역 · 분석 값을 유지
+- FTS 색인은 외부 콘텐츠 테이블 + 트리거로 본 테이블과 동기화
+"""
+
+import datetime
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Optional
+
+from url_canon import article_key
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_PATH = os.path.join(os.path.dirname(__file__), "data", "archive.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    folder TEXT NOT NULL,
+    article_key TEXT NOT NULL,
+    url TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    title_kr TEXT,
+    summary_kr TEXT,
+    source TEXT NOT NULL DEFAULT '',
+    published TEXT,
+    published_ts INTEGER,
+    score REAL,
+    keyword_score REAL,
+    llm_score INTEGER,
+    matched_keywords TEXT,
+    country TEXT,
+    oneliner TEXT,
+    hashtags TEXT,
+    summary_3sent TEXT,
+    selected INTEGER NOT NULL DEFAULT 0,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    last_run TEXT,
+    export_count INTEGER NOT NULL DEFAULT 0,
+    last_exported REAL,
+    UNIQUE (folder, article_key)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_ts);
+CREATE INDEX IF NOT EXISTS idx_articles_folder ON articles (folder, published_ts);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, title_kr, summary_kr,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary, title_kr, summary_kr)
+    VALUES (new.id, new.title, new.summary, new.title_kr, new.summary_kr);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, title_kr, summary_kr)
+    VALUES ('delete', old.id, old.title, old.summary, old.title_kr, old.summary_kr);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE OF title, summary, title_kr, summary_kr ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, summary, title_kr, summary_kr)
+    VALUES ('delete', old.id, old.title, old.summary, old.title_kr, old.summary_kr);
+    INSERT INTO articles_fts (rowid, title, summary, title_kr, summary_kr)
+    VALUES (new.id, new.title, new.summary, new.title_kr, new.summary_kr);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO articles (
+    folder, article_key, url, title, summary, title_kr, summary_kr, source,
+    published, published_ts, score, keyword_score, llm_score, matched_keywords,
+    country, oneliner, hashtags, summary_3sent, selected,
+    first_seen, last_seen, last_run
+) VALUES (
+    :folder, :article_key, :url, :title, :summary, :title_kr, :summary_kr, :source,
+    :published, :published_ts, :score, :keyword_score, :llm_score, :matched_keywords,
+    :country, :oneliner, :hashtags, :summary_3sent, :selected,
+    :now, :now, :run
+)
+ON CONFLICT (folder, article_key) DO UPDATE SET
+    url = excluded.url,
+    title = excluded.title,
+    summary = CASE WHEN excluded.summary != '' THEN excluded.summary ELSE summary END,
+    title_kr = COALESCE(excluded.title_kr, title_kr),
+    summary_kr = COALESCE(excluded.summary_kr, summary_kr),
+    source = CASE WHEN excluded.source != '' THEN excluded.source ELSE source END,
+    published = COALESCE(excluded.published, published),
+    published_ts = COALESCE(excluded.published_ts, published_ts),
+    score = COALESCE(excluded.score, score),
+    keyword_score = COALESCE(excluded.keyword_score, keyword_score),
+    llm_score = COALESCE(excluded.llm_score, llm_score),
+    matched_keywords = COALESCE(excluded.matched_keywords, matched_keywords),
+    country = COALESCE(excluded.country, country),
+    oneliner = COALESCE(excluded.oneliner, oneliner),
+    hashtags = COALESCE(excluded.hashtags, hashtags),
+    summary_3sent = COALESCE(excluded.summary_3sent, summary_3sent),
+    selected = MAX(selected, excluded.selected),
+    last_seen = excluded.last_seen,
+    last_run = excluded.last_run
+"""
+
+_RESULT_COLUMNS = (
+    "folder", "url", "title", "summary", "title_kr", "summary_kr", "source",
+    "published", "score", "keyword_score", "llm_score", "matched_keywords",
+    "country", "oneliner", "hashtags", "summary_3sent", "selected",
+    "first_seen", "last_seen", "export_count", "last_exported",
+)
+
+
+def _blank_to_none(value):
+    return value if value not in ("", None) else None
+
+
+def _to_row(folder_name: str, article, selected: bool, now: float, run_id: str) -> dict:
+    published = article.get("published")
+    published_ts = None
+    if isinstance(published, datetime.datetime):
+        published_ts = int(published.replace(tzinfo=datetime.timezone.utc).timestamp())
+    matched = article.get("matched_keywords")
+    return {
+        "folder": folder_name,
+        "article_key": article_key(article),
+        "url": article.get("url", "") or "",
+        "title": article.get("title", "") or "",
+        "summary": article.get("summary", "") or "",
+        "title_kr": _blank_to_none(article.get("title_kr")),
+        "summary_kr": _blank_to_none(article.get("summary_kr")),
+        "source": article.get("source", "") or "",
+        "published": published.isoformat() if published else None,
+        "published_ts": published_ts,
+        "score": article.get("score"),
+        "keyword_score": article.get("keyword_score"),
+        "llm_score": article.get("llm_score"),
+        "matched_keywords": json.dumps(matched, ensure_ascii=False) if matched else None,
+        "country": _blank_to_none(article.get("country")),
+        "oneliner": _blank_to_none(article.get("oneliner")),
+        "hashtags": _blank_to_none(article.get("hashtags")),
+        "summary_3sent": _blank_to_none(article.get("summary_3sent")),
+        "selected": int(selected),
+        "now": now,
+        "run": run_id,
+    }
+
+
+_TOKEN_RE = re.compile(r"[\w]+", re.UNICODE)
+
+
+def build_match_query(text: str) -> str:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환.
+    따옴표로 묶은 구절은 그대로, 나머지 단어는 접두 검색 (예: 승인 → "승인"* → 승인을 · 승인된)
+    """
+    terms: list[str] = []
+    for phrase in re.findall(r'"([^"]+)"', text):
+        words = _TOKEN_RE.findall(phrase)
+        if words:
+            terms.append('"' + " ".join(words) + '"')
+    rest = re.sub(r'"[^"]*"', " ", text)
+    for word in _TOKEN_RE.findall(rest):
+        terms.append(f'"{word}"*')
+    return " AND ".join(terms)
+
+
+class ArticleArchive:
+    """SQLite 기사 아카이브 (스레드 안전, 호출마다 연결)."""
+
+    def __init__(self, path: str = ARCHIVE_PATH):
+        self.path = path
+        self._write_lock = threading.Lock()
+        self._ready = False
+
+    @contextmanager
+    def _connect(self):
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            if not self._ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                self._ready = True
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ── 기록 ──
+
+    def record_run(
+        self,
+        folder_name: str,
+        fetched: Iterable,
+        selected: Iterable = (),
+        run_id: str = "",
+    ) -> int:
+        """
+        수집 실행 1회 결과를 일괄 기록.
+        fetched: 분야의 전체 수집 기사, selected: 스코어링 · 번역을 거친 선별 기사
+        """
+        now = time.time()
+        rows: dict[str, dict] = {}
+        for art in fetched:
+            row = _to_row(folder_name, art, False, now, run_id)
+            rows[row["article_key"]] = row
+        for art in selected:
+            row = _to_row(folder_name, art, True, now, run_id)
+            rows[row["article_key"]] = row
+        if not rows:
+            return 0
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(_UPSERT, rows.values())
+        return len(rows)
+
+    def mark_exported(self, folder_name: str, keys: Iterable[str]) -> None:
+        """내보낸 기사 표시 (내보내기 횟수 · 마지막 내보낸 시각)."""
+        now = time.time()
+        params = [(now, folder_name, k) for k in keys if k]
+        if not params:
+            return
+        with self._write_lock, self._connect() as conn:
+            conn.executemany(
+                "UPDATE articles SET export_count = export_count + 1, last_exported = ?, selected = 1 "
+                "WHERE folder = ? AND article_key = ?",
+                params,
+            )
+
+    # ── 조회 ──
+
+    def translations(self, folder_name: str, keys: Iterable[str]) -> dict[str, tuple[str, str]]:
+        """이미 번역된 기사의 (title_kr, summary_kr). 설정 변경 후 재선별 시 번역 재사용."""
+        keys = [k for k in keys if k]
+        found: dict[str, tuple[str, str]] = {}
+        with self._connect() as conn:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                rows = conn.execute(
+                    "SELECT article_key, title_kr, summary_kr FROM articles "
+                    f"WHERE folder = ? AND article_key IN ({','.join('?' * len(chunk))}) "
+                    "AND title_kr IS NOT NULL AND summary_kr IS NOT NULL",
+                    [folder_name, *chunk],
+                ).fetchall()
+                for r in rows:
+                    found[r["article_key"]] = (r["title_kr"], r["summary_kr"])
+        return found
+
+    def search(
+        self,
+        query: str = "",
+        folder: Optional[str] = None,
+        since: Optional[datetime.date] = None,
+        until: Optional[datetime.date] = None,
+        selected_only: bool = False,
+        exported_only: bool = False,
+        limit: int = 50,
+    ) -> list[dict]:
+        """
+        전문 검색. 검색어가 있으면 관련도(bm25) 순, 없으면 발행일 최신순.
+        since/until은 발행일(UTC) 기준 포함 범위.
+        """
+        columns = ", ".join(f"a.{c}" for c in _RESULT_COLUMNS)
+        where: list[str] = []
+        params: list = []
+        match = build_match_query(query) if query else ""
+        if match:
+            sql = (
+                f"SELECT {columns}, snippet(articles_fts, -1, '[', ']', '…', 12) AS snippet "
+                "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid"
+            )
+            where.append("articles_fts MATCH ?")
+            params.append(match)
+            order = "bm25(articles_fts, 10.0, 1.0, 10.0, 1.0)"
+        else:
+            sql = f"SELECT {columns}, '' AS snippet FROM articles a"
+            order = "a.published_ts DESC"
+
+        if folder:
+            where.append("a.folder = ?")
+            params.append(folder)
+        if since:
+            where.append("a.published_ts >= ?")
+            params.append(int(datetime.datetime.combine(since, datetime.time.min, datetime.timezone.utc).timestamp()))
+        if until:
+            where.append("a.published_ts <= ?")
+            params.append(int(datetime.datetime.combine(until, datetime.time.max, datetime.timezone.utc).timestamp()))
+        if selected_only:
+            where.append("a.selected = 1")
+        if exported_only:
+            where.append("a.export_count > 0")
+
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        with self._connect() as conn:
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.warning("아카이브 검색 실패 (%s): %s", match, e)
+                return []
+        return [self._row_to_dict(r) for r in rows]
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> dict:
+        result = dict(row)
+        if result.get("published"):
+            result["published"] = datetime.datetime.fromisoformat(result["published"])
+        if result.get("matched_keywords"):
+            result["matched_keywords"] = json.loads(result["matched_keywords"])
+        for key in ("first_seen", "last_seen", "last_exported"):
+            if result.get(key):
+                result[key] = datetime.datetime.fromtimestamp(result[key])
+        return result
+
+    def stats(self) -> dict:
+        """분야별 보관 · 선별 · 내보낸 기사 수."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT folder, COUNT(*) AS total, SUM(selected) AS selected, "
+                "SUM(export_count > 0) AS exported, MIN(published) AS oldest "
+                "FROM articles GROUP BY folder ORDER BY folder"
+            ).fetchall()
+        return {r["folder"]: dict(r) for r in rows}
+
+
+_default_archive: Optional[ArticleArchive] = None
+_default_lock = threading.Lock()
+
+
+def get_archive() -> ArticleArchive:
+    """프로세스 전체에서 공유하는 기본 아카이브 인스턴스."""
+    global _default_archive
+    with _default_lock:
+        if _default_archive is None:
+            _default_archive = ArticleArchive()
+        return _default_archive
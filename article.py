@@ -0,0 +1,153 @@
+"""기사 레코드 타입.
+
+수집 → 스코어링 → 번역 → 분석 단계를 거치는 기사 한 건을 __slots__ 객체로 표현한다.
+기존 코드가 기사를 dict로 다루므로 get / [] / in / keys / copy 등 dict 방식 접근을 그대로 지원하며,
+dict(article)로 일반 dict 변환도 가능하다.
+
+- 출처(source)와 카테고리(categories) 문자열은 sys.intern으로 공유
+- 스코어링 · 번역 · 분석 필드는 값을 넣기 전까지 메모리를 쓰지 않음 (미설정 = 키 없음)
+- 정의되지 않은 키는 보조 dict(_extra)에 보관하며, 필요할 때만 생성
+"""
+
+import sys
+from collections.abc import MutableMapping
+from typing import Iterator
+
+# 기본 필드 (항상 존재)
+CORE_FIELDS = ("title", "url", "source", "published", "summary", "categories")
+
+# 단계별로 추가되는 필드 (설정 전까지는 키 없음)
+SCORE_FIELDS = ("score", "keyword_score", "llm_score", "matched_keywords", "matched_countries")
+TRANSLATION_FIELDS = ("title_kr", "summary_kr")
+ANALYSIS_FIELDS = ("country", "oneliner", "hashtags", "summary_3sent")
+
+FIELDS = CORE_FIELDS + SCORE_FIELDS + TRANSLATION_FIELDS + ANALYSIS_FIELDS
+_FIELD_SET = frozenset(FIELDS)
+_INTERNED_FIELDS = frozenset(("source", "categories"))
+
+
+class Article(MutableMapping):
+    """dict 호환 접근을 지원하는 기사 레코드."""
+
+    __slots__ = FIELDS + ("_extra",)
+
+    def __init__(
+        self,
+        title: str = "",
+        url: str = "",
+        source: str = "",
+        published=None,
+        summary: str = "",
+        categories: str = "",
+        **extra,
+    ):
+        self.title = title
+        self.url = url
+        self.source = sys.intern(source) if source else ""
+        self.published = published
+        self.summary = summary
+        self.categories = sys.intern(categories) if categories else ""
+        self._extra = None
+        for key, value in extra.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data) -> "Article":
+        """dict(또는 Article)에서 새 Article 생성. Article이면 얕은 복사."""
+        if isinstance(data, Article):
+            return data.copy()
+        article = cls()
+        for key, value in data.items():
+            article[key] = value
+        return article
+
+    # ── dict 호환 접근 ──
+
+    def __getitem__(self, key: str):
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value) -> None:
+        if key in _FIELD_SET:
+            if key in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+            return
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+        if not self._extra:
+            self._extra = None
+
+    def __contains__(self, key) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key: str, default=None):
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def keys(self) -> list[str]:
+        keys = [f for f in FIELDS if hasattr(self, f)]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def copy(self) -> "Article":
+        """얕은 복사 (dict.copy와 같은 의미)."""
+        clone = Article.__new__(Article)
+        for f in FIELDS:
+            try:
+                setattr(clone, f, getattr(self, f))
+            except AttributeError:
+                pass
+        clone._extra = dict(self._extra) if self._extra else None
+        return clone
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self.keys()}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Article, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (Article.from_dict, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return f"Article({self.to_dict()!r})"
+
+
+def as_article(data) -> Article:
+    """Article이면 그대로, dict면 Article로 변환."""
+    return data if isinstance(data, Article) else Article.from_dict(data)
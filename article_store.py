@@ -0,0 +1,384 @@
+"""수집 원본 기사 저장소 (분야 · 발행일 단위 파티션).
+
+피드/검색어에서 가져온 모든 기사를 스코어링 전 원본 그대로 보관하고,
+소스(피드 URL 또는 검색어)별로 이미 수집한 시간 구간(coverage)을 기록한다.
+날짜 범위를 넓히거나 옮기면 아직 수집하지 않은 구간이 있는 소스만 다시 가져오고,
+범위를 좁히면 네트워크 없이 저장된 기사로 바로 재스코어링한다.
+
+디렉터리 구조:
+    .cache/articles/<분야 해시>/coverage.json
+    .cache/articles/<분야 해시>/YYYY-MM-DD.jsonl   (발행일 UTC 기준)
+    .cache/articles/<분야 해시>/undated.jsonl       (발행일 없는 기사)
+
+파티션은 추가 전용 로그로, 같은 (소스, 기사) 줄이 여러 번 나오면 마지막 줄이 유효하다.
+덮어쓴 줄이 쌓이면 저장 시점에 파티션을 다시 써서 압축한다.
+"""
+
+import calendar
+import datetime
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import perf
+from article import Article
+from url_canon import article_key
+from utils import dumps_json, loads_json
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR = os.path.join(os.path.dirname(__file__), ".cache", "articles")
+
+# 마지막 수집 후 이 시간 이내면 "지금"까지 수집된 것으로 간주 (오늘 포함 범위의 재수집 빈도)
+FRESHNESS_SECONDS = 30 * 60
+
+# 파티션 줄 수가 유효 기사 수의 이 배를 넘으면 압축 (작은 파티션은 그대로 둠)
+COMPACT_RATIO = 2
+COMPACT_MIN_LINES = 200
+
+UNDATED = "undated"
+SOURCE_FIELD = "_source"
+
+
+def feed_source(url: str) -> str:
+    """RSS 피드 소스 키."""
+    return f"feed:{url}"
+
+
+def search_source(query: str) -> str:
+    """Google News 검색어 소스 키."""
+    return f"search:{query.strip()}"
+
+
+def _folder_dir_name(folder_name: str) -> str:
+    return hashlib.sha1(folder_name.encode("utf-8")).hexdigest()[:12]
+
+
+def _published_ts(article: dict) -> Optional[int]:
+    published = article.get("published")
+    if published is None:
+        return None
+    return int(calendar.timegm(published.timetuple()))
+
+
+def _record_key(article: dict) -> tuple[str, str]:
+    return article.get(SOURCE_FIELD, ""), article_key(article)
+
+
+def _merge_intervals(intervals: list[list[int]]) -> list[list[int]]:
+    merged: list[list[int]] = []
+    for lo, hi in sorted(intervals):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return merged
+
+
+class ArticleStore:
+    """분야별 · 발행일별 원본 기사 저장소 (스레드 안전)."""
+
+    def __init__(self, root: str = STORE_DIR, max_cached_partitions: int = 256):
+        self.root = root
+        self.max_cached_partitions = max_cached_partitions
+        self._lock = threading.RLock()
+        # 경로 → (mtime, 유효 기사, 파일 줄 수 — 손상된 줄이 있으면 None)
+        self._partitions: OrderedDict[str, tuple[float, list[dict], Optional[int]]] = OrderedDict()
+
+    # ── 경로 / 파일 I/O ──
+
+    def _folder_dir(self, folder_name: str) -> str:
+        return os.path.join(self.root, _folder_dir_name(folder_name))
+
+    def _partition_path(self, folder_name: str, day: str) -> str:
+        return os.path.join(self._folder_dir(folder_name), f"{day}.jsonl")
+
+    def _coverage_path(self, folder_name: str) -> str:
+        return os.path.join(self._folder_dir(folder_name), "coverage.json")
+
+    @staticmethod
+    def _atomic_write(path: str, text: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def _read_partition(self, path: str) -> list[dict]:
+        return self._partition_state(path)[0]
+
+    def _partition_state(self, path: str) -> tuple[list[dict], Optional[int]]:
+        """파티션의 유효 기사와 파일 줄 수 (같은 기사는 마지막 줄 기준, 처음 위치 유지)."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return [], 0
+        cached = self._partitions.get(path)
+        if cached is not None and cached[0] == mtime:
+            self._partitions.move_to_end(path)
+            return cached[1], cached[2]
+
+        latest: dict[tuple[str, str], dict] = {}
+        lines: Optional[int] = 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        article = loads_json(line)
+                    except ValueError:
+                        # 중단된 추가 기록 등 — 해당 줄만 버리고 다음 저장 때 다시 씀
+                        logger.warning("기사 저장소 파티션 손상 줄 무시 (%s)", path)
+                        lines = None
+                        continue
+                    latest[_record_key(article)] = article
+                    if lines is not None:
+                        lines += 1
+        except OSError as e:
+            logger.warning("기사 저장소 파티션 읽기 실패 (%s): %s", path, e)
+            return [], 0
+
+        articles = list(latest.values())
+        self._cache_partition(path, mtime, articles, lines)
+        return articles, lines
+
+    def _cache_partition(
+        self, path: str, mtime: float, articles: list[dict], lines: Optional[int]
+    ) -> None:
+        self._partitions[path] = (mtime, articles, lines)
+        self._partitions.move_to_end(path)
+        while len(self._partitions) > self.max_cached_partitions:
+            self._partitions.popitem(last=False)
+
+    def _write_partition(self, path: str, articles: list[dict]) -> None:
+        self._atomic_write(path, "".join(dumps_json(a) + "\n" for a in articles))
+        self._partitions.pop(path, None)
+
+    def _append_partition(
+        self, path: str, records: list[dict], articles: list[dict], lines: int
+    ) -> None:
+        """새 줄만 파티션 끝에 추가하고 캐시를 갱신."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("".join(dumps_json(a) + "\n" for a in records))
+        self._cache_partition(path, os.path.getmtime(path), articles, lines)
+
+    def _read_coverage(self, folder_name: str) -> dict[str, list[list[int]]]:
+        path = self._coverage_path(folder_name)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return loads_json(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_coverage(self, folder_name: str, coverage: dict) -> None:
+        self._atomic_write(self._coverage_path(folder_name), dumps_json(coverage))
+
+    # ── 수집 구간(coverage) ──
+
+    def uncovered_range(
+        self, folder_name: str, source: str, newer_than: int, older_than: int
+    ) -> Optional[tuple[int, int]]:
+        """
+        요청 구간 중 아직 수집하지 않은 부분을 덮는 최소 구간 반환.
+        모두 수집되어 있으면 None.
+        """
+        now = int(time.time())
+        with self._lock:
+            intervals = self._read_coverage(folder_name).get(source, [])
+        # 최근 수집분은 "지금"까지 수집된 것으로 간주
+        effective = [
+            [lo, hi + FRESHNESS_SECONDS if now - hi <= FRESHNESS_SECONDS else hi]
+            for lo, hi in intervals
+        ]
+        target_hi = min(older_than, now)
+        gaps: list[tuple[int, int]] = []
+        cursor = newer_than
+        for lo, hi in _merge_intervals(effective):
+            if hi < cursor:
+                continue
+            if lo > target_hi:
+                break
+            if lo > cursor:
+                gaps.append((cursor, lo - 1))
+            cursor = max(cursor, hi + 1)
+        if cursor <= target_hi:
+            gaps.append((cursor, target_hi))
+        perf.cache_lookup("article_store", not gaps)
+        if not gaps:
+            return None
+        # 마지막 빈 구간이 현재 시점까지 이어지면 요청 범위 끝까지 수집
+        hi = older_than if gaps[-1][1] == target_hi else gaps[-1][1]
+        return gaps[0][0], hi
+
+    def mark_covered(self, folder_name: str, source: str, newer_than: int, older_than: int) -> None:
+        """소스의 [newer_than, older_than] 구간을 수집 완료로 기록 (미래 시점은 제외)."""
+        hi = min(older_than, int(time.time()))
+        if hi < newer_than:
+            return
+        with self._lock:
+            coverage = self._read_coverage(folder_name)
+            intervals = coverage.get(source, []) + [[newer_than, hi]]
+            coverage[source] = _merge_intervals(intervals)
+            self._write_coverage(folder_name, coverage)
+
+    # ── 기사 저장 / 조회 ──
+
+    def add(self, folder_name: str, source: str, articles: Iterable[dict]) -> int:
+        """기사를 발행일 파티션에 저장 (같은 소스의 같은 기사는 덮어씀). 저장 건수 반환."""
+        by_day: dict[str, list[dict]] = {}
+        for art in articles:
+            record = dict(art)
+            record[SOURCE_FIELD] = source
+            published = art.get("published")
+            day = published.date().isoformat() if published else UNDATED
+            by_day.setdefault(day, []).append(record)
+
+        count = 0
+        with self._lock:
+            for day, records in by_day.items():
+                path = self._partition_path(folder_name, day)
+                current, lines = self._partition_state(path)
+                merged = {_record_key(a): a for a in current}
+                appended = []
+                for record in records:
+                    count += 1
+                    key = _record_key(record)
+                    if merged.get(key) == record:
+                        continue  # 재수집된 동일 기사는 다시 기록하지 않음
+                    merged[key] = record
+                    appended.append(record)
+                if not appended:
+                    continue
+                articles = list(merged.values())
+                if lines is None or (
+                    lines + len(appended) >= COMPACT_MIN_LINES
+                    and lines + len(appended) > COMPACT_RATIO * len(articles)
+                ):
+                    self._write_partition(path, articles)
+                else:
+                    self._append_partition(path, appended, articles, lines + len(appended))
+        return count
+
+    def load_by_source(
+        self,
+        folder_name: str,
+        newer_than: Optional[int] = None,
+        older_than: Optional[int] = None,
+        sources: Optional[list[str]] = None,
+    ) -> dict[str, list[dict]]:
+        """
+        구간 안의 저장 기사를 소스별로 묶어 반환 (발행일 없는 기사는 항상 포함).
+        sources를 주면 그 순서대로 키를 채움. 반환 기사는 저장소와 분리된 Article 사본.
+        """
+        grouped: dict[str, list[Article]] = {s: [] for s in sources} if sources is not None else {}
+        folder_dir = self._folder_dir(folder_name)
+        if not os.path.isdir(folder_dir):
+            return grouped
+
+        days = [UNDATED]
+        if newer_than is not None and older_than is not None:
+            day = datetime.datetime.fromtimestamp(newer_than, datetime.timezone.utc).date()
+            last = datetime.datetime.fromtimestamp(older_than, datetime.timezone.utc).date()
+            while day <= last:
+                days.append(day.isoformat())
+                day += datetime.timedelta(days=1)
+        else:
+            days += [
+                name[:-len(".jsonl")] for name in sorted(os.listdir(folder_dir))
+                if name.endswith(".jsonl") and not name.startswith(UNDATED)
+            ]
+
+        with self._lock:
+            for day in days:
+                for art in self._read_partition(self._partition_path(folder_name, day)):
+                    source = art.get(SOURCE_FIELD, "")
+                    if sources is not None and source not in grouped:
+                        continue
+                    ts = _published_ts(art)
+                    if ts is not None:
+                        if newer_than is not None and ts < newer_than:
+                            continue
+                        if older_than is not None and ts > older_than:
+                            continue
+                    record = Article.from_dict(art)
+                    record.pop(SOURCE_FIELD, None)
+                    grouped.setdefault(source, []).append(record)
+        return grouped
+
+    def load(
+        self,
+        folder_name: str,
+        newer_than: Optional[int] = None,
+        older_than: Optional[int] = None,
+        sources: Optional[list[str]] = None,
+    ) -> list[Article]:
+        """구간·소스 조건에 맞는 저장 기사를 하나의 리스트로 반환."""
+        grouped = self.load_by_source(folder_name, newer_than, older_than, sources)
+        return [art for articles in grouped.values() for art in articles]
+
+    def reset_coverage(self, folder_name: Optional[str] = None) -> None:
+        """
+        수집 구간 기록만 삭제 (저장 기사는 유지).
+        다음 수집 때 모든 소스를 다시 가져오되, 피드에서 이미 빠진 과거 기사는 저장소에서 계속 제공.
+        """
+        with self._lock:
+            if folder_name is not None:
+                paths = [self._coverage_path(folder_name)]
+            elif os.path.isdir(self.root):
+                paths = [os.path.join(self.root, d, "coverage.json") for d in os.listdir(self.root)]
+            else:
+                paths = []
+            for path in paths:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def invalidate(self, folder_name: Optional[str] = None, source: Optional[str] = None) -> None:
+        """분야(없으면 전체)의 저장 기사·수집 구간 삭제. source 지정 시 해당 소스만."""
+        with self._lock:
+            if folder_name is None:
+                folder_dirs = [
+                    os.path.join(self.root, d) for d in os.listdir(self.root)
+                ] if os.path.isdir(self.root) else []
+            else:
+                folder_dirs = [self._folder_dir(folder_name)]
+
+            for folder_dir in folder_dirs:
+                if not os.path.isdir(folder_dir):
+                    continue
+                for name in os.listdir(folder_dir):
+                    path = os.path.join(folder_dir, name)
+                    if source is None:
+                        os.remove(path)
+                        self._partitions.pop(path, None)
+                    elif name.endswith(".jsonl"):
+                        kept = [a for a in self._read_partition(path) if a.get(SOURCE_FIELD) != source]
+                        self._write_partition(path, kept)
+                if source is not None and folder_name is not None:
+                    coverage = self._read_coverage(folder_name)
+                    if coverage.pop(source, None) is not None:
+                        self._write_coverage(folder_name, coverage)
+
+
+_default_store: Optional[ArticleStore] = None
+_default_lock = threading.Lock()
+
+
+def get_article_store() -> ArticleStore:
+    """프로세스 전체에서 공유하는 기본 저장소 인스턴스."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = ArticleStore()
+        return _default_store
@@ -0,0 +1,117 @@
+"""기사 본문 수집 및 한국어 번역 헬퍼 모듈.
+
+requests · BeautifulSoup · deep_translator는 무거우므로 처음 사용할 때 불러온다.
+"""
+
+import logging
+import re
+import threading
+
+import limiters
+import perf
+from url_canon import clean_url
+
+logger = logging.getLogger(__name__)
+
+# ── Google Translate 헬퍼 ──
+# GoogleTranslator는 호출마다 요청 파라미터를 인스턴스에 기록하므로 스레드별로 하나씩 사용
+_local = threading.local()
+
+
+def _get_translator():
+    """현재 스레드의 GoogleTranslator 인스턴스 (첫 번역 시 생성)."""
+    translator = getattr(_local, "translator", None)
+    if translator is None:
+        from deep_translator import GoogleTranslator
+        translator = _local.translator = GoogleTranslator(source="auto", target="ko")
+    return translator
+
+
+def translate_ko(text: str, max_len: int = 4500) -> str:
+    """텍스트를 한국어로 번역. 이미 한국어면 그대로 반환."""
+    if not text or not text.strip():
+        return text
+    # 한국어 비율이 높으면 번역 불필요
+    korean_chars = sum(1 for c in text if '\uac00' <= c <= '\ud7a3')
+    if korean_chars / max(len(text), 1) > 0.3:
+        return text
+    with perf.stage("translate") as span:
+        span.items = 1
+        span.bytes = len(text[:max_len].encode("utf-8"))
+        try:
+            with limiters.network():
+                return _get_translator().translate(text[:max_len])
+        except Exception as e:
+            span.error = True
+            logger.warning("번역 실패: %s", e)
+            return text
+
+
+def extract_3_sentences(text: str) -> str:
+    """텍스트에서 최대 3문장을 추출. 문장이 부족하면 있는 만큼 반환."""
+    if not text or not text.strip():
+        return text
+    # 문장 분리: 마침표/느낌표/물음표 + 공백 또는 줄바꿈 기준
+    sentences = re.split(r'(?<=[.!?。])\s+', text.strip())
+    # 빈 문장 제거
+    sentences = [s.strip() for s in sentences if s.strip()]
+    if not sentences:
+        return text
+    result = " ".join(sentences[:3])
+    # 마지막에 마침표가 없으면 추가
+    if result and result[-1] not in ".!?。":
+        result += "."
+    return result
+
+
+def resolve_google_url(url: str) -> str:
+    """Google redirect URL에서 실제 기사 URL을 추출 (추적 파라미터 제거)."""
+    return clean_url(url)
+
+
+def fetch_article_text(url: str, max_chars: int = 3000) -> str:
+    """URL에서 기사 본문 텍스트를 추출 (requests + BeautifulSoup)."""
+    import requests
+    from bs4 import BeautifulSoup
+
+    with perf.stage("article_text") as span:
+        try:
+            resolved_url = resolve_google_url(url)
+            headers = {
+                "User-Agent": (
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+            }
+            with limiters.network():
+                resp = requests.get(resolved_url, headers=headers, timeout=10, allow_redirects=True)
+            resp.raise_for_status()
+            span.items = 1
+            span.bytes = len(resp.content)
+
+            soup = BeautifulSoup(resp.text, "html.parser")
+
+            # 비본문 요소 제거
+            for tag in soup(["script", "style", "nav", "footer", "header", "aside", "form", "iframe"]):
+                tag.decompose()
+
+            # <article> 또는 본문 영역 우선 탐색
+            article_el = soup.find("article") or soup.find(
+                class_=re.compile(r"article|story|content|post-body", re.I)
+            )
+            target = article_el if article_el else soup
+
+            # <p> 태그에서 본문 추출 (짧은 네비게이션 텍스트 제외)
+            paragraphs = target.find_all("p")
+            text_parts = []
+            for p in paragraphs:
+                text = p.get_text(strip=True)
+                if len(text) > 30:
+                    text_parts.append(text)
+
+            full_text = " ".join(text_parts)
+            return full_text[:max_chars] if full_text else ""
+        except Exception:
+            span.error = True
+            return ""
@@ -0,0 +1,221 @@
+"""주간 수집 배치 실행기 (Streamlit 없이 명령줄에서 실행).
+
+수집 → 스코어링 → LLM → 번역 → 내보내기 파이프라인을 분야별로 실행하고,
+결과 파일과 실행 보고서(run_report.json)를 남긴다.
+실행 결과는 공유 결과 캐시에도 저장되므로, 예약 실행 후 대시보드를 열면
+수집 없이 바로 표시된다.
+
+사용 예:
+    python batch_runner.py                              # 이번 주, 전체 분야, xlsx
+    python batch_runner.py --folders 제약 화장품 --workers 2
+    python batch_runner.py --start 2026-10-12 --end 2026-10-18 --formats xlsx csv jsonl
+    python batch_runner.py --no-export                  # 캐시 예열만
+"""
+
+import argparse
+import contextvars
+import datetime
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import http_replay
+import perf
+import settings_manager as sm
+from archive import get_archive
+from article_store import get_article_store
+from collector import collect_folder_cached, date_window, default_week
+from config import COLLECT_MAX_WORKERS
+from feed_scheduler import get_feed_scheduler
+from exporters import EXPORT_FORMATS, analyze_for_export, build_export_rows, write_export
+from result_cache import get_result_cache
+from url_canon import article_key
+
+logger = logging.getLogger("batch_runner")
+
+DEFAULT_OUTPUT_DIR = "output"
+
+
+def _parse_date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD 이어야 합니다: {value}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="바이오헬스 주간동향 배치 수집")
+    parser.add_argument("--folders", nargs="*", help="수집할 분야 (기본: 전체)")
+    parser.add_argument("--start", type=_parse_date, help="시작일 YYYY-MM-DD (기본: 이번 주 월요일)")
+    parser.add_argument("--end", type=_parse_date, help="종료일 YYYY-MM-DD (기본: min(일요일, 오늘))")
+    parser.add_argument(
+        "--workers", type=int, default=COLLECT_MAX_WORKERS,
+        help=f"동시에 수집할 분야 수 (기본: {COLLECT_MAX_WORKERS})",
+    )
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_DIR, help="결과 파일 저장 폴더")
+    parser.add_argument(
+        "--formats", nargs="*", default=["xlsx"], choices=list(EXPORT_FORMATS),
+        help="내보내기 형식 (기본: xlsx)",
+    )
+    parser.add_argument("--no-export", action="store_true", help="수집·캐시 예열만 하고 파일은 만들지 않음")
+    parser.add_argument("--no-analyze", action="store_true", help="내보내기 전 AI 분석 생략")
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="공유 캐시·수집 구간 기록·피드 수집 주기를 무시하고 새로 수집",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="상세 로그 출력")
+    return parser
+
+
+def _collect_one(folder_name: str, settings: dict, newer_than: int, older_than: int, start, end) -> dict:
+    started = time.time()
+    result = collect_folder_cached(
+        folder_name, settings, newer_than, older_than,
+        fetched_start=start, fetched_end=end,
+        progress=lambda fraction, text: logger.debug("[%s] %.0f%% %s", folder_name, fraction * 100, text),
+    )
+    return {"result": result, "seconds": round(time.time() - started, 2)}
+
+
+def run(args: argparse.Namespace) -> dict:
+    """배치 실행 후 실행 보고서 dict 반환."""
+    settings = sm.load_settings()
+    all_folders = sm.get_folder_names(settings)
+    folders = args.folders or all_folders
+    unknown = [f for f in folders if f not in all_folders]
+    if unknown:
+        raise SystemExit(f"알 수 없는 분야: {', '.join(unknown)} (사용 가능: {', '.join(all_folders)})")
+
+    default_start, default_end = default_week()
+    start = args.start or default_start
+    end = args.end or default_end
+    newer_than, older_than = date_window(start, end)
+
+    cache = get_result_cache()
+    if args.refresh:
+        store = get_article_store()
+        for folder_name in folders:
+            cache.invalidate(folder_name)
+            store.reset_coverage(folder_name)
+            get_feed_scheduler().mark_due(f.get("url") for f in sm.get_feeds(settings, folder_name))
+
+    run_id = perf.new_run_id()
+    perf.set_run(run_id)
+
+    report = {
+        "run_id": run_id,
+        "started_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "workers": args.workers,
+        "folders": {},
+        "artifacts": [],
+    }
+    run_started = time.time()
+
+    # ── 1) 분야별 수집 (병렬) ──
+    results: dict[str, dict] = {}
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {
+            pool.submit(
+                contextvars.copy_context().run,
+                _collect_one, fn, settings, newer_than, older_than, start, end,
+            ): fn
+            for fn in folders
+        }
+        for future in as_completed(futures):
+            fn = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                logger.exception("'%s' 수집 실패", fn)
+                report["folders"][fn] = {"status": "failed", "error": str(e)}
+                continue
+            result = outcome["result"]
+            results[fn] = result
+            report["folders"][fn] = {
+                "status": "ok",
+                "seconds": outcome["seconds"],
+                "total_count": result.get("total_count", 0),
+                "rss_count": result.get("rss_count", 0),
+                "search_count": result.get("search_count", 0),
+                "selected_count": len(result.get("top_articles", [])),
+                "search_queries_used": result.get("search_queries_used", []),
+            }
+            logger.info(
+                "'%s' 완료: 수집 %d건 → 선별 %d건 (%.1f초)",
+                fn, result.get("total_count", 0), len(result.get("top_articles", [])), outcome["seconds"],
+            )
+
+    # ── 2) 내보내기 ──
+    if not args.no_export:
+        sheets: dict[str, list[dict]] = {}
+        exported_articles: dict[str, list] = {}
+        for fn in folders:
+            articles = (results.get(fn) or {}).get("top_articles", [])
+            if not articles:
+                continue
+            export_list = [a.copy() for a in articles]
+            if not args.no_analyze:
+                export_list = analyze_for_export(export_list)
+            sheets[fn] = build_export_rows(export_list)
+            exported_articles[fn] = export_list
+
+        if sheets:
+            exported = False
+            os.makedirs(args.output, exist_ok=True)
+            for fmt in args.formats:
+                path = os.path.join(args.output, f"biohealth_weekly_{end.isoformat()}.{fmt}")
+                try:
+                    write_export(fmt, sheets, path)
+                    report["artifacts"].append(path)
+                    exported = True
+                    logger.info("저장: %s", path)
+                except Exception as e:
+                    logger.error("%s 내보내기 실패: %s", fmt, e)
+                    report.setdefault("errors", []).append(f"{fmt}: {e}")
+
+            # AI 분석 결과와 내보내기 여부를 아카이브에 반영
+            if exported:
+                archive = get_archive()
+                for fn, export_list in exported_articles.items():
+                    archive.record_run(fn, [], export_list, run_id)
+                    archive.mark_exported(fn, [article_key(a) for a in export_list])
+
+    report["seconds"] = round(time.time() - run_started, 2)
+    report["timings"] = [
+        {k: v for k, v in row.items() if k != "run"} for row in perf.recorder.summary(run=run_id)
+    ]
+    report["finished_at"] = datetime.datetime.now().isoformat(timespec="seconds")
+    return report
+
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    http_replay.install_from_env()
+
+    report = run(args)
+
+    os.makedirs(args.output, exist_ok=True)
+    report_path = os.path.join(args.output, "run_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    logger.info("실행 보고서: %s", report_path)
+
+    perf_path = os.path.join(args.output, "perf.jsonl")
+    perf.recorder.write_jsonl(perf_path, run=report["run_id"])
+    logger.info("단계별 측정 기록: %s", perf_path)
+
+    failed = [fn for fn, info in report["folders"].items() if info.get("status") != "ok"]
+    return 1 if failed or report.get("errors") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
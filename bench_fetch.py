@@ -0,0 +1,566 @@
+"""RSS · Google News 수집 처리량 벤치마크 (오프라인).
+
+Google Alerts(Atom) · Google News 검색(RSS 2.0) 형식의 합성 피드를 제공하는 로컬 HTTP 서버를 띄우고,
+rss_fetcher의 fetch_folder_articles · fetch_keyword_search_articles를 동시 실행 수별로 측정한다.
+피드 목록은 feeds.py와 "RSS _FEED/*.csv"(cp949)에서, 검색어는 피드 키워드에서 가져온다.
+
+서버 옵션: 피드당 기사 수, 응답 지연(기본 + 무작위 편차), 실패 비율(503), gzip, ETag(304 응답).
+ETag를 켜면 클라이언트도 첫 실행에서 받은 ETag로 이후 반복을 조건부 요청으로 보내 304 경로를 측정한다.
+결과: 호출별 기사 수 · 처리량(articles/sec) · 요청 지연 p50/p95 · 서버 응답 통계.
+--check-parity는 측정 대신 합성 피드와 엔티티 · 형식 예제를 스트리밍 파서(feed_stream)와
+feedparser 경로로 각각 파싱해 결과가 항목별로 같은지 확인한다.
+
+사용 예:
+    python bench_fetch.py                                  # 기본 설정
+    python bench_fetch.py --concurrency 1 4 8 --latency 0.2 --jitter 0.1
+    python bench_fetch.py --entries 50 --failure-rate 0.05 --no-gzip --json output/bench.json
+    python bench_fetch.py --serve --port 8765              # 서버만 실행 (수동 점검용)
+    python bench_fetch.py --check-parity                   # 두 파싱 경로 결과 비교
+"""
+
+import argparse
+import csv
+import email.utils
+import gzip
+import hashlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Optional
+from urllib.parse import parse_qs, quote, urlsplit
+from xml.sax.saxutils import escape
+
+import feed_health
+import limiters
+import rss_fetcher
+import search_cache
+from feeds import RSS_FEEDS
+
+CSV_DIR = os.path.join(os.path.dirname(__file__), "RSS _FEED")
+
+_SOURCES = (
+    ("Reuters", "reuters.com"), ("FiercePharma", "fiercepharma.com"), ("STAT", "statnews.com"),
+    ("BBC", "bbc.co.uk"), ("The Star", "thestar.com.my"), ("Nikkei Asia", "asia.nikkei.com"),
+    ("연합뉴스", "yna.co.kr"), ("Endpoints News", "endpts.com"), ("MedTech Dive", "medtechdive.com"),
+)
+_PHRASES = (
+    "FDA approval", "clinical trial results", "regulatory update", "market expansion",
+    "partnership agreement", "new drug application", "medical device clearance",
+    "digital health investment", "telemedicine policy", "cosmetics regulation",
+)
+
+
+# ── 피드 목록 (feeds.py + CSV) ──────────────────────────────
+
+def _read_csv_feeds(path: str) -> tuple[str, list[dict]]:
+    """CSV 한 개에서 (분야 이름, [{name, url}]) 추출. 첫 줄이 분야, "키워드,RSS 링크" 이후가 피드."""
+    with open(path, "r", encoding="cp949", newline="") as f:
+        rows = [row for row in csv.reader(f)]
+    folder = rows[0][0].strip() if rows and rows[0] else os.path.splitext(os.path.basename(path))[0]
+    feeds = []
+    for row in rows[1:]:
+        if len(row) >= 2 and row[1].strip().startswith("http"):
+            feeds.append({"name": row[0].strip(), "url": row[1].strip()})
+    return folder, feeds
+
+
+def load_seed_feeds(csv_dir: str = CSV_DIR) -> dict[str, list[dict]]:
+    """feeds.py와 CSV 피드 목록을 분야별로 합침 (URL 기준 중복 제거)."""
+    merged: dict[str, dict[str, dict]] = {}
+    for folder, feeds in RSS_FEEDS.items():
+        for feed in feeds:
+            merged.setdefault(folder, {}).setdefault(feed["url"], feed)
+    if os.path.isdir(csv_dir):
+        for name in sorted(os.listdir(csv_dir)):
+            if not name.lower().endswith(".csv"):
+                continue
+            try:
+                folder, feeds = _read_csv_feeds(os.path.join(csv_dir, name))
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"CSV 읽기 실패 ({name}): {e}", file=sys.stderr)
+                continue
+            for feed in feeds:
+                merged.setdefault(folder, {}).setdefault(feed["url"], feed)
+    return {folder: list(feeds.values()) for folder, feeds in merged.items()}
+
+
+def _local_url(url: str, base: str) -> str:
+    """피드 URL의 스킴 · 호스트를 로컬 서버 주소로 교체 (경로 · 쿼리 유지)."""
+    parts = urlsplit(url)
+    return f"{base}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+
+# ── 합성 피드 서버 ──────────────────────────────────────────
+
+class ServerOptions:
+    """합성 피드 서버 설정."""
+
+    def __init__(
+        self,
+        entries: int = 20,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        use_gzip: bool = True,
+        use_etag: bool = True,
+        days: int = 7,
+        seed: int = 42,
+    ):
+        self.entries = entries
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.use_gzip = use_gzip
+        self.use_etag = use_etag
+        self.days = days
+        self.seed = seed
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _entries(path: str, options: ServerOptions, now: float) -> list[dict]:
+    """경로별로 항상 같은 합성 기사 목록 (발행일은 최근 days일에 고르게 분포, 최신순)."""
+    rng = random.Random(f"{options.seed}:{path}")
+    items = []
+    span = options.days * 86400
+    for i in range(options.entries):
+        source, domain = rng.choice(_SOURCES)
+        phrase = rng.choice(_PHRASES)
+        slug = _digest(f"{path}:{i}")[:12]
+        items.append({
+            "title": f"{phrase.capitalize()} reported by {source} ({slug[:6]})",
+            "source": source,
+            "url": f"https://www.{domain}/news/{slug}",
+            "published": now - span * (i + rng.random()) / max(options.entries, 1),
+            "summary": (
+                f"<b>{phrase}</b> — {source} covers the latest {phrase} affecting the global "
+                f"biohealth industry, including pharmaceutical and medical device companies ({slug})."
+            ),
+        })
+    return items
+
+
+def _alerts_feed(path: str, options: ServerOptions, now: float) -> str:
+    """Google Alerts 형식 (Atom, 링크는 google.com/url 리디렉션)."""
+    entries = []
+    for item in _entries(path, options, now):
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(item["published"]))
+        link = f"https://www.google.com/url?rct=j&sa=t&url={quote(item['url'], safe='')}&ct=ga&cd=CAIyGg"
+        entries.append(
+            f"<entry><id>tag:google.com,2013:googlealerts/feed:{_digest(item['url'])}</id>"
+            f"<title type=\"html\">{escape(item['title'])} - {escape(item['source'])}</title>"
+            f"<link href=\"{escape(link)}\"/>"
+            f"<published>{stamp}</published><updated>{stamp}</updated>"
+            f"<content type=\"html\">{escape(item['summary'])}</content>"
+            f"<author><name></name></author></entry>"
+        )
+    return (
+        "<?xml version=\"1.0\" encoding=\"utf-8\"?>"
+        "<feed xmlns=\"http://www.w3.org/2005/Atom\" xmlns:idx=\"urn:atom-extension:indexing\">"
+        f"<id>tag:google.com,2005:reader/user/00000000000000000000/state/com.google/alerts/{_digest(path)}</id>"
+        "<title>Google 알리미</title>"
+        f"<updated>{time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now))}</updated>"
+        + "".join(entries) + "</feed>"
+    )
+
+
+def _news_feed(path: str, query: str, options: ServerOptions, now: float) -> str:
+    """Google News 검색 형식 (RSS 2.0, 제목 끝에 " - 언론사", <source> 요소)."""
+    items = []
+    for item in _entries(f"{path}?{query}", options, now):
+        article_id = _digest(item["url"])
+        items.append(
+            f"<item><title>{escape(item['title'])} - {escape(item['source'])}</title>"
+            f"<link>https://news.google.com/rss/articles/CBMi{article_id}?oc=5</link>"
+            f"<guid isPermaLink=\"false\">CBMi{article_id}</guid>"
+            f"<pubDate>{email.utils.formatdate(item['published'], usegmt=True)}</pubDate>"
+            f"<description>{escape(item['summary'])}</description>"
+            f"<source url=\"https://{urlsplit(item['url']).hostname}\">{escape(item['source'])}</source></item>"
+        )
+    return (
+        "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+        "<rss version=\"2.0\" xmlns:media=\"http://search.yahoo.com/mrss/\"><channel>"
+        f"<title>\"{escape(query)}\" - Google 뉴스</title><link>https://news.google.com/</link>"
+        + "".join(items) + "</channel></rss>"
+    )
+
+
+class FeedServer:
+    """합성 Google Alerts / Google News RSS를 제공하는 로컬 HTTP 서버 (별도 스레드)."""
+
+    def __init__(self, options: ServerOptions, host: str = "127.0.0.1", port: int = 0):
+        self.options = options
+        self.stats = {"requests": 0, "ok": 0, "not_modified": 0, "failed": 0, "gzip": 0, "bytes": 0}
+        self._stats_lock = threading.Lock()
+        self._rng = random.Random(options.seed)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, **deltas) -> None:
+        with self._stats_lock:
+            for key, value in deltas.items():
+                self.stats[key] += value
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                opts = server.options
+                server._count(requests=1)
+                with server._stats_lock:
+                    delay = opts.latency + server._rng.uniform(0, opts.jitter)
+                    fail = server._rng.random() < opts.failure_rate
+                if delay > 0:
+                    time.sleep(delay)
+                if fail:
+                    server._count(failed=1)
+                    self._send(503, b"unavailable", "text/plain")
+                    return
+
+                parts = urlsplit(self.path)
+                now = time.time() // 3600 * 3600  # 한 시간 동안 같은 내용 (ETag 재사용)
+                if parts.path.startswith("/rss/search"):
+                    query = parse_qs(parts.query).get("q", [""])[0]
+                    body, ctype = _news_feed(parts.path, query, opts, now), "application/rss+xml"
+                elif parts.path.startswith("/alerts/feeds/"):
+                    body, ctype = _alerts_feed(parts.path, opts, now), "application/atom+xml"
+                else:
+                    self._send(404, b"not found", "text/plain")
+                    return
+
+                data = body.encode("utf-8")
+                etag = '"' + hashlib.sha1(data).hexdigest()[:16] + '"'
+                if opts.use_etag and self.headers.get("If-None-Match") == etag:
+                    server._count(not_modified=1)
+                    self._send(304, b"", ctype, {"ETag": etag})
+                    return
+                headers = {"ETag": etag} if opts.use_etag else {}
+                if opts.use_gzip and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                    data = gzip.compress(data)
+                    headers["Content-Encoding"] = "gzip"
+                    server._count(gzip=1)
+                server._count(ok=1, bytes=len(data))
+                self._send(200, data, f"{ctype}; charset=utf-8", headers)
+
+            def _send(self, status: int, data: bytes, ctype: str, headers: Optional[dict] = None):
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                if data:
+                    self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "FeedServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+
+# ── 측정 ───────────────────────────────────────────────────
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+def _configure_concurrency(workers: int, news_interval: float) -> None:
+    """rss_fetcher 동시 실행 수와 공유 제한기를 벤치마크 설정으로 교체."""
+    rss_fetcher.FETCH_MAX_WORKERS = workers
+    limiters.network = limiters.Limiter("network", max_concurrent=workers)
+    limiters.google_news = limiters.Limiter(
+        "google_news", max_concurrent=workers, min_interval=news_interval
+    )
+
+
+class _RequestTimer:
+    """
+    rss_fetcher._download 호출별 지연 기록 (피드 · 검색 요청 단위 p50/p95).
+    conditional이면 URL별 ETag를 기억해 다음 요청에 If-None-Match를 보내고,
+    304 응답이면 이전 200 응답을 그대로 돌려준다 (HTTP 캐시처럼 조건부 요청 경로 측정).
+    """
+
+    def __init__(self, conditional: bool = False):
+        self.samples: list[float] = []
+        self.conditional = conditional
+        self._lock = threading.Lock()
+        self._original = rss_fetcher._download
+        self._responses: dict[str, object] = {}
+
+    def _conditional_download(self, feed_url: str):
+        with self._lock:
+            cached = self._responses.get(feed_url)
+        etag = cached.headers.get("ETag") if cached is not None else None
+        with limiters.network():
+            resp = rss_fetcher._session().get(
+                feed_url, timeout=rss_fetcher.FEED_TIMEOUT,
+                headers={"If-None-Match": etag} if etag else None,
+            )
+        if resp.status_code == 304 and cached is not None:
+            return cached
+        resp.raise_for_status()
+        if resp.headers.get("ETag"):
+            with self._lock:
+                self._responses[feed_url] = resp
+        return resp
+
+    def __enter__(self):
+        original = self._conditional_download if self.conditional else self._original
+
+        def timed_fetch(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.samples.append(time.perf_counter() - started)
+
+        rss_fetcher._download = timed_fetch
+        return self
+
+    def __exit__(self, *exc):
+        rss_fetcher._download = self._original
+
+
+def run_benchmark(
+    server: FeedServer,
+    concurrency: list[int],
+    repeat: int = 3,
+    news_interval: float = 0.0,
+    folders: Optional[list[str]] = None,
+    queries_per_folder: int = 3,
+    conditional: bool = False,
+) -> list[dict]:
+    """
+    동시 실행 수별로 두 수집 함수를 repeat회 실행하여 결과 행 목록 반환.
+    conditional이면 첫 실행에서 받은 ETag로 이후 반복을 조건부 요청(If-None-Match)으로 보낸다.
+    """
+    seed = load_seed_feeds()
+    if folders:
+        seed = {f: seed[f] for f in folders if f in seed}
+    feed_lists = {
+        folder: [{"name": f["name"], "url": _local_url(f["url"], server.base_url)} for f in feeds]
+        for folder, feeds in seed.items()
+    }
+    queries = [f["name"] for feeds in seed.values() for f in feeds[:queries_per_folder]]
+
+    rss_fetcher.GOOGLE_NEWS_BASE_URL = server.base_url
+    now = int(time.time())
+    newer_than = now - server.options.days * 86400
+
+    targets = {
+        "fetch_folder_articles": lambda: [
+            a for folder, feeds in feed_lists.items()
+            for a in rss_fetcher.fetch_folder_articles(folder, newer_than, now, feed_list=feeds)
+        ],
+        "fetch_keyword_search_articles": lambda: rss_fetcher.fetch_keyword_search_articles(
+            queries, newer_than, now
+        ),
+    }
+
+    # 합성 피드의 실패가 실제 피드 상태 기록에 섞이거나 차단기가 측정을 건너뛰지 않도록 분리
+    health_dir = tempfile.mkdtemp(prefix="bench_fetch_")
+    rows = []
+    for workers in concurrency:
+        _configure_concurrency(workers, news_interval)
+        for name, target in targets.items():
+            server.reset_stats()
+            feed_health._default_health = feed_health.FeedHealth(
+                os.path.join(health_dir, f"{name}_{workers}.json")
+            )
+            wall: list[float] = []
+            articles = 0
+            with _RequestTimer(conditional) as timer:
+                for _ in range(max(repeat, 1)):
+                    search_cache.get_search_cache().clear()  # 반복마다 실제 요청 측정
+                    started = time.perf_counter()
+                    articles = len(target())
+                    wall.append(time.perf_counter() - started)
+            best = min(wall)
+            rows.append({
+                "target": name,
+                "concurrency": workers,
+                "conditional": conditional,
+                "requests": len(timer.samples) // max(repeat, 1),
+                "articles": articles,
+                "wall_s": round(best, 3),
+                "articles_per_s": round(articles / best, 1) if best > 0 else 0.0,
+                "p50_ms": round(_percentile(timer.samples, 50) * 1000, 1),
+                "p95_ms": round(_percentile(timer.samples, 95) * 1000, 1),
+                "server": dict(server.stats),
+            })
+    return rows
+
+
+# ── 파싱 경로 일치 확인 ──────────────────────────────────────
+
+# 합성 피드에 없는 형식: Google Alerts식 엔티티(&#39; · &amp;), Atom text · xhtml, RSS 카테고리
+_PARITY_FIXTURES = {
+    "alerts_entities": (
+        "<?xml version=\"1.0\" encoding=\"utf-8\"?><feed xmlns=\"http://www.w3.org/2005/Atom\">"
+        "<id>parity</id><title>Google 알리미</title>"
+        "<entry><id>1</id><title type=\"html\">&lt;b&gt;Pfizer&lt;/b&gt;&amp;#39;s drug &amp;amp; more - Reuters</title>"
+        "<link href=\"https://www.google.com/url?rct=j&amp;url=https%3A%2F%2Fwww.reuters.com%2Fa&amp;ct=ga\"/>"
+        "<published>2026-10-18T10:00:00Z</published><updated>2026-10-18T10:00:00Z</updated>"
+        "<content type=\"html\">R&amp;amp;D &amp;quot;pipeline&amp;quot; &lt;b&gt;update&lt;/b&gt;&amp;nbsp;&amp;lt;FDA&amp;gt;</content>"
+        "</entry></feed>"
+    ),
+    "atom_text_xhtml": (
+        "<?xml version=\"1.0\" encoding=\"utf-8\"?><feed xmlns=\"http://www.w3.org/2005/Atom\">"
+        "<id>parity</id><title>t</title>"
+        "<entry><id>2</id><title>AT&amp;amp;T &lt;tag&gt; &amp; co</title><link href=\"https://ex.com/b\"/>"
+        "<updated>2026-10-17T09:30:00+09:00</updated>"
+        "<summary type=\"xhtml\"><div xmlns=\"http://www.w3.org/1999/xhtml\">X &amp;amp; <b>Y</b></div></summary>"
+        "<category term=\"pharma\"/></entry></feed>"
+    ),
+    "rss_entities": (
+        "<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>t</title>"
+        "<item><title>Q&amp;amp;A &amp;#39;hi&amp;#39; &lt;b&gt;t&lt;/b&gt; - STAT</title><link>https://ex.com/c</link>"
+        "<pubDate>Sun, 18 Oct 2026 10:00:00 GMT</pubDate>"
+        "<description>D &amp;amp; E &lt;p&gt;para&lt;/p&gt;</description><category>biotech</category></item>"
+        "</channel></rss>"
+    ),
+}
+_PARITY_FIELDS = ("title", "url", "source", "published", "summary", "categories")
+
+
+def check_parity(options: ServerOptions) -> list[str]:
+    """
+    같은 피드를 스트리밍 파서와 feedparser 경로로 파싱해 다른 값 목록 반환 (빈 목록이면 일치).
+    날짜 범위 없이 전체 항목을 비교한다.
+    """
+    now = time.time()
+    docs = {
+        "alerts": _alerts_feed("/alerts/feeds/parity", options, now),
+        "news": _news_feed("/rss/search", "q=parity", options, now),
+        **_PARITY_FIXTURES,
+    }
+    problems = []
+    for name, doc in docs.items():
+        resp = SimpleNamespace(
+            content=doc.encode("utf-8"), url="https://example.com/feed",
+            headers={"Content-Type": "application/xml; charset=utf-8"},
+        )
+        streamed = rss_fetcher._parse_streaming(resp.content, resp.url, None, None, None, False)
+        parsed = rss_fetcher._parse_feedparser(resp, None, None, None)
+        if len(streamed) != len(parsed):
+            problems.append(f"{name}: 항목 수 {len(streamed)} != {len(parsed)}")
+        for i, (a, b) in enumerate(zip(streamed, parsed)):
+            for field in _PARITY_FIELDS:
+                if a.get(field) != b.get(field):
+                    problems.append(f"{name}[{i}].{field}: {a.get(field)!r} != {b.get(field)!r}")
+    return problems
+
+
+def _print_rows(rows: list[dict]) -> None:
+    header = f"{'target':32} {'conc':>4} {'reqs':>5} {'articles':>8} {'wall_s':>7} {'art/s':>8} {'p50_ms':>7} {'p95_ms':>7}  server"
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        s = r["server"]
+        print(
+            f"{r['target']:32} {r['concurrency']:>4} {r['requests']:>5} {r['articles']:>8} "
+            f"{r['wall_s']:>7.3f} {r['articles_per_s']:>8.1f} {r['p50_ms']:>7.1f} {r['p95_ms']:>7.1f}  "
+            f"200={s['ok']} 304={s['not_modified']} 503={s['failed']} gzip={s['gzip']}"
+        )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="RSS · Google News 수집 처리량 벤치마크 (로컬 합성 피드)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8], help="측정할 동시 실행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="설정별 반복 횟수 (가장 빠른 실행 기준)")
+    parser.add_argument("--entries", type=int, default=20, help="피드당 기사 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 무작위 편차 최대값 (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--no-gzip", action="store_true", help="gzip 압축 응답 끔")
+    parser.add_argument("--no-etag", action="store_true",
+                        help="ETag · 304 응답과 반복 실행의 조건부 요청(If-None-Match) 끔")
+    parser.add_argument("--news-interval", type=float, default=0.0,
+                        help="Google News 호출 간 최소 간격 (초, 운영 설정 포함 측정 시 0.5)")
+    parser.add_argument("--folders", nargs="*", help="측정할 분야 (기본: 전체)")
+    parser.add_argument("--seed", type=int, default=42, help="합성 데이터 시드")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--serve", action="store_true", help="측정 없이 서버만 실행")
+    parser.add_argument("--check-parity", action="store_true", help="측정 없이 두 파싱 경로 결과만 비교")
+    parser.add_argument("--port", type=int, default=0, help="서버 포트 (기본: 임의)")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
+    options = ServerOptions(
+        entries=args.entries, latency=args.latency, jitter=args.jitter,
+        failure_rate=args.failure_rate, use_gzip=not args.no_gzip,
+        use_etag=not args.no_etag, seed=args.seed,
+    )
+    if args.check_parity:
+        problems = check_parity(options)
+        for problem in problems:
+            print(problem)
+        print(f"파싱 경로 불일치 {len(problems)}건" if problems else "파싱 경로 일치")
+        return 1 if problems else 0
+
+    server = FeedServer(options, port=args.port).start()
+    try:
+        if args.serve:
+            print(f"합성 피드 서버: {server.base_url}  (Ctrl+C로 종료)")
+            print(f"  Alerts 예: {server.base_url}/alerts/feeds/1/2")
+            print(f"  News 예:   {server.base_url}/rss/search?q=FDA&hl=en&gl=US&ceid=US:en")
+            while True:
+                time.sleep(3600)
+        rows = run_benchmark(
+            server, args.concurrency, args.repeat, args.news_interval, args.folders,
+            conditional=options.use_etag,
+        )
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        server.stop()
+
+    _print_rows(rows)
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"options": vars(options), "results": rows}, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
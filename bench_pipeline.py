@@ -0,0 +1,271 @@
+"""수집 → 스코어링 → 번역 → 내보내기 전체 파이프라인 벤치마크 (HTTP 기록/재생).
+
+한 번 실제 네트워크로 실행하면서 모든 외부 요청을 카세트에 기록해 두고(--record),
+이후에는 카세트를 재생하여(--cassette) 네트워크 없이 같은 입력으로 반복 측정한다.
+매 실행은 빈 기사 저장소 · 아카이브 · 스코어링 캐시로 시작하므로 항상 콜드 실행이며,
+단계별 소요 시간은 perf 계측(rss.fetch, score.keyword, translate, article_text, export.xlsx 등)으로 집계한다.
+
+카세트 메타데이터에 기록 당시 설정 · 날짜 범위 · LLM 사용 여부가 들어 있어 재생 시 그대로 사용한다.
+재생 시 Gemini(7초) · Google News(0.5초) 호출 간격은 적용하지 않는다
+(--simulate-latency 시 기록된 응답 시간만 재현).
+
+사용 예:
+    python bench_pipeline.py --record cassettes/week.jsonl                 # 이번 주 전체 분야 기록
+    python bench_pipeline.py --record cassettes/w.jsonl --start 2026-10-12 --end 2026-10-18
+    python bench_pipeline.py --cassette cassettes/week.jsonl --repeat 3 --json output/bench.json
+    python bench_pipeline.py --cassette cassettes/week.jsonl --baseline output/bench.json  # 회귀 점검
+"""
+
+import argparse
+import contextvars
+import datetime
+import io
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import archive
+import collector
+import exporters
+import feed_health
+import feed_scheduler
+import http_replay
+import limiters
+import llm_scorer
+import perf
+import rss_fetcher
+import scorer
+import search_cache
+import settings_manager as sm
+from article_store import ArticleStore
+from config import COLLECT_MAX_WORKERS, LLM_MIN_CALL_INTERVAL, LLM_SCORING_ENABLED
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식은 YYYY-MM-DD 이어야 합니다: {value}")
+
+
+def _set_llm(enabled: bool, replaying: bool) -> None:
+    """LLM 사용 여부를 기록 당시와 맞춤. 재생 시에는 호출 간격 대기 없이 카세트 응답 사용."""
+    for module in (collector, scorer, exporters):
+        module.LLM_SCORING_ENABLED = enabled
+    llm_scorer._daily_quota_exhausted = False
+    if enabled and replaying:
+        if not llm_scorer.GEMINI_API_KEY:
+            llm_scorer.GEMINI_API_KEY = "replay"  # 클라이언트 생성용 (요청은 카세트에서 응답)
+        limiters.llm = limiters.Limiter("llm", max_concurrent=2, wait_stage="llm.rate_wait")
+    else:
+        limiters.llm = limiters.Limiter(
+            "llm", max_concurrent=2, min_interval=LLM_MIN_CALL_INTERVAL, wait_stage="llm.rate_wait"
+        )
+
+
+def _fresh_state(workdir: str) -> ArticleStore:
+    """빈 저장소 · 아카이브 · 스코어링 · 검색 결과 캐시 · 피드 수집 주기 · 피드 상태 (매 실행 콜드 스타트)."""
+    archive._default_archive = archive.ArticleArchive(os.path.join(workdir, "archive.sqlite3"))
+    feed_scheduler._default_scheduler = feed_scheduler.FeedScheduler(os.path.join(workdir, "feed_schedule.json"))
+    feed_health._default_health = feed_health.FeedHealth(os.path.join(workdir, "feed_health.json"))
+    scorer._default_scoring_cache = scorer.ScoringCache()
+    search_cache._default_cache = search_cache.SearchCache()
+    return ArticleStore(root=os.path.join(workdir, "articles"))
+
+
+def _run_folder(folder_name: str, settings: dict, window: dict, store: ArticleStore) -> dict:
+    """분야 하나: 수집 · 스코어링 · 번역 → 내보내기 분석 · 행 생성 · xlsx."""
+    result = collector.collect_folder(
+        folder_name, settings, window["newer_than"], window["older_than"],
+        fetched_start=window["start"], fetched_end=window["end"], store=store,
+    )
+    top = result["top_articles"]
+    with perf.folder_scope(folder_name):
+        analyzed = exporters.analyze_for_export(top)
+        with perf.stage("export.rows") as span:
+            rows = exporters.build_export_rows(analyzed)
+            span.items = len(rows)
+        exporters.write_export("xlsx", {folder_name: rows}, io.BytesIO())
+    return {
+        "rss_count": result["rss_count"],
+        "search_count": result["search_count"],
+        "total_count": result["total_count"],
+        "selected": len(top),
+    }
+
+
+def _stage_totals(run_id: str) -> list[dict]:
+    """실행 하나의 분야별 측정값을 단계별로 합산."""
+    totals: dict[str, dict] = {}
+    for row in perf.recorder.summary(run=run_id):
+        stat = totals.setdefault(row["stage"], {
+            "stage": row["stage"], "calls": 0, "total_s": 0.0, "max_ms": 0.0,
+            "items": 0, "hits": 0, "misses": 0,
+        })
+        stat["calls"] += row["calls"]
+        stat["total_s"] += row["total_s"]
+        stat["max_ms"] = max(stat["max_ms"], row["max_ms"])
+        stat["items"] += row["items"]
+        stat["hits"] += row["hits"]
+        stat["misses"] += row["misses"]
+    for stat in totals.values():
+        stat["total_s"] = round(stat["total_s"], 3)
+    return sorted(totals.values(), key=lambda s: -s["total_s"])
+
+
+def run_once(settings: dict, folders: list[str], window: dict, workers: int) -> dict:
+    """전체 분야를 한 번 실행하고 (소요 시간, 분야별 건수, 단계별 합계) 반환."""
+    run_id = perf.new_run_id()
+    perf.set_run(run_id)
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as workdir:
+        store = _fresh_state(workdir)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = {
+                fn: pool.submit(contextvars.copy_context().run, _run_folder, fn, settings, window, store)
+                for fn in folders
+            }
+            outcome = {fn: future.result() for fn, future in futures.items()}
+        wall = time.perf_counter() - started
+        archive._default_archive = None
+    return {"run_id": run_id, "wall_s": round(wall, 3), "folders": outcome, "stages": _stage_totals(run_id)}
+
+
+def _print_run(index: int, run: dict) -> None:
+    print(f"\n[실행 {index}] 전체 {run['wall_s']:.3f}s")
+    for fn, info in run["folders"].items():
+        print(
+            f"  {fn:10} RSS {info['rss_count']:>4}  검색 {info['search_count']:>4}  "
+            f"전체 {info['total_count']:>4}  선별 {info['selected']:>3}"
+        )
+    print(f"  {'stage':28} {'calls':>6} {'total_s':>8} {'max_ms':>8} {'items':>6} {'hit%':>5}")
+    for s in run["stages"]:
+        lookups = s["hits"] + s["misses"]
+        hit = f"{s['hits'] / lookups * 100:.0f}" if lookups else "-"
+        print(f"  {s['stage']:28} {s['calls']:>6} {s['total_s']:>8.3f} {s['max_ms']:>8.1f} {s['items']:>6} {hit:>5}")
+
+
+def _compare(best: dict, baseline_path: str, tolerance: float) -> list[str]:
+    """기준 결과 대비 전체 시간 · 단계별 시간 회귀 목록 (0.1초 미만 단계는 무시)."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["best"]
+    regressions = []
+    limit = baseline["wall_s"] * (1 + tolerance)
+    if best["wall_s"] > limit:
+        regressions.append(f"전체 {best['wall_s']:.3f}s > 기준 {baseline['wall_s']:.3f}s (+{tolerance:.0%})")
+    base_stages = {s["stage"]: s for s in baseline["stages"]}
+    for s in best["stages"]:
+        base = base_stages.get(s["stage"])
+        if base is None or max(base["total_s"], s["total_s"]) < 0.1:
+            continue
+        if s["total_s"] > base["total_s"] * (1 + tolerance):
+            regressions.append(f"{s['stage']}: {s['total_s']:.3f}s > 기준 {base['total_s']:.3f}s")
+    return regressions
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="전체 파이프라인 벤치마크 (HTTP 기록/재생)")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--record", metavar="PATH", help="실제 네트워크로 1회 실행하며 카세트 기록")
+    mode.add_argument("--cassette", metavar="PATH", help="카세트를 재생하여 측정")
+    parser.add_argument("--start", type=_parse_date, help="기록 시작일 (기본: 이번 주 월요일)")
+    parser.add_argument("--end", type=_parse_date, help="기록 종료일 (기본: min(일요일, 오늘))")
+    parser.add_argument("--folders", nargs="*", help="기록할 분야 (기본: 전체)")
+    parser.add_argument("--settings", help="기록에 사용할 설정 JSON (기본: settings.json)")
+    parser.add_argument("--workers", type=int, default=COLLECT_MAX_WORKERS, help="동시에 실행할 분야 수")
+    parser.add_argument("--repeat", type=int, default=3, help="재생 반복 횟수 (가장 빠른 실행 기준)")
+    parser.add_argument("--simulate-latency", action="store_true", help="기록된 응답 시간만큼 대기하며 재생")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--baseline", help="기준 결과 JSON (회귀 시 종료 코드 1)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="기준 대비 허용 증가율 (기본 0.25)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="상세 로그 출력")
+    return parser
+
+
+def _record_meta(args: argparse.Namespace) -> dict:
+    if args.settings:
+        with open(args.settings, "r", encoding="utf-8") as f:
+            settings = json.load(f)
+    else:
+        settings = sm.load_settings()
+    folders = args.folders or sm.get_folder_names(settings)
+    default_start, default_end = collector.default_week()
+    start, end = args.start or default_start, args.end or default_end
+    newer_than, older_than = collector.date_window(start, end)
+    return {
+        "settings": settings,
+        "folders": folders,
+        "window": {
+            "start": start.isoformat(), "end": end.isoformat(),
+            "newer_than": newer_than, "older_than": older_than,
+        },
+        "llm_enabled": LLM_SCORING_ENABLED,
+        "google_news_base_url": rss_fetcher.GOOGLE_NEWS_BASE_URL,
+    }
+
+
+def main(argv=None) -> int:
+    args = _build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    if args.record:
+        meta = _record_meta(args)
+        replay = http_replay.HttpReplay(args.record, http_replay.RECORD, meta=meta)
+        repeat = 1
+    else:
+        meta = http_replay.Cassette(args.cassette).load().meta
+        replay = http_replay.HttpReplay(
+            args.cassette, http_replay.REPLAY, simulate_latency=args.simulate_latency
+        )
+        repeat = max(1, args.repeat)
+
+    window = dict(meta["window"])
+    window["start"] = datetime.date.fromisoformat(window["start"])
+    window["end"] = datetime.date.fromisoformat(window["end"])
+    _set_llm(meta.get("llm_enabled", False), replaying=not args.record)
+    if not args.record:
+        # 기록 당시 검색 주소로 요청해야 카세트와 일치. 재생에는 Google News 호출 간격 불필요
+        rss_fetcher.GOOGLE_NEWS_BASE_URL = meta.get("google_news_base_url", rss_fetcher.GOOGLE_NEWS_BASE_URL)
+        limiters.google_news = limiters.Limiter("google_news", max_concurrent=limiters.google_news.max_concurrent)
+
+    runs = []
+    with replay:
+        for index in range(1, repeat + 1):
+            run = run_once(meta["settings"], meta["folders"], window, args.workers)
+            runs.append(run)
+            _print_run(index, run)
+
+    best = min(runs, key=lambda r: r["wall_s"])
+    if replay.misses:
+        print(f"\n카세트에 없는 요청 {len(replay.misses)}건 (설정 · 코드가 기록 이후 바뀌었을 수 있음)")
+    print(f"\n최단 실행: {best['wall_s']:.3f}s ({len(runs)}회 중)")
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {"cassette": args.record or args.cassette, "window": meta["window"],
+                 "misses": len(replay.misses), "runs": runs, "best": best},
+                f, ensure_ascii=False, indent=2,
+            )
+
+    if args.baseline:
+        regressions = _compare(best, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"회귀: {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,352 @@
+"""분야별 기사 수집 파이프라인 (RSS + Google News 검색 → 스코어링 → 번역).
+
+Streamlit 위젯과 분리되어 있어 백그라운드 작업이나 배치 실행에서도 그대로 사용.
+RSS 피드 · 검색어 수집과 번역은 분야 안에서도 동시에 실행되며,
+외부 요청 수는 limiters가 모든 분야에 걸쳐 제한한다.
+"""
+
+import contextvars
+import datetime
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+import perf
+import settings_manager as sm
+from archive import get_archive
+from article_store import ArticleStore, feed_source, get_article_store, search_source
+from article_text import translate_ko
+from config import FETCH_MAX_WORKERS, LLM_SCORING_ENABLED
+from feed_health import get_feed_health
+from feed_scheduler import FeedScheduler, get_feed_scheduler
+from result_cache import ResultCache, get_result_cache
+from rss_fetcher import dedupe_articles, fetch_feeds, fetch_search_queries
+from scorer import get_scoring_cache, select_top_articles
+from url_canon import article_key
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[float, str], None]
+
+
+def default_week(today: Optional[datetime.date] = None) -> tuple[datetime.date, datetime.date]:
+    """기본 수집 기간: 이번 주 월요일 ~ min(일요일, 오늘)."""
+    today = today or datetime.date.today()
+    last_monday = today - datetime.timedelta(days=today.weekday())
+    last_sunday = last_monday + datetime.timedelta(days=6)
+    return last_monday, min(last_sunday, today)
+
+
+def date_window(start: datetime.date, end: datetime.date) -> tuple[int, int]:
+    """시작일~종료일을 (newer_than, older_than) Unix timestamp로 변환 (로컬 시간 기준)."""
+    newer_than = int(datetime.datetime.combine(start, datetime.time.min).timestamp())
+    older_than = int(datetime.datetime.combine(end, datetime.time.max).timestamp())
+    return newer_than, older_than
+
+
+def resolve_search_queries(settings: dict, folder_name: str) -> list[str]:
+    """검색어 목록. 미등록 시 스코어링 키워드에서 자동 생성."""
+    queries = sm.get_search_queries(settings, folder_name)
+    if not queries:
+        criteria = sm.get_criteria(settings, folder_name)
+        queries = criteria.get("keywords", [])[:3] + criteria.get("keywords_en", [])[:3]
+    return queries
+
+
+def _result(top_articles, rss_count, search_count, total_count, queries, fetched_start, fetched_end) -> dict:
+    return {
+        "top_articles": top_articles,
+        "rss_count": rss_count,
+        "search_count": search_count,
+        "total_count": total_count,
+        "search_queries_used": queries,
+        "fetched_start": fetched_start,
+        "fetched_end": fetched_end,
+    }
+
+
+def _archive_run(folder_name: str, fetched: list, selected: list) -> None:
+    """수집 결과를 아카이브에 일괄 기록 (실패해도 수집 결과에는 영향 없음)."""
+    try:
+        with perf.stage("archive.write") as span:
+            span.items = get_archive().record_run(folder_name, fetched, selected, perf.current_run())
+    except Exception as e:
+        logger.warning("'%s' 아카이브 기록 실패: %s", folder_name, e)
+
+
+def _reuse_translations(folder_name: str, articles: list) -> list:
+    """아카이브에 번역이 있는 기사는 채우고, 아직 번역이 필요한 기사 목록 반환."""
+    try:
+        known = get_archive().translations(folder_name, [article_key(a) for a in articles])
+    except Exception as e:
+        logger.warning("'%s' 번역 재사용 조회 실패: %s", folder_name, e)
+        return list(articles)
+    perf.cache_lookup("archive.translation", True, len(known))
+    perf.cache_lookup("archive.translation", False, len(articles) - len(known))
+
+    pending = []
+    for art in articles:
+        hit = known.get(article_key(art))
+        if hit is None:
+            pending.append(art)
+        else:
+            art["title_kr"], art["summary_kr"] = hit
+    return pending
+
+
+class _FetchProgress:
+    """피드 · 검색어 수집 완료 수를 합산하여 분야 진행률 구간 [start, end]로 보고 (스레드 안전)."""
+
+    def __init__(self, report: Callable[[float, str], None], start: float, end: float):
+        self._report = report
+        self._start = start
+        self._end = end
+        self._lock = threading.Lock()
+        self.total = 0
+        self.done = 0
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self.total += count
+
+    def step(self, *_args) -> None:
+        with self._lock:
+            self.done += 1
+            done, total = self.done, max(self.total, 1)
+        self._report(
+            self._start + (self._end - self._start) * min(done / total, 1.0),
+            f"피드 · 검색어 수집 중 ({done}/{total})",
+        )
+
+
+def _translate_one(art) -> None:
+    if not art.get("title_kr"):
+        art["title_kr"] = translate_ko(art.get("title", ""))
+    if not art.get("summary_kr"):
+        art["summary_kr"] = translate_ko((art.get("summary") or "")[:800])
+
+
+def _translate_articles(articles: list) -> None:
+    """기사 제목 · 요약을 Google 번역으로 채움 (기사 단위로 동시에 실행)."""
+    if not articles:
+        return
+    workers = min(FETCH_MAX_WORKERS, len(articles))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as pool:
+        for future in [
+            pool.submit(contextvars.copy_context().run, _translate_one, art) for art in articles
+        ]:
+            future.result()
+
+
+def _refresh_sources(
+    store: ArticleStore,
+    folder_name: str,
+    sources: dict[str, object],
+    fetch: Callable[..., dict],
+    newer_than: int,
+    older_than: int,
+    tracker: Optional[_FetchProgress] = None,
+    scheduler: Optional[FeedScheduler] = None,
+) -> None:
+    """
+    저장소에 수집 기록이 없는 구간이 있는 소스만 그 구간으로 다시 가져와 저장.
+    sources: {소스 키: fetch 함수에 넘길 항목 (피드 dict 또는 검색어)}
+    scheduler: 주면 수집 시각 전인 피드는 마지막 수집까지의 구간이 저장되어 있을 때 건너뜀
+    실패한 소스는 수집 완료로 기록하지 않음 (다음 실행에서 재시도).
+    """
+    pending: dict[tuple[int, int], list[str]] = {}
+    for source, item in sources.items():
+        if scheduler is not None and isinstance(item, dict) and _feed_not_due(
+            store, scheduler, folder_name, source, item["url"], newer_than, older_than
+        ):
+            continue
+        span = store.uncovered_range(folder_name, source, newer_than, older_than)
+        if span is not None:
+            pending.setdefault(span, []).append(source)
+    if tracker is not None:
+        tracker.add(sum(len(keys) for keys in pending.values()))
+
+    for (lo, hi), keys in pending.items():
+        items = [sources[k] for k in keys]
+        fetched = fetch(items, lo, hi, progress=tracker.step if tracker is not None else None)
+        for key, item in zip(keys, items):
+            fetch_key = item.get("url", "") if isinstance(item, dict) else item.strip()
+            articles = fetched.get(fetch_key)
+            if articles is None or isinstance(articles, Exception):
+                if articles is not None:
+                    logger.warning("'%s' 소스 수집 실패 (%s): %s", folder_name, key, articles)
+                continue
+            store.add(folder_name, key, articles)
+            store.mark_covered(folder_name, key, lo, hi)
+
+
+def _feed_not_due(
+    store: ArticleStore,
+    scheduler: FeedScheduler,
+    folder_name: str,
+    source: str,
+    url: str,
+    newer_than: int,
+    older_than: int,
+) -> bool:
+    """
+    피드를 이번에 건너뛸지: 연속 실패로 차단되었거나(feed_health) 실패 후 재시도 대기 중이거나,
+    수집 시각 전이고 구간 시작부터 마지막 수집 시각까지 저장소에 모두 있는 경우
+    (그 이후 새 항목은 없다고 봄).
+    """
+    skip = get_feed_health().is_open(url) or scheduler.in_backoff(url)
+    if not skip:
+        polled = scheduler.polled_until(url)
+        skip = (
+            polled is not None and polled >= newer_than
+            and store.uncovered_range(folder_name, source, newer_than, min(older_than, polled)) is None
+        )
+    perf.cache_lookup("feed_scheduler", skip)
+    return skip
+
+
+def collect_folder(
+    folder_name: str,
+    settings: dict,
+    newer_than: Optional[int] = None,
+    older_than: Optional[int] = None,
+    fetched_start=None,
+    fetched_end=None,
+    progress: Optional[ProgressCallback] = None,
+    store: Optional[ArticleStore] = None,
+) -> dict:
+    """
+    한 분야의 기사를 수집·스코어링·번역하여 캐시용 결과 dict를 반환.
+
+    수집한 원본 기사는 기사 저장소에 발행일별로 보관되며,
+    날짜 범위가 바뀌어도 저장소에 없는 구간만 피드/검색어에서 새로 가져온다.
+
+    Returns:
+        {top_articles, rss_count, search_count, total_count,
+         search_queries_used, fetched_start, fetched_end}
+    """
+    def _report(fraction: float, text: str) -> None:
+        if progress:
+            progress(fraction, text)
+
+    with perf.folder_scope(folder_name), perf.stage("collect.total"):
+        feed_list = sm.get_feeds(settings, folder_name)
+        search_queries = resolve_search_queries(settings, folder_name)
+
+        if not feed_list and not search_queries:
+            return _result([], 0, 0, 0, [], fetched_start, fetched_end)
+
+        store = store or get_article_store()
+        window_lo = newer_than if newer_than is not None else 0
+        window_hi = older_than if older_than is not None else int(time.time())
+
+        feed_sources = {feed_source(f["url"]): f for f in feed_list if f.get("url")}
+        query_sources = {search_source(q): q for q in search_queries if q.strip()}
+
+        # ── RSS 피드 · Google News 동시 수집 (저장소에 없는 구간만, 피드는 수집 시각이 된 것만) ──
+        _report(0.05, "RSS 피드 · Google News 수집 중")
+        tracker = _FetchProgress(_report, 0.05, 0.5)
+        scheduler = get_feed_scheduler()
+        refreshes = [
+            (sources, fetch, sched)
+            for sources, fetch, sched in (
+                (feed_sources, functools.partial(fetch_feeds, on_polled=scheduler.record_poll), scheduler),
+                (query_sources, fetch_search_queries, None),
+            )
+            if sources
+        ]
+        if refreshes:
+            with ThreadPoolExecutor(max_workers=len(refreshes), thread_name_prefix="refresh") as pool:
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run, _refresh_sources,
+                        store, folder_name, sources, fetch, window_lo, window_hi, tracker, sched,
+                    )
+                    for sources, fetch, sched in refreshes
+                ]
+                for future in futures:
+                    future.result()
+            scheduler.flush()
+
+        with perf.stage("article_store.load") as span:
+            stored = store.load_by_source(
+                folder_name, newer_than, older_than,
+                sources=list(feed_sources) + list(query_sources),
+            )
+            span.items = sum(len(v) for v in stored.values())
+        # 같은 기사가 여러 피드 · 검색어에 실린 경우 정규 URL · 제목 기준으로 한 번만 포함
+        seen: set[str] = set()
+        folder_articles = dedupe_articles((stored.get(key, []) for key in feed_sources), seen)
+        rss_count = len(folder_articles)
+
+        search_articles = dedupe_articles(
+            (stored.get(key, []) for key in query_sources), seen
+        )
+        search_count = len(search_articles)
+        folder_articles.extend(search_articles)
+
+        if not folder_articles:
+            return _result([], rss_count, search_count, 0, search_queries, fetched_start, fetched_end)
+
+        # ── 스코어링 ──
+        _report(0.5, "스코어링 중")
+        top = select_top_articles(folder_articles, folder_name, settings, cache=get_scoring_cache())
+
+        if not top:
+            _archive_run(folder_name, folder_articles, [])
+            return _result(
+                [], rss_count, search_count, len(folder_articles),
+                search_queries, fetched_start, fetched_end,
+            )
+
+        # ── 이전 수집에서 번역된 기사는 아카이브의 번역 재사용 (설정 변경 후 재선별 시) ──
+        untranslated = _reuse_translations(folder_name, top)
+
+        # ── 번역 (Google Translate, 기사별 동시 실행) ──
+        _report(0.75, "번역 중")
+        _translate_articles(untranslated)
+
+        # ── LLM 추가 번역 (Gemini 활성 시) ──
+        if LLM_SCORING_ENABLED and untranslated:
+            try:
+                from llm_scorer import translate_summaries, _daily_quota_exhausted
+                if not _daily_quota_exhausted:
+                    _report(0.9, "AI 번역 중")
+                    translate_summaries(untranslated)
+            except Exception:
+                pass
+
+        _archive_run(folder_name, folder_articles, top)
+        return _result(
+            top, rss_count, search_count, len(folder_articles),
+            search_queries, fetched_start, fetched_end,
+        )
+
+
+def collect_folder_cached(
+    folder_name: str,
+    settings: dict,
+    newer_than: Optional[int] = None,
+    older_than: Optional[int] = None,
+    fetched_start=None,
+    fetched_end=None,
+    progress: Optional[ProgressCallback] = None,
+    cache: Optional[ResultCache] = None,
+) -> dict:
+    """공유 결과 캐시를 먼저 조회하고, 없을 때만 수집하여 캐시에 저장."""
+    cache = cache or get_result_cache()
+    version = sm.folder_settings_version(settings, folder_name)
+    cached = cache.get(folder_name, newer_than, older_than, version)
+    if cached is not None:
+        return cached
+
+    result = collect_folder(
+        folder_name, settings, newer_than, older_than,
+        fetched_start=fetched_start, fetched_end=fetched_end, progress=progress,
+    )
+    with perf.folder_scope(folder_name), perf.stage("result_cache.put"):
+        cache.put(folder_name, newer_than, older_than, version, result)
+    return result
@@ -1,14 +1,23 @@
 import os
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
 
+_SECRETS_FILES = (
+    os.path.join(os.path.expanduser("~"), ".streamlit", "secrets.toml"),
+    os.path.join(os.getcwd(), ".streamlit", "secrets.toml"),
+)
+
 
 def _get_secret(key: str, default=None):
     """환경변수 또는 Streamlit secrets에서 값을 가져옴 (Cloud 배포 호환)."""
     val = os.getenv(key)
     if val:
         return val
+    # 배치 실행 등 Streamlit 밖에서는 secrets 파일이 없으면 streamlit을 불러오지 않음
+    if "streamlit" not in sys.modules and not any(os.path.exists(p) for p in _SECRETS_FILES):
+        return default
     try:
         import streamlit as st
         return st.secrets.get(key, default)
@@ -24,6 +33,8 @@ INOREADER_AUTH_URL = f"{INOREADER_BASE_URL}/oauth2/auth"
 INOREADER_TOKEN_URL = f"{INOREADER_BASE_URL}/oauth2/token"
 INOREADER_REDIRECT_URI = "http://localhost:8501"
 INOREADER_SCOPE = "read"
+INOREADER_MAX_CONCURRENCY = 4   # 동시 API 요청 수 (연결 풀 크기와 같게)
+INOREADER_QUOTA_RESERVE = 5     # 앱 사용량 한도까지 이만큼 남으면 초기화 시각까지 요청 중단
 
 TOKEN_FILE = ".inoreader_token.json"
 
@@ -34,6 +45,32 @@ LLM_SCORING_ENABLED = bool(GEMINI_API_KEY)
 LLM_BATCH_SIZE = 20
 LLM_TIMEOUT = 60
 LLM_MAX_RETRIES = 3
+LLM_MIN_CALL_INTERVAL = 7.0  # 초 (무료 티어 10 req/min → 6초 간격 + 1초 여유)
 LLM_KEYWORD_WEIGHT = 0.3
 LLM_RELEVANCE_WEIGHT = 0.7
 MIN_KEYWORD_SCORE = 3
+
+# Google News RSS 검색 주소 (벤치마크 · 테스트에서 로컬 서버로 바꿀 때 환경변수로 지정)
+GOOGLE_NEWS_BASE_URL = os.getenv("GOOGLE_NEWS_BASE_URL", "https://news.google.com").rstrip("/")
+
+# HTTP 기록/재생 (http_replay): record 또는 replay, 카세트 파일 경로
+HTTP_REPLAY_MODE = os.getenv("HTTP_REPLAY_MODE", "").strip().lower()
+HTTP_REPLAY_PATH = os.getenv("HTTP_REPLAY_PATH", "")
+
+# ── 수집 동시 실행 설정 ──
+COLLECT_MAX_WORKERS = 5         # 동시에 수집하는 분야 수 (대시보드 백그라운드 작업)
+FETCH_MAX_WORKERS = 4           # 분야 하나에서 동시에 가져오는 피드 · 검색어 수
+NETWORK_MAX_CONCURRENCY = 8     # 프로세스 전체 동시 HTTP 요청 수
+GOOGLE_NEWS_MIN_INTERVAL = 0.5  # Google News 검색 호출 간 최소 간격 (초)
+GOOGLE_NEWS_CACHE_TTL = 10 * 60  # 같은 검색어 결과를 분야 · 새로고침 간에 재사용하는 시간 (초)
+
+# ── 피드별 수집 주기 (feed_scheduler) ──
+FEED_POLL_MIN_INTERVAL = 15 * 60        # 초
+FEED_POLL_MAX_INTERVAL = 12 * 60 * 60   # 초 (조용하거나 실패하는 피드도 이 간격 안에 한 번은 확인)
+FEED_POLL_DEFAULT_INTERVAL = 60 * 60    # 발행 주기를 아직 모르는 피드
+FEED_POLL_CADENCE_FACTOR = 0.5          # 다음 수집 간격 = 발행 주기 × 이 값
+
+# ── 피드 상태 · 차단기 (feed_health) ──
+FEED_BREAKER_THRESHOLD = 3              # 이 횟수만큼 연속 실패하면 수집 중단
+FEED_BREAKER_COOLDOWN = 6 * 60 * 60     # 수집 중단 후 다시 시도하기까지 (초, 재실패 시 2배)
+FEED_SLOW_MS = 5000                     # 평균 응답 시간이 이 이상이면 "느림"으로 표시
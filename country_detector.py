@@ -0,0 +1,130 @@
+"""기사 국가/지역 감지 모듈 (URL 도메인 + 텍스트 키워드).
+
+호스트명은 한 번만 파싱하여 공개 접미사(public suffix) 테이블에서 조회하고,
+제목+요약은 모든 국가 키워드를 하나로 묶은 정규식으로 한 번만 스캔한다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+from url_canon import unwrap_redirect
+
+# 공개 접미사(국가 코드 최상위 도메인) → 국가
+_COUNTRY_BY_SUFFIX = {
+    "kr": "한국", "jp": "일본", "cn": "중국", "tw": "대만",
+    "sg": "싱가포르", "in": "인도", "th": "태국", "vn": "베트남",
+    "id": "인도네시아", "my": "말레이시아", "ph": "필리핀",
+    "uk": "영국", "de": "독일", "fr": "프랑스", "it": "이탈리아",
+    "es": "스페인", "nl": "네덜란드", "se": "스웨덴", "ch": "스위스",
+    "au": "호주", "ca": "캐나다", "br": "브라질", "mx": "멕시코",
+    "sa": "사우디", "ae": "UAE", "qa": "카타르", "il": "이스라엘",
+}
+
+# 순서가 우선순위 — 여러 국가가 매칭되면 먼저 나온 국가를 반환
+_COUNTRY_KEYWORDS = {
+    "미국": ["FDA", "NIH", "CDC", "United States", "U.S.", "American"],
+    "EU": ["European Union", "EMA", "EU ", "European Commission"],
+    "영국": ["UK ", "MHRA", "NHS", "United Kingdom", "Britain"],
+    "중국": ["China", "NMPA", "Chinese", "Beijing", "Shanghai"],
+    "일본": ["Japan", "PMDA", "Japanese", "Tokyo"],
+    "한국": ["Korea", "MFDS", "식약처", "한국"],
+    "인도": ["India", "Indian", "CDSCO", "Mumbai"],
+    "사우디": ["Saudi", "사우디"],
+    "UAE": ["UAE", "Dubai", "Abu Dhabi", "두바이"],
+}
+
+_COUNTRY_NORMALIZE = {
+    "US": "미국", "USA": "미국", "UK": "영국",
+    "EU": "EU", "Saudi": "사우디아라비아",
+    "Dubai": "UAE", "Qatar": "카타르",
+}
+
+DEFAULT_COUNTRY = "글로벌"
+
+
+def _compile_keyword_pattern() -> tuple[re.Pattern, dict[str, int]]:
+    """모든 국가 키워드를 하나의 정규식으로 컴파일.
+
+    lookahead로 감싸 겹치는 매칭도 모두 찾고, 같은 위치에서는 우선순위가
+    높은 국가의 키워드가 먼저 시도되도록 국가 순서대로 나열한다.
+    """
+    priority: dict[str, int] = {}
+    alternatives: list[str] = []
+    for rank, keywords in enumerate(_COUNTRY_KEYWORDS.values()):
+        for kw in keywords:
+            key = kw.upper()
+            if key in priority:
+                continue
+            priority[key] = rank
+            alternatives.append(re.escape(kw))
+    pattern = re.compile("(?=(" + "|".join(alternatives) + "))", re.IGNORECASE)
+    return pattern, priority
+
+
+_KEYWORD_PATTERN, _KEYWORD_PRIORITY = _compile_keyword_pattern()
+_COUNTRY_BY_RANK = list(_COUNTRY_KEYWORDS.keys())
+
+
+@lru_cache(maxsize=4096)
+def _country_from_host(host: str) -> Optional[str]:
+    """호스트명의 공개 접미사(국가 코드 최상위 도메인)로 국가 조회."""
+    suffix = host.rstrip(".").rsplit(".", 1)[-1]
+    return _COUNTRY_BY_SUFFIX.get(suffix)
+
+
+def country_from_url(url: str) -> Optional[str]:
+    """URL 도메인의 국가 코드 접미사로 국가 감지. 없으면 None."""
+    if not url:
+        return None
+    try:
+        host = urlparse(unwrap_redirect(url)).hostname or ""
+    except ValueError:
+        return None
+    if not host:
+        return None
+    return _country_from_host(host)
+
+
+def country_from_text(text: str) -> Optional[str]:
+    """텍스트에서 국가 키워드를 한 번의 스캔으로 감지. 없으면 None."""
+    if not text:
+        return None
+    best = len(_COUNTRY_BY_RANK)
+    for m in _KEYWORD_PATTERN.finditer(text):
+        rank = _KEYWORD_PRIORITY.get(m.group(1).upper(), best)
+        if rank < best:
+            best = rank
+            if best == 0:
+                break
+    if best < len(_COUNTRY_BY_RANK):
+        return _COUNTRY_BY_RANK[best]
+    return None
+
+
+def normalize_country(name: str) -> str:
+    """영문 국가명을 한글로 정규화."""
+    return _COUNTRY_NORMALIZE.get(name, name)
+
+
+def detect_country(article: dict) -> str:
+    """기사에서 국가/지역을 추출. 공란 없이 반드시 값 반환."""
+    # 1) 스코어링에서 이미 감지된 국가
+    matched_countries = article.get("matched_countries") or []
+    if matched_countries:
+        return normalize_country(matched_countries[0])
+
+    # 2) URL 도메인의 국가 코드
+    country = country_from_url(article.get("url") or "")
+    if country:
+        return country
+
+    # 3) 제목+요약 텍스트의 국가 키워드
+    text = (article.get("title") or "") + " " + (article.get("summary") or "")
+    return country_from_text(text) or DEFAULT_COUNTRY
+
+
+def detect_countries(articles: Iterable[dict]) -> list[str]:
+    """기사 목록의 국가를 일괄 감지 (내보내기 행 생성용)."""
+    return [detect_country(a) for a in articles]
@@ -0,0 +1,378 @@
+"""선별 기사 내보내기 모듈 (xlsx / CSV / JSONL / Parquet).
+
+모든 형식은 엑셀과 같은 행 스키마(EXPORT_COLUMNS)를 사용하며,
+행을 하나씩 기록하는 스트리밍 방식으로 파일 또는 응답 스트림에 쓴다.
+"""
+
+import csv
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import uuid
+from collections import OrderedDict
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Union
+
+import perf
+import url_canon
+from article import ANALYSIS_FIELDS
+from article_text import extract_3_sentences, fetch_article_text, translate_ko
+from config import LLM_SCORING_ENABLED
+from country_detector import detect_countries
+from utils import write_excel_stream
+
+EXPORT_COLUMNS = [
+    "구분", "호수", "채택",
+    "키워드1(국가)", "키워드2", "키워드3(해시태그)",
+    "원제목(원문)", "주요내용", "발행기관", "발간일", "URL", "추천기준",
+]
+
+# 단일 표 형식(CSV/JSONL/Parquet)은 여러 분야를 한 파일에 담으므로 분야 열을 앞에 붙임
+FOLDER_COLUMN = "분야"
+FLAT_COLUMNS = [FOLDER_COLUMN] + EXPORT_COLUMNS
+
+EXPORT_FORMATS = {
+    "xlsx": {"label": "엑셀 (xlsx)", "mime": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"},
+    "csv": {"label": "CSV (UTF-8)", "mime": "text/csv"},
+    "jsonl": {"label": "JSON Lines", "mime": "application/x-ndjson"},
+    "parquet": {"label": "Parquet", "mime": "application/vnd.apache.parquet"},
+}
+
+PARQUET_BATCH_SIZE = 500
+
+Output = Union[str, BinaryIO]
+
+
+def available_formats() -> list[str]:
+    """현재 환경에서 사용 가능한 내보내기 형식 (Parquet는 pyarrow 설치 시에만)."""
+    return [
+        fmt for fmt in EXPORT_FORMATS
+        if fmt != "parquet" or importlib.util.find_spec("pyarrow") is not None
+    ]
+
+
+# ── 행 생성 ──────────────────────────────────────────────────
+
+
+def analyze_for_export(articles: list[dict]) -> list[dict]:
+    """Gemini 활성 시 내보내기용 AI 분석 추가. 비활성·한도 소진·실패 시 그대로 반환."""
+    if not LLM_SCORING_ENABLED or not articles:
+        return articles
+    try:
+        from llm_scorer import analyze_articles_for_excel, _daily_quota_exhausted
+        if not _daily_quota_exhausted:
+            return analyze_articles_for_excel(articles)
+    except Exception:
+        pass
+    return articles
+
+
+def build_export_rows(articles: list[dict], progress_callback=None) -> list[dict]:
+    """기사 리스트를 엑셀 행 딕셔너리 리스트로 변환. 번역 포함."""
+    rows = []
+    total = len(articles)
+    # AI 국가가 없는 기사만 일괄 자동 감지 (기사 순서대로 소비)
+    detected = iter(detect_countries(a for a in articles if not a.get("country")))
+    for idx, a in enumerate(articles, 1):
+        if progress_callback:
+            progress_callback(idx, total)
+
+        pub = a.get("published")
+        title_orig = a.get("title", "")
+        summary_orig = (a.get("summary") or "")[:500]
+
+        # ── 키워드1(국가): AI → 자동 감지 (공란 없음)
+        country = a.get("country") or next(detected)
+
+        # ── 키워드2: AI oneliner → 제목 한글 번역
+        kw2 = a.get("oneliner", "")
+        if not kw2:
+            kw2 = a.get("title_kr", "")
+        if not kw2:
+            kw2 = translate_ko(title_orig)
+
+        # ── 키워드3(해시태그): AI → 매칭 키워드를 한글 해시태그로
+        kw3 = a.get("hashtags", "")
+        if not kw3:
+            matched = a.get("matched_keywords", [])
+            translated_tags = []
+            for kw in matched:
+                kw_kr = translate_ko(kw) if all(ord(c) < 128 for c in kw if not c.isspace()) else kw
+                translated_tags.append(f"#{kw_kr.replace(' ', '_')}")
+            kw3 = " ".join(translated_tags) if translated_tags else ""
+
+        # ── 주요내용: AI 3문장 → 기사 본문에서 3문장 추출
+        main_content = a.get("summary_3sent", "")
+        if not main_content:
+            # RSS 요약이 짧으면(200자 미만) 실제 기사 본문을 가져와서 3문장 추출
+            source_text = summary_orig
+            if len(summary_orig) < 200 and a.get("url"):
+                full_text = fetch_article_text(a["url"])
+                if full_text and len(full_text) > len(summary_orig):
+                    source_text = full_text
+            translated = translate_ko(source_text[:2000])
+            main_content = extract_3_sentences(translated)
+
+        # ── 추천기준
+        kw_score = a.get("keyword_score", 0)
+        llm_score = a.get("llm_score")
+        matched_kws = a.get("matched_keywords", [])
+        if llm_score is not None:
+            criteria_text = f"KW:{kw_score:.0f} AI:{llm_score} 종합:{a.get('score', 0):.1f}"
+        else:
+            criteria_text = f"KW:{kw_score:.0f}"
+        if matched_kws:
+            criteria_text += f" [{', '.join(matched_kws[:5])}]"
+
+        rows.append({
+            "구분": idx,
+            "호수": "",
+            "채택": "",
+            "키워드1(국가)": country,
+            "키워드2": kw2,
+            "키워드3(해시태그)": kw3,
+            "원제목(원문)": title_orig,
+            "주요내용": main_content,
+            "발행기관": a.get("source", ""),
+            "발간일": pub.strftime("%Y-%m-%d") if pub else "",
+            "URL": a.get("url", ""),
+            "추천기준": criteria_text,
+        })
+    return rows
+
+
+def _flat_rows(sheets: dict[str, Iterable[dict]]) -> Iterator[dict]:
+    """시트별 행을 분야 열이 붙은 단일 행 스트림으로 펼침."""
+    for folder_name, rows in sheets.items():
+        for row in rows:
+            flat = {FOLDER_COLUMN: folder_name}
+            flat.update(row)
+            yield flat
+
+
+def _open_binary(output: Output):
+    """경로면 새로 열고, 파일 객체면 그대로 사용 (닫기 책임 여부 함께 반환)."""
+    if isinstance(output, str):
+        return open(output, "wb"), True
+    return output, False
+
+
+# ── 형식별 기록 ──────────────────────────────────────────────
+
+
+def write_csv(sheets: dict[str, Iterable[dict]], output: Output) -> None:
+    """CSV로 스트리밍 기록. 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함."""
+    fh, owned = _open_binary(output)
+    try:
+        text = io.TextIOWrapper(fh, encoding="utf-8-sig", newline="", write_through=True)
+        writer = csv.DictWriter(text, fieldnames=FLAT_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        for row in _flat_rows(sheets):
+            writer.writerow(row)
+        text.flush()
+        text.detach()
+    finally:
+        if owned:
+            fh.close()
+
+
+def write_jsonl(sheets: dict[str, Iterable[dict]], output: Output) -> None:
+    """JSON Lines로 스트리밍 기록 (한 줄에 한 기사)."""
+    fh, owned = _open_binary(output)
+    try:
+        for row in _flat_rows(sheets):
+            record = {col: row.get(col, "") for col in FLAT_COLUMNS}
+            fh.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+            fh.write(b"\n")
+    finally:
+        if owned:
+            fh.close()
+
+
+def write_parquet(sheets: dict[str, Iterable[dict]], output: Output) -> None:
+    """Parquet로 배치 단위 스트리밍 기록. pyarrow 필요."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Parquet 내보내기에는 pyarrow 패키지가 필요합니다.") from e
+
+    schema = pa.schema(
+        [(col, pa.int64() if col == "구분" else pa.string()) for col in FLAT_COLUMNS]
+    )
+
+    def _to_batch(batch: list[dict]):
+        return pa.RecordBatch.from_pylist(
+            [
+                {col: (row.get(col) if col == "구분" else str(row.get(col, "") or "")) for col in FLAT_COLUMNS}
+                for row in batch
+            ],
+            schema=schema,
+        )
+
+    with pq.ParquetWriter(output, schema) as writer:
+        batch: list[dict] = []
+        for row in _flat_rows(sheets):
+            batch.append(row)
+            if len(batch) >= PARQUET_BATCH_SIZE:
+                writer.write_batch(_to_batch(batch))
+                batch = []
+        if batch:
+            writer.write_batch(_to_batch(batch))
+
+
+def write_xlsx(sheets: dict[str, Iterable[dict]], output: Output) -> None:
+    """xlsx로 스트리밍 기록 (분야별 시트)."""
+    write_excel_stream(sheets, output, EXPORT_COLUMNS)
+
+
+_WRITERS = {
+    "xlsx": write_xlsx,
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+    "parquet": write_parquet,
+}
+
+
+def write_export(fmt: str, sheets: dict[str, Iterable[dict]], output: Output) -> None:
+    """지정 형식으로 내보내기 기록."""
+    writer = _WRITERS.get(fmt)
+    if writer is None:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {fmt}")
+    with perf.stage(f"export.{fmt}") as span:
+        writer(sheets, output)
+        if isinstance(output, str):
+            span.bytes = os.path.getsize(output)
+        elif hasattr(output, "tell"):
+            span.bytes = output.tell()
+
+
+def export_bytes(fmt: str, sheets: dict[str, Iterable[dict]]) -> bytes:
+    """지정 형식의 내보내기 결과를 바이트로 반환 (다운로드 버튼용)."""
+    output = io.BytesIO()
+    write_export(fmt, sheets, output)
+    return output.getvalue()
+
+
+# ── 선택 해시 기반 메모이제이션 ──────────────────────────────
+
+
+def export_row_key(article: dict) -> str:
+    """내보내기 행 캐시 키 (정규 URL + 점수 — 재수집으로 점수가 바뀌면 새로 분석)."""
+    return f"{url_canon.article_key(article)}|{article.get('score', '')}"
+
+
+def _is_analyzed(article: dict) -> bool:
+    """AI 분석 결과가 하나라도 채워졌는지."""
+    return any(article.get(field) for field in ANALYSIS_FIELDS)
+
+
+def selection_key(articles: list[dict], version: str) -> str:
+    """선택된 기사 ID 목록 + 설정 버전의 해시."""
+    h = hashlib.sha1(version.encode("utf-8"))
+    for a in articles:
+        h.update(b"\0")
+        h.update(export_row_key(a).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ExportCache:
+    """
+    내보내기 결과 캐시.
+
+    - 기사별 분석 행: (분야, 기사 키, 설정 버전) 단위로 보관 → 선택이 바뀌어도 새 기사만 분석
+    - 분야별 행 목록: 선택 해시 단위로 보관 → 바뀌지 않은 분야는 그대로 재사용
+    - 생성된 파일: (형식, 분야별 선택 해시) 단위로 보관 → 같은 조합은 다시 쓰지 않음
+    """
+
+    def __init__(self, max_rows: int = 5000, max_outputs: int = 16):
+        self.max_rows = max_rows
+        self.max_outputs = max_outputs
+        self._rows: OrderedDict[tuple, dict] = OrderedDict()
+        self._sheets: OrderedDict[tuple, list[dict]] = OrderedDict()
+        self._outputs: OrderedDict[tuple, bytes] = OrderedDict()
+
+    @staticmethod
+    def _put(store: OrderedDict, key, value, limit: int) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    @staticmethod
+    def _row(article: dict) -> dict:
+        """기사 하나의 내보내기 행 (구분 번호 제외)."""
+        row = build_export_rows([article])[0]
+        row.pop("구분", None)
+        return row
+
+    def folder_rows(
+        self,
+        folder_name: str,
+        articles: list[dict],
+        version: str,
+        analyze: Optional[Callable[[list[dict]], list[dict]]] = None,
+        progress_callback=None,
+    ) -> tuple[str, list[dict]]:
+        """
+        분야의 내보내기 행을 반환 (선택 해시, 행 목록).
+        캐시에 없는 기사만 analyze → build_export_rows를 거친다.
+        AI 분석이 빠진 행(한도 소진 · 실패)은 캐시하지 않아 다음 내보내기에서 다시 분석하며,
+        이때 선택 해시 대신 매번 새 키를 반환해 생성 파일도 재사용되지 않게 한다.
+        """
+        sel_key = selection_key(articles, version)
+        cached = self._sheets.get((folder_name, sel_key))
+        with perf.folder_scope(folder_name):
+            perf.cache_lookup("export_cache.sheet", cached is not None)
+        if cached is not None:
+            self._sheets.move_to_end((folder_name, sel_key))
+            return sel_key, cached
+
+        missing = [
+            a for a in articles
+            if (folder_name, export_row_key(a), version) not in self._rows
+        ]
+        with perf.folder_scope(folder_name):
+            perf.cache_lookup("export_cache.row", True, len(articles) - len(missing))
+            perf.cache_lookup("export_cache.row", False, len(missing))
+        fresh: dict[tuple, dict] = {}
+        needs_analysis = analyze is not None and LLM_SCORING_ENABLED
+        complete = True
+        if missing:
+            # 분석 결과는 순서 · 개수가 입력과 다를 수 있으므로 기사별 키로 행을 연결
+            analyzed = analyze(list(missing)) if analyze else missing
+            for idx, a in enumerate(analyzed, 1):
+                if progress_callback:
+                    progress_callback(idx, len(analyzed))
+                row_key = (folder_name, export_row_key(a), version)
+                fresh[row_key] = self._row(a)
+                if needs_analysis and not _is_analyzed(a):
+                    complete = False
+                    continue
+                self._put(self._rows, row_key, fresh[row_key], self.max_rows)
+
+        rows = []
+        for idx, a in enumerate(articles, 1):
+            row_key = (folder_name, export_row_key(a), version)
+            cached_row = fresh.get(row_key) or self._rows.get(row_key)
+            if cached_row is None:  # 분석 단계에서 빠진 기사는 분석 없이 변환
+                cached_row = fresh[row_key] = self._row(a)
+                complete = complete and not needs_analysis
+            row = {"구분": idx}
+            row.update(cached_row)
+            rows.append(row)
+        if not complete:
+            return f"{sel_key}~{uuid.uuid4().hex[:8]}", rows
+        self._put(self._sheets, (folder_name, sel_key), rows, self.max_outputs * 4)
+        return sel_key, rows
+
+    def render(self, fmt: str, sheets: dict[str, list[dict]], keys: dict[str, str]) -> bytes:
+        """분야별 선택 해시가 같으면 이전에 생성한 파일을 재사용."""
+        out_key = (fmt, tuple((name, keys.get(name, "")) for name in sheets))
+        cached = self._outputs.get(out_key)
+        perf.cache_lookup(f"export_cache.{fmt}", cached is not None)
+        if cached is None:
+            cached = export_bytes(fmt, sheets)
+            self._put(self._outputs, out_key, cached, self.max_outputs)
+        return cached
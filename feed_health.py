@@ -0,0 +1,193 @@
+"""RSS 피드별 상태 기록과 차단기(circuit breaker).
+
+피드를 가져올 때마다 성공/실패, 응답 시간, 항목 수를 피드 URL 단위로 기록한다.
+연속 실패가 FEED_BREAKER_THRESHOLD회 이상이면 차단기가 열려 FEED_BREAKER_COOLDOWN 동안
+요청하지 않고 바로 실패 처리하며(시간 초과를 매번 기다리지 않음), 대기 시간이 지나면
+한 번 다시 시도하여 성공하면 닫고 실패하면 대기 시간을 2배로 늘려 다시 연다.
+
+상태는 .cache/feed_health.json에 보관하며, 사이드바 "피드 상태"에서
+느리거나 실패하는 피드를 확인하여 정리할 수 있다.
+"""
+
+import datetime
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from config import FEED_BREAKER_COOLDOWN, FEED_BREAKER_THRESHOLD, FEED_SLOW_MS
+from utils import atomic_write_text, dumps_json, loads_json
+
+logger = logging.getLogger(__name__)
+
+HEALTH_PATH = os.path.join(os.path.dirname(__file__), ".cache", "feed_health.json")
+
+LATENCY_ALPHA = 0.3           # 응답 시간 지수이동평균 가중치 (새 관측값)
+MAX_COOLDOWN = 24 * 60 * 60   # 차단 대기 시간 상한 (초)
+
+STATUS_OPEN = "차단"
+STATUS_FAILING = "실패"
+STATUS_SLOW = "느림"
+STATUS_OK = "정상"
+_STATUS_ORDER = {STATUS_OPEN: 0, STATUS_FAILING: 1, STATUS_SLOW: 2, STATUS_OK: 3}
+
+
+class FeedCircuitOpen(Exception):
+    """차단기가 열려 있어 요청하지 않은 피드."""
+
+    def __init__(self, url: str, until: float):
+        self.url = url
+        self.until = until
+        opened = datetime.datetime.fromtimestamp(until).strftime("%m-%d %H:%M")
+        super().__init__(f"연속 실패로 {opened}까지 수집 중단: {url}")
+
+
+class FeedHealth:
+    """피드별 상태 · 차단기 (스레드 안전, 변경분은 flush 시 디스크에 기록)."""
+
+    def __init__(self, path: str = HEALTH_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 스냅샷과 파일 쓰기 순서 보장
+        self._state: Optional[dict[str, dict]] = None
+        self._dirty = False
+
+    def _load_locked(self) -> dict[str, dict]:
+        if self._state is None:
+            self._state = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._state = loads_json(f.read())
+                except (OSError, ValueError) as e:
+                    logger.warning("피드 상태 읽기 실패 (%s): %s", self.path, e)
+        return self._state
+
+    # ── 차단기 ──
+
+    def open_until(self, url: str) -> Optional[float]:
+        """차단기가 열려 있으면 다시 시도할 시각, 아니면 None."""
+        with self._lock:
+            state = self._load_locked().get(url)
+        until = (state or {}).get("open_until", 0)
+        return until if until > time.time() else None
+
+    def is_open(self, url: str) -> bool:
+        return self.open_until(url) is not None
+
+    def check(self, url: str) -> None:
+        """차단기가 열려 있으면 FeedCircuitOpen."""
+        until = self.open_until(url)
+        if until is not None:
+            raise FeedCircuitOpen(url, until)
+
+    # ── 기록 ──
+
+    def _update(self, url: str, latency: float) -> dict:
+        state = dict(self._load_locked().get(url) or {})
+        state["polls"] = state.get("polls", 0) + 1
+        latency_ms = latency * 1000
+        previous = state.get("latency_ms")
+        state["latency_ms"] = round(
+            latency_ms if previous is None
+            else LATENCY_ALPHA * latency_ms + (1 - LATENCY_ALPHA) * previous, 1
+        )
+        return state
+
+    def record_success(self, url: str, latency: float, entries: int) -> None:
+        with self._lock:
+            state = self._update(url, latency)
+            state["consecutive_failures"] = 0
+            state["open_until"] = 0
+            state["cooldown"] = 0
+            state["entries"] = entries
+            state["last_success"] = int(time.time())
+            self._load_locked()[url] = state
+            self._dirty = True
+
+    def record_failure(self, url: str, latency: float, error: BaseException) -> None:
+        now = int(time.time())
+        with self._lock:
+            state = self._update(url, latency)
+            state["failures"] = state.get("failures", 0) + 1
+            state["consecutive_failures"] = state.get("consecutive_failures", 0) + 1
+            state["last_error"] = f"{type(error).__name__}: {error}"[:300]
+            state["last_error_at"] = now
+            if state["consecutive_failures"] >= FEED_BREAKER_THRESHOLD:
+                # 처음 열 때는 기본 대기 시간, 재시도도 실패하면 2배씩 늘림
+                cooldown = state.get("cooldown") or 0
+                cooldown = min(cooldown * 2 if cooldown else FEED_BREAKER_COOLDOWN, MAX_COOLDOWN)
+                state["cooldown"] = cooldown
+                state["open_until"] = now + cooldown
+                if cooldown == FEED_BREAKER_COOLDOWN:
+                    logger.warning(
+                        "피드 %d회 연속 실패 — %d분간 수집 중단: %s",
+                        state["consecutive_failures"], cooldown // 60, url,
+                    )
+            self._load_locked()[url] = state
+            self._dirty = True
+
+    def reset(self, url: Optional[str] = None) -> None:
+        """상태 기록 삭제 (url 없으면 전체). 차단된 피드도 다음 수집 때 다시 시도."""
+        with self._lock:
+            states = self._load_locked()
+            if url is None:
+                states.clear()
+            else:
+                states.pop(url, None)
+            self._dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        """변경된 상태를 디스크에 기록 (원자적 쓰기)."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty or self._state is None:
+                    return
+                text = dumps_json(self._state)
+                self._dirty = False
+            try:
+                atomic_write_text(self.path, text)
+            except OSError as e:
+                logger.warning("피드 상태 저장 실패 (%s): %s", self.path, e)
+
+    # ── 조회 ──
+
+    @staticmethod
+    def status(state: dict) -> str:
+        if state.get("open_until", 0) > time.time():
+            return STATUS_OPEN
+        if state.get("consecutive_failures"):
+            return STATUS_FAILING
+        if (state.get("latency_ms") or 0) >= FEED_SLOW_MS:
+            return STATUS_SLOW
+        return STATUS_OK
+
+    def report(self, urls: Optional[list[str]] = None) -> list[dict]:
+        """
+        피드별 상태 목록 (차단 → 실패 → 느림 → 정상, 같은 상태는 응답 시간 긴 순).
+        urls를 주면 해당 피드만 (기록 없는 피드 제외).
+        """
+        with self._lock:
+            states = {url: dict(s) for url, s in self._load_locked().items()}
+        rows = []
+        for url, state in states.items():
+            if urls is not None and url not in urls:
+                continue
+            rows.append({"url": url, "status": self.status(state), **state})
+        rows.sort(key=lambda r: (_STATUS_ORDER[r["status"]], -(r.get("latency_ms") or 0)))
+        return rows
+
+
+_default_health: Optional[FeedHealth] = None
+_default_lock = threading.Lock()
+
+
+def get_feed_health() -> FeedHealth:
+    """프로세스 전체에서 공유하는 기본 피드 상태 인스턴스."""
+    global _default_health
+    with _default_lock:
+        if _default_health is None:
+            _default_health = FeedHealth()
+        return _default_health
@@ -0,0 +1,197 @@
+"""RSS 피드별 적응형 수집 주기.
+
+피드마다 발행 간격이 크게 다르므로(하루 수십 건 ~ 한 달 한 건) 매 수집마다
+모든 피드를 요청하지 않고, 항목 발행 시각에서 피드별 발행 주기를 학습하여
+다음 수집 시각(next_due)을 정한다. 수집 시각이 되지 않은 피드는 기사 저장소에
+저장된 결과를 그대로 사용한다.
+
+- 발행 주기: 최근 항목 간 평균 간격을 수집할 때마다 지수이동평균으로 갱신
+- 다음 수집 간격: 발행 주기 × FEED_POLL_CADENCE_FACTOR (최소 ~ 최대 간격 사이)
+- 새 항목이 없으면 연속 횟수만큼 간격을 2배씩 늘리고, 새 항목이 보이면 원래 간격으로 복귀
+- 수집 실패 시 최소 간격에서 2배씩 늘려 재시도 (최대 간격까지)
+
+상태는 피드 URL 단위로 프로세스 전체에서 공유하며 .cache/feed_schedule.json에 보관한다.
+여러 분야에 같은 피드가 있으면 수집 구간 기록은 분야별이므로, 다른 분야는 수집 주기와 관계없이
+저장소에 없는 구간을 한 번 가져온다.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Iterable, Optional
+
+from config import (
+    FEED_POLL_CADENCE_FACTOR,
+    FEED_POLL_DEFAULT_INTERVAL,
+    FEED_POLL_MAX_INTERVAL,
+    FEED_POLL_MIN_INTERVAL,
+)
+from utils import atomic_write_text, dumps_json, loads_json
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_PATH = os.path.join(os.path.dirname(__file__), ".cache", "feed_schedule.json")
+
+CADENCE_SAMPLE = 20   # 발행 주기 추정에 쓰는 최근 항목 수
+CADENCE_ALPHA = 0.5   # 발행 주기 지수이동평균 가중치 (새 관측값)
+MAX_BACKOFF_STEPS = 5  # 새 항목 없음 / 실패 시 간격을 늘리는 최대 횟수 (2^5배)
+
+
+def _clamp_interval(seconds: float) -> int:
+    return int(min(max(seconds, FEED_POLL_MIN_INTERVAL), FEED_POLL_MAX_INTERVAL))
+
+
+def _observed_cadence(entry_times: list[int]) -> Optional[float]:
+    """최근 항목들의 평균 발행 간격 (초). 항목이 2개 미만이면 None."""
+    recent = sorted(set(entry_times), reverse=True)[:CADENCE_SAMPLE]
+    if len(recent) < 2:
+        return None
+    return max((recent[0] - recent[-1]) / (len(recent) - 1), 60.0)
+
+
+class FeedScheduler:
+    """피드별 수집 주기 상태 (스레드 안전, 변경분은 flush 시 디스크에 기록)."""
+
+    def __init__(self, path: str = SCHEDULE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 스냅샷과 파일 쓰기 순서 보장
+        self._state: Optional[dict[str, dict]] = None
+        self._dirty = False
+
+    def _load_locked(self) -> dict[str, dict]:
+        if self._state is None:
+            self._state = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._state = loads_json(f.read())
+                except (OSError, ValueError) as e:
+                    logger.warning("피드 수집 주기 읽기 실패 (%s): %s", self.path, e)
+        return self._state
+
+    # ── 조회 ──
+
+    def get(self, url: str) -> Optional[dict]:
+        with self._lock:
+            state = self._load_locked().get(url)
+            return dict(state) if state else None
+
+    def is_due(self, url: str, now: Optional[float] = None) -> bool:
+        """수집할 시각이 되었는지 (기록이 없는 피드는 항상 True)."""
+        state = self.get(url)
+        if state is None:
+            return True
+        return (now if now is not None else time.time()) >= state.get("next_due", 0)
+
+    def polled_until(self, url: str) -> Optional[int]:
+        """
+        수집 시각 전인 피드가 이미 반영된 것으로 볼 수 있는 시점 (마지막 성공 수집 시각).
+        수집 시각이 되었거나 기록이 없으면 None.
+        """
+        state = self.get(url)
+        if state is None or time.time() >= state.get("next_due", 0):
+            return None
+        return state.get("last_success")
+
+    def in_backoff(self, url: str) -> bool:
+        """최근 수집이 실패하여 재시도 대기 중인지."""
+        state = self.get(url)
+        return bool(state and state.get("errors") and time.time() < state.get("next_due", 0))
+
+    # ── 기록 ──
+
+    def record_poll(
+        self,
+        url: str,
+        entry_times: Iterable[int] = (),
+        error: Optional[BaseException] = None,
+        now: Optional[float] = None,
+    ) -> dict:
+        """
+        피드 수집 결과를 반영하여 다음 수집 시각을 정함.
+        entry_times: 날짜 필터 전 피드 전체 항목의 발행 시각 (Unix timestamp)
+        """
+        now = int(now if now is not None else time.time())
+        with self._lock:
+            states = self._load_locked()
+            state = dict(states.get(url) or {})
+            state["last_poll"] = now
+
+            if error is not None:
+                state["errors"] = min(state.get("errors", 0) + 1, MAX_BACKOFF_STEPS)
+                state["last_error"] = str(error)[:200]
+                interval = _clamp_interval(FEED_POLL_MIN_INTERVAL * 2 ** state["errors"])
+            else:
+                times = list(entry_times)
+                state["errors"] = 0
+                state.pop("last_error", None)
+                state["last_success"] = now
+
+                observed = _observed_cadence(times)
+                if observed is not None:
+                    previous = state.get("cadence")
+                    state["cadence"] = round(
+                        observed if previous is None
+                        else CADENCE_ALPHA * observed + (1 - CADENCE_ALPHA) * previous
+                    )
+
+                newest = max(times) if times else None
+                if newest is not None and newest > state.get("newest", 0):
+                    state["newest"] = newest
+                    state["idle"] = 0
+                else:
+                    state["idle"] = min(state.get("idle", 0) + 1, MAX_BACKOFF_STEPS)
+
+                cadence = state.get("cadence")
+                base = cadence * FEED_POLL_CADENCE_FACTOR if cadence else FEED_POLL_DEFAULT_INTERVAL
+                interval = _clamp_interval(base * 2 ** state["idle"])
+
+            state["interval"] = interval
+            state["next_due"] = now + interval
+            states[url] = state
+            self._dirty = True
+            return dict(state)
+
+    def flush(self) -> None:
+        """변경된 상태를 디스크에 기록 (원자적 쓰기)."""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty or self._state is None:
+                    return
+                text = dumps_json(self._state)
+                self._dirty = False
+            self._write(text)
+
+    def _write(self, text: str) -> None:
+        try:
+            atomic_write_text(self.path, text)
+        except OSError as e:
+            logger.warning("피드 수집 주기 저장 실패 (%s): %s", self.path, e)
+
+    def mark_due(self, urls: Optional[Iterable[str]] = None) -> None:
+        """
+        다음 수집 때 바로 가져오도록 수집 시각을 앞당김 (urls 없으면 전체).
+        학습한 발행 주기는 유지 ("새로 수집" 버튼 · batch_runner --refresh).
+        """
+        with self._lock:
+            states = self._load_locked()
+            for url in (list(states) if urls is None else urls):
+                if url in states:
+                    states[url] = {**states[url], "next_due": 0}
+                    self._dirty = True
+        self.flush()
+
+
+_default_scheduler: Optional[FeedScheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_feed_scheduler() -> FeedScheduler:
+    """프로세스 전체에서 공유하는 기본 수집 주기 인스턴스."""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = FeedScheduler()
+        return _default_scheduler
@@ -0,0 +1,161 @@
+"""RSS · Atom 피드 스트리밍 파서.
+
+feedparser는 피드 전체를 정규화(HTML 정리, 날짜 형식 추정 등)한 뒤에야 항목을 돌려주므로
+날짜 범위 밖 항목까지 모두 처리한다. 여기서는 ElementTree iterparse로 항목을 하나씩 읽어
+발행 시각만 먼저 계산하고, 나머지 필드(제목 · 링크 · 요약 · 출처 · 카테고리)는
+호출 측이 필요한 항목에 대해서만 꺼내도록 한다.
+
+RSS 2.0(<item>), RSS 1.0/RDF(<item>), Atom(<entry>)을 지원하며, XML 오류나 해석할 수 없는
+날짜 등 처리할 수 없는 피드는 FeedStreamError를 내므로 호출 측에서 feedparser로 다시 파싱한다.
+
+사용 예:
+    for entry in iter_entries(content):
+        if entry.published_ts < newer_than:
+            continue
+        fields = entry.fields()   # 다음 항목으로 넘어가기 전에 호출
+"""
+
+import calendar
+import datetime
+import email.utils
+import html
+import io
+import xml.etree.ElementTree as ET
+from typing import Iterator, Optional
+
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_FEED_ROOTS = frozenset(("rss", "feed", "RDF"))
+_ENTRY_TAGS = frozenset(("item", "entry"))
+
+# 발행 시각 요소 (feedparser와 같은 우선순위: 발행일 → 수정일)
+_PUBLISHED_TAGS = ("pubDate", "published", "issued")
+_UPDATED_TAGS = ("updated", "date", "modified")
+
+
+class FeedStreamError(Exception):
+    """스트리밍 파서로 처리할 수 없는 피드 (feedparser로 대체)."""
+
+
+def _local(tag) -> str:
+    if not isinstance(tag, str):
+        return ""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(elem: ET.Element) -> str:
+    return "".join(elem.itertext()).strip()
+
+
+def _markup(elem: ET.Element) -> str:
+    """
+    요소 내용을 HTML 문자열로 (feedparser와 같은 해석).
+    RSS 값과 Atom type="html"은 이미 HTML이고, Atom type="text"(Atom 기본값)와 "xhtml"은
+    문자 그대로의 텍스트이므로 escape한다 — 호출 측은 어느 경우든 태그 제거 후 엔티티를 풀면 된다.
+    """
+    default = "text" if elem.tag.startswith(_ATOM_NS) else "html"
+    kind = (elem.get("type") or default).lower()
+    text = _text(elem)
+    if kind in ("html", "text/html"):
+        return text
+    return html.escape(text, quote=False)
+
+
+def parse_timestamp(value: str) -> int:
+    """RFC 822(RSS) 또는 ISO 8601(Atom · dc:date) 날짜 문자열을 Unix timestamp로. 실패 시 FeedStreamError."""
+    value = value.strip()
+    if value[:4].isdigit():
+        try:
+            dt = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            raise FeedStreamError(f"날짜 형식 해석 불가: {value!r}")
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=datetime.timezone.utc)
+        return int(dt.timestamp())
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        raise FeedStreamError(f"날짜 형식 해석 불가: {value!r}")
+    if parsed[9] is None:
+        return int(calendar.timegm(parsed[:9]))
+    return int(email.utils.mktime_tz(parsed))
+
+
+class StreamEntry:
+    """피드 항목 하나 (발행 시각은 미리 계산, 나머지 필드는 fields()에서 추출)."""
+
+    __slots__ = ("published_ts", "_elem")
+
+    def __init__(self, elem: ET.Element):
+        self._elem = elem
+        self.published_ts = self._timestamp()
+
+    def _timestamp(self) -> Optional[int]:
+        found: dict[str, str] = {}
+        for child in self._elem:
+            name = _local(child.tag)
+            if name in _PUBLISHED_TAGS or name in _UPDATED_TAGS:
+                found.setdefault(name, child.text or "")
+        for name in _PUBLISHED_TAGS + _UPDATED_TAGS:
+            if found.get(name, "").strip():
+                return parse_timestamp(found[name])
+        return None
+
+    def fields(self) -> dict:
+        """
+        {title, link, summary, source, categories} — 제목 · 요약은 HTML 문자열
+        (태그 제거 · 엔티티 해제는 호출 측에서, _markup 참고).
+        """
+        title = link = source = ""
+        summary = content = ""
+        categories: list[str] = []
+        for child in self._elem:
+            name = _local(child.tag)
+            if name == "title" and not title:
+                title = _markup(child)
+            elif name == "link":
+                href = child.get("href")
+                if href is None:
+                    link = link or (child.text or "").strip()
+                elif child.get("rel", "alternate") == "alternate" and not link:
+                    link = href.strip()
+            elif name in ("description", "summary") and not summary:
+                summary = _markup(child)
+            elif name in ("content", "encoded") and not content:
+                content = _markup(child)
+            elif name == "source" and not source:
+                # RSS: <source url="...">언론사</source>, Atom: <source><title>언론사</title></source>
+                source_title = next((c for c in child if _local(c.tag) == "title"), None)
+                source = _text(source_title) if source_title is not None else (child.text or "").strip()
+            elif name in ("category", "subject"):  # dc:subject는 RSS 1.0 카테고리
+                term = child.get("term") or (child.text or "").strip()
+                if term:
+                    categories.append(term)
+        return {
+            "title": title,
+            "link": link,
+            "summary": summary or content,
+            "source": source,
+            "categories": categories,
+        }
+
+
+def iter_entries(content: bytes) -> Iterator[StreamEntry]:
+    """
+    피드 본문에서 항목을 문서 순서대로 하나씩 반환.
+    반환한 항목의 요소는 다음 항목을 읽을 때 해제되므로 fields()는 그 전에 호출해야 한다.
+    """
+    root = None
+    try:
+        for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+            if root is None:
+                root = elem
+                if _local(root.tag) not in _FEED_ROOTS:
+                    raise FeedStreamError(f"피드 형식이 아님: <{_local(root.tag)}>")
+                continue
+            if event != "end" or _local(elem.tag) not in _ENTRY_TAGS:
+                continue
+            yield StreamEntry(elem)
+            elem.clear()
+    except ET.ParseError as e:
+        raise FeedStreamError(f"XML 파싱 실패: {e}") from e
+    if root is None:
+        raise FeedStreamError("빈 피드")
@@ -0,0 +1,291 @@
+"""HTTP 요청 기록 / 재생 (네트워크 없는 재현 가능한 실행 · 벤치마크용).
+
+기록 모드에서는 실제 실행 중 나가는 모든 HTTP 요청과 응답을 카세트 파일(JSON Lines)에 남기고,
+재생 모드에서는 네트워크에 접속하지 않고 카세트의 응답을 돌려준다.
+
+requests.Session.send와 httpx.Client.send를 가로채므로 RSS 피드 · Google News 검색(rss_fetcher),
+Inoreader API(inoreader), 기사 본문(article_text.fetch_article_text), Google 번역(translate_ko),
+Gemini(google-genai, httpx 사용)까지 모두 기록 · 재생된다.
+
+- 요청 식별: 메서드 + URL(쿼리 정렬, 인증 파라미터 제거) + 본문 해시. 요청 헤더는 기록하지 않음
+- 같은 요청이 여러 번 기록되면 기록 순서대로 재생하고, 다 쓰면 마지막 응답을 반복
+- 카세트 첫 줄은 메타데이터(기록 시각, 실행 조건 등 호출 측이 넘긴 값)
+- 응답 본문은 그대로 저장되므로(Inoreader 토큰 응답 포함) 카세트는 저장소에 올리지 않는다
+
+환경변수로 켜기 (app.py · batch_runner.py 시작 시 install_from_env 호출):
+    HTTP_REPLAY_MODE=record HTTP_REPLAY_PATH=cassettes/week.jsonl python batch_runner.py
+    HTTP_REPLAY_MODE=replay HTTP_REPLAY_PATH=cassettes/week.jsonl streamlit run app.py
+
+코드에서:
+    with http_replay.HttpReplay("cassettes/week.jsonl", "replay"):
+        collect_folder(...)
+"""
+
+import base64
+import datetime
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config import HTTP_REPLAY_MODE, HTTP_REPLAY_PATH
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+# URL에서 제거하는 인증 관련 쿼리 파라미터 (카세트에 남기지 않음)
+_SECRET_PARAMS = frozenset(("key", "api_key", "access_token", "appkey", "appid", "client_secret", "token"))
+
+# 본문을 디코딩해 저장하므로 재생 시 의미가 달라지는 응답 헤더는 제외
+_DROPPED_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding", "connection"))
+
+
+class ReplayMissError(Exception):
+    """재생 모드에서 카세트에 없는 요청."""
+
+
+def request_key(method: str, url: str, body: Optional[bytes]) -> str:
+    """요청 식별 키 (메서드, 인증 파라미터를 뺀 정렬 URL, 본문 SHA-1)."""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _SECRET_PARAMS
+    )
+    normalized = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+    digest = hashlib.sha1(body).hexdigest() if body else ""
+    return f"{method.upper()} {normalized} {digest}"
+
+
+def _body_bytes(body) -> Optional[bytes]:
+    if body is None:
+        return None
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body)
+    return None  # 스트리밍 본문은 식별에 쓰지 않음
+
+
+def _kept_headers(headers) -> dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS}
+
+
+class Cassette:
+    """카세트 파일 (JSON Lines: 첫 줄 메타데이터, 이후 요청별 응답)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.meta: dict = {}
+        self._entries: dict[str, list[dict]] = {}
+        self._cursor: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    # ── 기록 ──
+
+    def start_recording(self, meta: Optional[dict] = None) -> None:
+        """빈 카세트를 만들고 메타데이터 기록."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.meta = {"recorded_at": datetime.datetime.now().isoformat(timespec="seconds"), **(meta or {})}
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"meta": self.meta}, ensure_ascii=False, default=str) + "\n")
+
+    def append(self, key: str, status: int, reason: str, headers: dict, content: bytes, elapsed: float) -> None:
+        entry = {
+            "key": key,
+            "status": status,
+            "reason": reason,
+            "headers": headers,
+            "content": base64.b64encode(content).decode("ascii"),
+            "elapsed": round(elapsed, 4),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    # ── 재생 ──
+
+    def load(self) -> "Cassette":
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if "meta" in record:
+                    self.meta = record["meta"]
+                else:
+                    self._entries.setdefault(record["key"], []).append(record)
+        return self
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._entries.values())
+
+    def next_response(self, key: str) -> Optional[dict]:
+        """기록 순서대로 응답 반환 (다 쓰면 마지막 응답 반복). 없으면 None."""
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            return entries[min(index, len(entries) - 1)]
+
+
+class HttpReplay:
+    """requests · httpx 전송 계층을 가로채 기록하거나 재생하는 컨텍스트 관리자."""
+
+    def __init__(
+        self,
+        path: str,
+        mode: str,
+        meta: Optional[dict] = None,
+        strict: bool = True,
+        simulate_latency: bool = False,
+    ):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"알 수 없는 모드: {mode}")
+        self.mode = mode
+        self.cassette = Cassette(path)
+        self.meta = meta
+        self.strict = strict
+        self.simulate_latency = simulate_latency
+        self.misses: list[str] = []
+        self._patches: list[tuple[type, str, object]] = []
+
+    # ── 설치 / 해제 ──
+
+    def start(self) -> "HttpReplay":
+        if self.mode == RECORD:
+            self.cassette.start_recording(self.meta)
+        else:
+            self.cassette.load()
+            logger.info("HTTP 재생: %s (%d건)", self.cassette.path, len(self.cassette))
+        self._patch_requests()
+        self._patch_httpx()
+        return self
+
+    def stop(self) -> None:
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+        if self.misses:
+            logger.warning("HTTP 재생: 카세트에 없는 요청 %d건", len(self.misses))
+
+    def __enter__(self) -> "HttpReplay":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _miss(self, key: str) -> None:
+        self.misses.append(key)
+        logger.warning("HTTP 재생: 기록 없음 — %s", key)
+
+    def _wait(self, entry: dict) -> None:
+        if self.simulate_latency and entry.get("elapsed"):
+            time.sleep(entry["elapsed"])
+
+    # ── requests ──
+
+    def _patch_requests(self) -> None:
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        original = requests.Session.send
+        replay = self
+
+        def send(session, request, **kwargs):
+            key = request_key(request.method, request.url, _body_bytes(request.body))
+            if replay.mode == RECORD:
+                started = time.perf_counter()
+                response = original(session, request, **kwargs)
+                content = response.content
+                replay.cassette.append(
+                    key, response.status_code, response.reason or "",
+                    _kept_headers(response.headers), content, time.perf_counter() - started,
+                )
+                return response
+
+            entry = replay.cassette.next_response(key)
+            if entry is None:
+                replay._miss(key)
+                if replay.strict:
+                    raise requests.ConnectionError(ReplayMissError(key), request=request)
+                return original(session, request, **kwargs)
+            replay._wait(entry)
+            response = requests.Response()
+            response.status_code = entry["status"]
+            response.reason = entry.get("reason", "")
+            response.headers = CaseInsensitiveDict(entry["headers"])
+            response._content = base64.b64decode(entry["content"])
+            response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+            response.url = request.url
+            response.request = request
+            response.elapsed = datetime.timedelta(seconds=entry.get("elapsed", 0.0))
+            return response
+
+        self._patches.append((requests.Session, "send", original))
+        requests.Session.send = send
+
+    # ── httpx (google-genai) ──
+
+    def _patch_httpx(self) -> None:
+        try:
+            import httpx
+        except ImportError:
+            return
+
+        original = httpx.Client.send
+        replay = self
+
+        def send(client, request, **kwargs):
+            key = request_key(request.method, str(request.url), request.read())
+            if replay.mode == RECORD:
+                started = time.perf_counter()
+                response = original(client, request, **kwargs)
+                content = response.read()
+                replay.cassette.append(
+                    key, response.status_code, response.reason_phrase or "",
+                    _kept_headers(response.headers), content, time.perf_counter() - started,
+                )
+                return response
+
+            entry = replay.cassette.next_response(key)
+            if entry is None:
+                replay._miss(key)
+                if replay.strict:
+                    raise httpx.ConnectError(f"재생 기록 없음: {key}", request=request)
+                return original(client, request, **kwargs)
+            replay._wait(entry)
+            return httpx.Response(
+                entry["status"],
+                headers=entry["headers"],
+                content=base64.b64decode(entry["content"]),
+                request=request,
+            )
+
+        self._patches.append((httpx.Client, "send", original))
+        httpx.Client.send = send
+
+
+_installed: Optional[HttpReplay] = None
+_install_lock = threading.Lock()
+
+
+def install_from_env() -> Optional[HttpReplay]:
+    """HTTP_REPLAY_MODE · HTTP_REPLAY_PATH 환경변수가 있으면 프로세스 전체에 한 번 설치."""
+    global _installed
+    if HTTP_REPLAY_MODE not in (RECORD, REPLAY) or not HTTP_REPLAY_PATH:
+        return None
+    with _install_lock:
+        if _installed is None:
+            _installed = HttpReplay(HTTP_REPLAY_PATH, HTTP_REPLAY_MODE).start()
+            logger.info("HTTP %s 모드: %s", HTTP_REPLAY_MODE, HTTP_REPLAY_PATH)
+        return _installed
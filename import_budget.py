@@ -0,0 +1,105 @@
+"""모듈 임포트 시간 예산 점검 (시작 시간 회귀 방지).
+
+각 진입 모듈을 새 인터프리터에서 `python -X importtime`으로 불러와
+누적 임포트 시간이 예산을 넘거나, 첫 사용 시 불러오도록 미뤄 둔 무거운 의존성
+(pandas · requests · BeautifulSoup · deep_translator · feedparser · google-genai 등)이
+임포트 시점에 로드되면 실패(종료 코드 1)한다. tests/test_import_budget.py가 pytest로 같은 점검을 실행한다.
+
+사용 예:
+    python import_budget.py                    # 기본 예산으로 전체 점검
+    python import_budget.py --budget-ms 300    # 예산 조정
+    python import_budget.py collector scorer   # 일부 모듈만
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Optional
+
+# 진입 모듈 → 누적 임포트 시간 예산 (ms). Streamlit 앱 자체는 streamlit 로드가 필수라 제외.
+DEFAULT_BUDGETS_MS = {
+    "batch_runner": 250,
+    "collector": 250,
+    "exporters": 250,
+    "scorer": 150,
+    "settings_manager": 150,
+    "article_text": 150,
+    "rss_fetcher": 150,
+    "llm_scorer": 150,
+}
+
+# 임포트 시점에 로드되면 안 되는 모듈 (첫 사용 시 로드)
+DEFERRED_MODULES = (
+    "pandas",
+    "streamlit",
+    "requests",
+    "bs4",
+    "deep_translator",
+    "feedparser",
+    "google.genai",
+    "xlsxwriter",
+)
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """새 인터프리터에서 모듈을 불러와 (누적 임포트 시간 ms, 로드된 지연 대상 모듈) 반환."""
+    probe = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True, check=True, cwd=PROJECT_DIR,
+    )
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        # 들여쓰기 없는 줄이 최상위 임포트 (site 등 인터프리터 시작분은 제외)
+        if match and len(match.group(3)) <= 1 and match.group(4) == module:
+            cumulative_us = int(match.group(2))
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return cumulative_us / 1000, loaded
+
+
+def check(budgets: dict[str, float], repeat: int = 3) -> list[str]:
+    """예산 초과·지연 대상 로드 목록 반환 (없으면 통과). 시간은 repeat회 중 최솟값."""
+    failures = []
+    for module, budget_ms in budgets.items():
+        runs = [measure(module) for _ in range(max(repeat, 1))]
+        elapsed_ms = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        status = "OK" if elapsed_ms <= budget_ms and not loaded else "FAIL"
+        print(f"{status:4} {module:20} {elapsed_ms:8.1f} ms (예산 {budget_ms:.0f} ms)")
+        if elapsed_ms > budget_ms:
+            failures.append(f"{module}: {elapsed_ms:.1f} ms > 예산 {budget_ms:.0f} ms")
+        if loaded:
+            failures.append(f"{module}: 임포트 시점에 로드됨 — {', '.join(loaded)}")
+    return failures
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="모듈 임포트 시간 예산 점검")
+    parser.add_argument("modules", nargs="*", help="점검할 모듈 (기본: 전체 진입 모듈)")
+    parser.add_argument("--budget-ms", type=float, help="모든 모듈에 같은 예산 적용 (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="모듈별 측정 횟수 (최솟값 사용)")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or list(DEFAULT_BUDGETS_MS)
+    budgets = {
+        m: args.budget_ms if args.budget_ms is not None else DEFAULT_BUDGETS_MS.get(m, 250)
+        for m in modules
+    }
+    failures = check(budgets, args.repeat)
+    for failure in failures:
+        print(f"실패: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,32 @@
+import contextvars
 import json
+import threading
 import time
 import urllib.parse
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 import requests
+import requests.adapters
 import streamlit as st
 
+import limiters
+from article import Article
 from config import (
     INOREADER_APP_ID,
     INOREADER_APP_KEY,
     INOREADER_AUTH_URL,
     INOREADER_BASE_URL,
+    INOREADER_MAX_CONCURRENCY,
+    INOREADER_QUOTA_RESERVE,
     INOREADER_REDIRECT_URI,
     INOREADER_SCOPE,
     INOREADER_TOKEN_URL,
     TOKEN_FILE,
 )
+from url_canon import clean_url
 from utils import strip_html_tags
 
 
@@ -124,6 +133,121 @@ def logout() -> None:
 
 # ── API 호출 ──────────────────────────────────────────────────
 
+# 응답 헤더로 알려 주는 앱별 사용량 (Zone 1: 읽기, Zone 2: 쓰기 · 태그 변경)
+_ZONE_HEADERS = {
+    1: ("X-Reader-Zone1-Usage", "X-Reader-Zone1-Limit"),
+    2: ("X-Reader-Zone2-Usage", "X-Reader-Zone2-Limit"),
+}
+_RESET_HEADER = "X-Reader-Limits-Reset-After"
+_DEFAULT_RESET_SECONDS = 60  # 한도 도달 시 초기화 시각을 모를 때 쉬는 시간
+
+
+class RateLimitExceeded(Exception):
+    """Inoreader 앱 사용량 한도 도달 — reset_at(Unix timestamp)까지 요청하지 않음."""
+
+    def __init__(self, zone: int, reset_at: float):
+        self.zone = zone
+        self.reset_at = reset_at
+        remaining = max(0, int(reset_at - time.time()))
+        super().__init__(f"Inoreader Zone {zone} 사용량 한도 도달 ({remaining}초 후 초기화)")
+
+
+def _reset_after(headers) -> Optional[float]:
+    """초기화까지 남은 초 (헤더가 없거나 0 이하면 None)."""
+    try:
+        reset_after = float(headers.get(_RESET_HEADER) or 0)
+    except ValueError:
+        return None
+    return reset_after if reset_after > 0 else None
+
+
+class RateLimitTracker:
+    """응답 헤더로 받은 Zone별 사용량 · 한도 · 초기화 시각 (스레드 안전)."""
+
+    def __init__(self, reserve: int = INOREADER_QUOTA_RESERVE):
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._zones: dict[int, dict] = {}
+
+    def update(self, headers) -> None:
+        """
+        응답 헤더의 사용량으로 갱신 (헤더가 없으면 그대로).
+        초기화 시각 헤더가 없으면 이전에 받은 초기화 시각을 유지한다.
+        """
+        reset_after = _reset_after(headers)
+        reset_at = time.time() + reset_after if reset_after is not None else None
+        with self._lock:
+            for zone, (usage_key, limit_key) in _ZONE_HEADERS.items():
+                try:
+                    usage = int(headers[usage_key])
+                    limit = int(headers[limit_key])
+                except (KeyError, ValueError):
+                    continue
+                previous = self._zones.get(zone, {}).get("reset_at")
+                self._zones[zone] = {
+                    "usage": usage, "limit": limit,
+                    "reset_at": reset_at if reset_at is not None else previous,
+                }
+
+    def exhausted(self, zone: int, reset_at: Optional[float] = None) -> None:
+        """429 응답 — 헤더와 관계없이 초기화 시각까지 한도 도달로 표시."""
+        with self._lock:
+            state = self._zones.setdefault(zone, {"usage": 0, "limit": 0})
+            state["usage"] = max(state["usage"], state["limit"])
+            state["reset_at"] = reset_at or time.time() + _DEFAULT_RESET_SECONDS
+
+    def acquire(self, zone: int = 1) -> None:
+        """
+        요청 하나를 보내기 전에 호출 — 한도까지 reserve 이하로 남았으면 RateLimitExceeded.
+        응답 전에 동시에 나가는 요청이 한도를 넘지 않도록 사용량을 미리 하나 올려 둔다
+        (응답 헤더가 오면 서버 값으로 덮어씀).
+        """
+        with self._lock:
+            state = self._zones.get(zone)
+            if state is None:
+                return
+            now = time.time()
+            if state["reset_at"] is not None and now >= state["reset_at"]:
+                del self._zones[zone]  # 초기화 시각이 지났으면 다음 응답 헤더로 다시 확인
+                return
+            if state["usage"] + self.reserve >= state["limit"]:
+                if state["reset_at"] is None:
+                    # 초기화 시각을 모르면 기본 시간만큼 쉰 뒤 다시 확인
+                    state["reset_at"] = now + _DEFAULT_RESET_SECONDS
+                raise RateLimitExceeded(zone, state["reset_at"])
+            state["usage"] += 1
+
+    def reset_at(self, zone: int = 1) -> Optional[float]:
+        with self._lock:
+            state = self._zones.get(zone)
+            return state["reset_at"] if state else None
+
+    def snapshot(self) -> dict[int, dict]:
+        """{zone: {usage, limit, reset_at}} — 상태 표시용 사본."""
+        with self._lock:
+            return {zone: dict(state) for zone, state in self._zones.items()}
+
+
+rate_limits = RateLimitTracker()
+
+_session_obj: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _session() -> requests.Session:
+    """API 요청이 함께 쓰는 연결 풀 세션 (keep-alive, 동시 요청 수만큼 연결 유지)."""
+    global _session_obj
+    with _session_lock:
+        if _session_obj is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=INOREADER_MAX_CONCURRENCY,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session_obj = session
+        return _session_obj
+
 
 def _get_headers(access_token: str) -> dict:
     return {
@@ -133,14 +257,147 @@ def _get_headers(access_token: str) -> dict:
     }
 
 
+def _request(method: str, endpoint: str, access_token: str, zone: int = 1, **kwargs) -> dict:
+    """
+    InnoReader API 요청 (공유 세션, 동시 요청 수 제한, 앱 사용량 확인).
+    사용량 한도에 가까우면 요청하지 않고 RateLimitExceeded.
+    """
+    rate_limits.acquire(zone)
+    with limiters.inoreader():
+        resp = _session().request(
+            method, f"{INOREADER_BASE_URL}{endpoint}",
+            headers=_get_headers(access_token), timeout=30, **kwargs,
+        )
+    rate_limits.update(resp.headers)
+    if resp.status_code == 429:
+        reset_after = _reset_after(resp.headers)
+        rate_limits.exhausted(zone, time.time() + reset_after if reset_after is not None else None)
+        raise RateLimitExceeded(zone, rate_limits.reset_at(zone))
+    resp.raise_for_status()
+    return resp.json()
+
+
 def _get(endpoint: str, access_token: str, params: Optional[dict] = None) -> dict:
     """InnoReader API GET 요청."""
-    url = f"{INOREADER_BASE_URL}{endpoint}"
-    resp = requests.get(
-        url, headers=_get_headers(access_token), params=params, timeout=30
+    return _request("GET", endpoint, access_token, params=params)
+
+
+def _post(endpoint: str, access_token: str, data) -> dict:
+    """InnoReader API POST 요청 (form 본문, 같은 키 반복은 (키, 값) 리스트로)."""
+    return _request("POST", endpoint, access_token, data=data)
+
+
+def _prefetched(fetch_page: Callable[[Optional[str]], dict]) -> Iterator[dict]:
+    """
+    continuation 페이지를 차례로 반환하되, 호출 측이 현재 페이지를 처리하는 동안
+    다음 페이지를 미리 요청해 둔다. fetch_page(continuation) -> 응답 dict
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="inoreader-prefetch") as pool:
+        future = pool.submit(contextvars.copy_context().run, fetch_page, None)
+        while future is not None:
+            page = future.result()
+            continuation = page.get("continuation")
+            future = (
+                pool.submit(contextvars.copy_context().run, fetch_page, continuation)
+                if continuation else None
+            )
+            yield page
+
+
+def _stream_path(kind: str, stream_id: str) -> str:
+    return f"/reader/api/0/stream/{kind}/{requests.utils.quote(stream_id, safe='')}"
+
+
+def _stream_params(count: int, newer_than: Optional[int], older_than: Optional[int], continuation: Optional[str]) -> dict:
+    params: dict = {"n": count}
+    if continuation:
+        params["c"] = continuation
+    if newer_than is not None:
+        params["ot"] = newer_than
+    if older_than is not None:
+        params["nt"] = older_than
+    return params
+
+
+def long_item_id(item_id: str) -> str:
+    """item ID를 stream/contents 응답과 같은 긴 형식으로 (stream/items/ids는 10진수 ID를 돌려줌)."""
+    if item_id.startswith("tag:"):
+        return item_id
+    return f"tag:google.com,2005:reader/item/{int(item_id):016x}"
+
+
+def _parse_item(item: dict) -> Article:
+    """API 응답 항목 하나를 Article로 변환."""
+    canonical = item.get("canonical", [{}])
+    url = canonical[0].get("href", "") if canonical else ""
+    published_ts = item.get("published", 0)
+    # 다른 수집 경로(rss_fetcher)와 같이 UTC 기준 naive datetime
+    published_dt = datetime.fromtimestamp(published_ts, timezone.utc).replace(tzinfo=None) if published_ts else None
+    summary_html = item.get("summary", {}).get("content", "")
+
+    categories = []
+    for c in item.get("categories", []):
+        label = c.rsplit("/", 1)[-1] if "/" in c else c
+        if label not in ("read", "reading-list", "starred"):
+            categories.append(label)
+
+    return Article(
+        title=item.get("title", ""),
+        url=clean_url(url),
+        source=item.get("origin", {}).get("title", ""),
+        published=published_dt,
+        summary=strip_html_tags(summary_html),
+        categories=", ".join(categories),
     )
-    resp.raise_for_status()
-    return resp.json()
+
+
+def iter_stream_pages(
+    access_token: str,
+    stream_id: str,
+    newer_than: Optional[int] = None,
+    older_than: Optional[int] = None,
+    page_size: int = 100,
+) -> Iterator[list[tuple[str, Article]]]:
+    """
+    스트림 본문을 최신순 페이지 단위로 반환 (stream/contents, 한 번에 최대 100개).
+    각 페이지는 [(ID, Article), ...]. 반복을 멈추면 더 요청하지 않음 (미리 받던 한 페이지 제외).
+    """
+    path = _stream_path("contents", stream_id)
+    size = min(page_size, 100)
+    for data in _prefetched(
+        lambda c: _get(path, access_token, _stream_params(size, newer_than, older_than, c))
+    ):
+        yield [(item.get("id", ""), _parse_item(item)) for item in data.get("items", [])]
+
+
+def iter_item_ids(
+    access_token: str,
+    stream_id: str,
+    newer_than: Optional[int] = None,
+    older_than: Optional[int] = None,
+    page_size: int = 1000,
+) -> Iterator[list[dict]]:
+    """
+    스트림의 item ID를 페이지 단위로 반환 (stream/items/ids, 한 번에 최대 1000개).
+    각 페이지는 [{"id": 10진수 ID, "timestampUsec": ...}, ...]
+    """
+    path = _stream_path("items/ids", stream_id)
+    size = min(page_size, 1000)
+    for data in _prefetched(
+        lambda c: _get(path, access_token, _stream_params(size, newer_than, older_than, c))
+    ):
+        yield data.get("itemRefs", [])
+
+
+def get_items_contents(access_token: str, item_ids: list[str]) -> list[tuple[str, Article]]:
+    """item ID 목록의 본문을 한 번에 조회 (stream/items/contents). [(긴 형식 ID, Article), ...]"""
+    if not item_ids:
+        return []
+    data = _post(
+        "/reader/api/0/stream/items/contents", access_token,
+        [("i", long_item_id(i)) for i in item_ids],
+    )
+    return [(item.get("id", ""), _parse_item(item)) for item in data.get("items", [])]
 
 
 @st.cache_data(ttl=600)
@@ -184,53 +441,12 @@ def fetch_articles(
 ) -> list[dict]:
     """
     특정 스트림(피드)의 기사 목록 조회.
-    페이지네이션(continuation)을 통해 count만큼 수집.
+    페이지네이션(continuation)을 통해 count만큼 수집 (현재 페이지를 처리하는 동안 다음 페이지를 미리 요청).
+    같은 스트림을 반복 조회할 때는 새 항목만 받는 inoreader_sync를 사용.
     """
-    articles: list[dict] = []
-    continuation: Optional[str] = None
-
-    while len(articles) < count:
-        params: dict = {"n": min(100, count - len(articles))}
-        if continuation:
-            params["c"] = continuation
-        if newer_than is not None:
-            params["ot"] = newer_than
-        if older_than is not None:
-            params["nt"] = older_than
-
-        encoded_id = requests.utils.quote(stream_id, safe="")
-        data = _get(
-            f"/reader/api/0/stream/contents/{encoded_id}", access_token, params
-        )
-
-        for item in data.get("items", []):
-            canonical = item.get("canonical", [{}])
-            url = canonical[0].get("href", "") if canonical else ""
-            published_ts = item.get("published", 0)
-            published_dt = (
-                datetime.fromtimestamp(published_ts) if published_ts else None
-            )
-            summary_html = item.get("summary", {}).get("content", "")
-
-            categories = []
-            for c in item.get("categories", []):
-                label = c.rsplit("/", 1)[-1] if "/" in c else c
-                if label not in ("read", "reading-list", "starred"):
-                    categories.append(label)
-
-            articles.append(
-                {
-                    "title": item.get("title", ""),
-                    "url": url,
-                    "source": item.get("origin", {}).get("title", ""),
-                    "published": published_dt,
-                    "summary": strip_html_tags(summary_html),
-                    "categories": ", ".join(categories),
-                }
-            )
-
-        continuation = data.get("continuation")
-        if not continuation:
+    articles: list[Article] = []
+    for page in iter_stream_pages(access_token, stream_id, newer_than, older_than, min(count, 100)):
+        articles.extend(article for _item_id, article in page)
+        if len(articles) >= count:
             break
-
     return articles[:count]
@@ -0,0 +1,310 @@
+"""Inoreader 스트림 증분 동기화 (로컬 기사 저장소로).
+
+inoreader.fetch_articles는 호출할 때마다 stream/contents를 처음부터 페이지 단위(최대 100개)로
+다시 가져온다. 여기서는 스트림별로 이미 받은 구간의 최신 시각(high-water mark, ot)과
+최근 item ID를 기록해 두고, 다음 동기화 때는 그 이후의 새 항목만 가져와 기사 저장소에 더한다.
+
+- 새 항목 확인: stream/items/ids (ID만, 한 번에 최대 1000개) — 새 항목이 없으면 요청 한 번으로 끝
+- 본문 조회: 처음 보는 ID만 stream/items/contents로 묶어서 조회
+- ID 엔드포인트를 쓸 수 없는 스트림은 stream/contents 페이지를 이미 받은 항목이 나올 때까지만 조회
+- 요청 범위가 이전 동기화 시작점보다 과거로 넓어지면 그 구간만 추가로 받음
+- 여러 스트림은 sync_many로 동시에 동기화 (API 요청은 inoreader 모듈의 공유 세션 ·
+  동시 요청 수 제한 · 앱 사용량 한도를 함께 따름)
+
+기사는 ArticleStore에 분야 "inoreader:<스트림 ID>"로 저장되며,
+동기화 상태는 .cache/inoreader_sync.json에 보관한다.
+
+사용 예:
+    sync = get_inoreader_sync()
+    sync.sync(token, "user/-/label/제약")
+    sync.sync_many(token, ["user/-/label/제약", "user/-/label/바이오"])
+    articles = sync.load("user/-/label/제약", newer_than, older_than)
+"""
+
+import calendar
+import contextvars
+import datetime
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
+
+import requests
+
+import inoreader
+import perf
+from article import Article
+from article_store import ArticleStore, get_article_store
+from config import INOREADER_MAX_CONCURRENCY
+from utils import atomic_write_text, dumps_json, loads_json
+
+logger = logging.getLogger(__name__)
+
+SYNC_PATH = os.path.join(os.path.dirname(__file__), ".cache", "inoreader_sync.json")
+
+INITIAL_SYNC_DAYS = 30   # 처음 동기화할 때 가져오는 기간 (newer_than을 주지 않은 경우)
+IDS_PAGE_SIZE = 1000     # stream/items/ids 한 번에 받는 ID 수 (API 최대)
+CONTENTS_BATCH = 100     # stream/items/contents 한 번에 조회하는 항목 수
+OVERLAP_SECONDS = 60     # high-water mark 경계의 항목을 놓치지 않도록 겹쳐서 조회 (ID로 중복 제거)
+MAX_KNOWN_IDS = 5000     # 스트림별로 기억하는 최근 item ID 수
+
+# 이 상태 코드면 ID 엔드포인트를 지원하지 않는 것으로 보고 stream/contents로 대체
+_IDS_UNSUPPORTED = frozenset((400, 404, 405, 501))
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def stream_folder(stream_id: str) -> str:
+    """스트림 기사를 저장하는 기사 저장소 분야 이름."""
+    return f"inoreader:{stream_id}"
+
+
+def stream_source(stream_id: str) -> str:
+    """기사 저장소 소스 키."""
+    return f"inoreader:{stream_id}"
+
+
+class InoreaderSync:
+    """스트림별 증분 동기화 상태 (스레드 안전, 동기화가 끝날 때마다 디스크에 기록)."""
+
+    def __init__(self, store: Optional[ArticleStore] = None, path: str = SYNC_PATH):
+        self.store = store
+        self.path = path
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # 스냅샷과 파일 쓰기 순서 보장
+        self._state: Optional[dict[str, dict]] = None
+
+    def _store(self) -> ArticleStore:
+        return self.store or get_article_store()
+
+    # ── 상태 파일 ──
+
+    def _load_locked(self) -> dict[str, dict]:
+        if self._state is None:
+            self._state = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._state = loads_json(f.read())
+                except (OSError, ValueError) as e:
+                    logger.warning("Inoreader 동기화 상태 읽기 실패 (%s): %s", self.path, e)
+        return self._state
+
+    def state(self, stream_id: str) -> dict:
+        with self._lock:
+            return dict(self._load_locked().get(stream_id) or {})
+
+    def _persist(self) -> None:
+        """현재 상태를 디스크에 기록 (원자적 쓰기)."""
+        with self._write_lock:
+            with self._lock:
+                text = dumps_json(self._load_locked())
+            try:
+                atomic_write_text(self.path, text)
+            except OSError as e:
+                logger.warning("Inoreader 동기화 상태 저장 실패 (%s): %s", self.path, e)
+
+    def _save_state(self, stream_id: str, state: dict) -> None:
+        with self._lock:
+            self._load_locked()[stream_id] = state
+        self._persist()
+
+    def reset(self, stream_id: Optional[str] = None) -> None:
+        """동기화 기록과 저장 기사 삭제 (stream_id 없으면 전체). 다음 동기화 때 처음부터 받음."""
+        with self._lock:
+            states = self._load_locked()
+            stream_ids = list(states) if stream_id is None else [stream_id]
+            for sid in stream_ids:
+                states.pop(sid, None)
+        for sid in stream_ids:
+            self._store().invalidate(stream_folder(sid))
+        self._persist()
+
+    # ── 동기화 ──
+
+    def _fetch_by_ids(
+        self, access_token: str, stream_id: str, lo: int, hi: Optional[int], known: set[str], report: dict,
+    ) -> tuple[list[tuple[str, Article]], Optional[int]]:
+        """stream/items/ids로 새 ID를 찾고 본문은 stream/items/contents로 묶어서 동시에 조회."""
+        refs: list[dict] = []
+        for page in inoreader.iter_item_ids(access_token, stream_id, lo, hi, IDS_PAGE_SIZE):
+            report["requests"] += 1
+            refs.extend(page)
+
+        high = max((int(r.get("timestampUsec", 0)) // 1_000_000 for r in refs), default=None)
+        new_ids = list(dict.fromkeys(
+            item_id for item_id in (inoreader.long_item_id(r["id"]) for r in refs if r.get("id"))
+            if item_id not in known
+        ))
+        batches = [new_ids[i:i + CONTENTS_BATCH] for i in range(0, len(new_ids), CONTENTS_BATCH)]
+        if not batches:
+            return [], high
+        report["requests"] += len(batches)
+        with ThreadPoolExecutor(
+            max_workers=min(INOREADER_MAX_CONCURRENCY, len(batches)), thread_name_prefix="inoreader-contents",
+        ) as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, inoreader.get_items_contents, access_token, batch)
+                for batch in batches
+            ]
+            items = [item for future in futures for item in future.result()]
+        return items, high
+
+    def _fetch_by_pages(
+        self, access_token: str, stream_id: str, lo: int, hi: Optional[int], known: set[str], report: dict,
+    ) -> tuple[list[tuple[str, Article]], Optional[int]]:
+        """stream/contents 페이지를 최신순으로 받되, 모두 이미 받은 항목인 페이지가 나오면 멈춤."""
+        items: list[tuple[str, Article]] = []
+        high: Optional[int] = None
+        for page in inoreader.iter_stream_pages(access_token, stream_id, lo, hi, 100):
+            report["requests"] += 1
+            fresh = [(item_id, art) for item_id, art in page if item_id not in known]
+            items.extend(fresh)
+            for _item_id, art in page:
+                published = art.get("published")
+                if published is not None:
+                    ts = int(calendar.timegm(published.timetuple()))
+                    high = ts if high is None else max(high, ts)
+            if page and not fresh:
+                break
+        return items, high
+
+    def sync(self, access_token: str, stream_id: str, newer_than: Optional[int] = None) -> dict:
+        """
+        스트림의 새 항목만 받아 기사 저장소에 더함.
+        newer_than: 이 시각 이후 항목이 저장소에 있도록 보장
+            (없으면 이전 동기화 범위 유지, 처음이면 최근 INITIAL_SYNC_DAYS일)
+        Returns: {stream_id, new, requests, high_water}
+        """
+        now = int(time.time())
+        state = self.state(stream_id)
+        if newer_than is not None:
+            since = newer_than
+        else:
+            since = state.get("since", now - INITIAL_SYNC_DAYS * 86400)
+        known = set(state.get("ids", []))
+        report = {"stream_id": stream_id, "new": 0, "requests": 0}
+
+        ranges: list[tuple[int, Optional[int]]] = []
+        if not state:
+            ranges.append((since, None))
+        else:
+            if since < state["since"]:
+                ranges.append((since, state["since"]))  # 과거 구간 추가 동기화
+            ranges.append((max(state["ot"] - OVERLAP_SECONDS, 0), None))
+
+        use_ids = state.get("ids_api", True)
+        fetched: list[tuple[str, Article]] = []
+        high_water = state.get("ot", since)
+        with perf.stage("inoreader.sync") as span:
+            for lo, hi in ranges:
+                if use_ids:
+                    try:
+                        items, high = self._fetch_by_ids(access_token, stream_id, lo, hi, known, report)
+                    except requests.HTTPError as e:
+                        status = e.response.status_code if e.response is not None else None
+                        if status not in _IDS_UNSUPPORTED:
+                            raise
+                        logger.info("Inoreader ID 조회 미지원 스트림 (%s, %s) — stream/contents 사용", stream_id, status)
+                        use_ids = False
+                        items, high = self._fetch_by_pages(access_token, stream_id, lo, hi, known, report)
+                else:
+                    items, high = self._fetch_by_pages(access_token, stream_id, lo, hi, known, report)
+                for item_id, art in items:
+                    if item_id not in known:
+                        known.add(item_id)
+                        fetched.append((item_id, art))
+                if high is not None and hi is None:
+                    high_water = max(high_water, high)
+            span.items = len(fetched)
+
+        store = self._store()
+        if fetched:
+            store.add(stream_folder(stream_id), stream_source(stream_id), [art for _id, art in fetched])
+        store.mark_covered(stream_folder(stream_id), stream_source(stream_id), min(since, state.get("since", since)), now)
+
+        ids = state.get("ids", []) + [item_id for item_id, _art in fetched]
+        self._save_state(stream_id, {
+            "since": min(since, state.get("since", since)),
+            "ot": high_water,
+            "ids": ids[-MAX_KNOWN_IDS:],
+            "ids_api": use_ids,
+            "synced_at": now,
+        })
+        report["new"] = len(fetched)
+        report["high_water"] = high_water
+        logger.debug("Inoreader 동기화 %s: 새 항목 %d건, 요청 %d회", stream_id, report["new"], report["requests"])
+        return report
+
+    def sync_many(
+        self,
+        access_token: str,
+        stream_ids: list[str],
+        newer_than: Optional[int] = None,
+        max_workers: int = INOREADER_MAX_CONCURRENCY,
+    ) -> dict[str, Union[dict, Exception]]:
+        """
+        여러 스트림을 동시에 동기화. 스트림 하나가 실패해도 나머지는 계속.
+        Returns: {stream_id: sync() 결과 또는 발생한 예외}
+        """
+        stream_ids = list(dict.fromkeys(stream_ids))
+        results: dict[str, Union[dict, Exception]] = {}
+        if not stream_ids:
+            return results
+        with perf.stage("inoreader.sync_many") as span:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(stream_ids))), thread_name_prefix="inoreader-sync",
+            ) as pool:
+                futures = {
+                    stream_id: pool.submit(
+                        contextvars.copy_context().run, self.sync, access_token, stream_id, newer_than,
+                    )
+                    for stream_id in stream_ids
+                }
+                for stream_id, future in futures.items():
+                    try:
+                        results[stream_id] = future.result()
+                    except Exception as e:
+                        logger.warning("Inoreader 동기화 실패 (%s): %s", stream_id, e)
+                        results[stream_id] = e
+            span.items = sum(r["new"] for r in results.values() if isinstance(r, dict))
+        return results
+
+    # ── 조회 ──
+
+    def load(
+        self, stream_id: str, newer_than: Optional[int] = None, older_than: Optional[int] = None,
+    ) -> list[Article]:
+        """저장된 스트림 기사 (최신순)."""
+        articles = self._store().load(
+            stream_folder(stream_id), newer_than, older_than, sources=[stream_source(stream_id)],
+        )
+        articles.sort(key=lambda a: a.get("published") or _EPOCH, reverse=True)
+        return articles
+
+    def fetch_articles(
+        self,
+        access_token: str,
+        stream_id: str,
+        count: int = 100,
+        older_than: Optional[int] = None,
+        newer_than: Optional[int] = None,
+    ) -> list[Article]:
+        """inoreader.fetch_articles와 같은 결과를 증분 동기화 + 저장소 조회로 반환."""
+        self.sync(access_token, stream_id, newer_than)
+        return self.load(stream_id, newer_than, older_than)[:count]
+
+
+_default_sync: Optional[InoreaderSync] = None
+_default_lock = threading.Lock()
+
+
+def get_inoreader_sync() -> InoreaderSync:
+    """프로세스 전체에서 공유하는 기본 동기화 인스턴스."""
+    global _default_sync
+    with _default_lock:
+        if _default_sync is None:
+            _default_sync = InoreaderSync()
+        return _default_sync
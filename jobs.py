@@ -0,0 +1,117 @@
+"""백그라운드 수집 작업 실행기.
+
+Streamlit 스크립트 실행과 분리된 스레드 풀에서 분야별 수집을 수행하고,
+결과와 진행 상태를 프로세스 공유 저장소에 보관한다.
+세션이 끊기거나 페이지를 새로고침해도 작업은 계속 진행되며,
+페이지는 상태를 주기적으로 조회(polling)하여 끝난 분야부터 표시한다.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """분야 하나의 수집 작업 상태."""
+
+    key: tuple
+    folder: str
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str = "대기 중"
+    result: Optional[dict] = None
+    error: str = ""
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED)
+
+
+class JobRunner:
+    """분야별 수집 작업을 백그라운드 스레드에서 실행하는 실행기."""
+
+    def __init__(self, max_workers: int = 1, keep_finished: int = 200):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="collector"
+        )
+        self._jobs: dict[tuple, Job] = {}
+        self._lock = threading.Lock()
+        self.keep_finished = keep_finished
+
+    def submit(self, key: tuple, folder: str, fn: Callable[..., dict], *args, **kwargs) -> Job:
+        """
+        작업 제출. 같은 키의 작업이 이미 있으면 새로 만들지 않고 기존 작업 반환.
+        fn은 progress=(fraction, text) 콜백 키워드 인자를 받아야 함.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.status != FAILED:
+                return job
+            job = Job(key=key, folder=folder)
+            self._jobs[key] = job
+            self._prune_locked()
+
+        def _progress(fraction: float, text: str) -> None:
+            job.progress = max(0.0, min(fraction, 1.0))
+            job.message = text
+
+        def _run() -> None:
+            job.status = RUNNING
+            job.message = "수집 시작"
+            try:
+                job.result = fn(*args, progress=_progress, **kwargs)
+                job.status = DONE
+                job.progress = 1.0
+                job.message = "완료"
+            except Exception as e:
+                logger.exception("'%s' 수집 작업 실패", folder)
+                job.error = str(e)
+                job.status = FAILED
+                job.message = "실패"
+            finally:
+                job.finished_at = time.time()
+
+        # 제출 시점의 측정 컨텍스트(실행 ID 등)를 작업 스레드로 전달
+        self._executor.submit(contextvars.copy_context().run, _run)
+        return job
+
+    def get(self, key: tuple) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(key)
+
+    def discard(self, key: tuple) -> None:
+        """작업 결과 폐기 (진행 중인 작업은 끝까지 실행되지만 결과는 버려짐)."""
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def discard_folder(self, folder: str) -> None:
+        """해당 분야의 모든 작업 결과 폐기."""
+        with self._lock:
+            for key in [k for k, j in self._jobs.items() if j.folder == folder]:
+                del self._jobs[key]
+
+    def active_jobs(self) -> list[Job]:
+        with self._lock:
+            return [j for j in self._jobs.values() if not j.finished]
+
+    def _prune_locked(self) -> None:
+        finished = [j for j in self._jobs.values() if j.finished]
+        if len(finished) <= self.keep_finished:
+            return
+        finished.sort(key=lambda j: j.finished_at or 0)
+        for job in finished[: len(finished) - self.keep_finished]:
+            self._jobs.pop(job.key, None)
@@ -0,0 +1,73 @@
+"""프로세스 전체에서 공유하는 외부 호출 제한기.
+
+여러 분야를 동시에 수집해도 외부 서비스에 가는 요청이 한꺼번에 몰리지 않도록
+동시 실행 수와 호출 간 최소 간격을 한곳에서 제한한다.
+
+- network: RSS 피드 · 기사 본문 · Google 번역 등 일반 HTTP 요청의 동시 실행 수
+- google_news: Google News 검색 (동시 실행 수 + 호출 간격, 차단 방지)
+- inoreader: Inoreader API (동시 실행 수, 앱 사용량 한도는 inoreader 모듈에서 응답 헤더로 관리)
+- llm: Gemini 호출 (무료 티어 분당 호출 수에 맞춘 간격)
+
+대기 시간은 perf에 "<이름>.wait" 단계(llm은 기존 이름 "llm.rate_wait")로 기록된다.
+
+사용 예:
+    with limiters.network():
+        feed = feedparser.parse(url)
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+import perf
+from config import (
+    GOOGLE_NEWS_MIN_INTERVAL,
+    INOREADER_MAX_CONCURRENCY,
+    LLM_MIN_CALL_INTERVAL,
+    NETWORK_MAX_CONCURRENCY,
+)
+
+
+class Limiter:
+    """동시 실행 수와 호출 시작 간 최소 간격을 제한하는 제한기 (스레드 안전)."""
+
+    def __init__(
+        self, name: str, max_concurrent: int = 1, min_interval: float = 0.0,
+        wait_stage: str = "",
+    ):
+        self.name = name
+        self.wait_stage = wait_stage or f"{name}.wait"
+        self.max_concurrent = max(1, max_concurrent)
+        self.min_interval = min_interval
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._interval_lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _wait_interval(self) -> None:
+        if self.min_interval <= 0:
+            return
+        with self._interval_lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    @contextmanager
+    def __call__(self):
+        started = time.perf_counter()
+        self._slots.acquire()
+        try:
+            self._wait_interval()
+            waited = time.perf_counter() - started
+            if waited >= 0.001:
+                perf.recorder.record(self.wait_stage, waited)
+            yield
+        finally:
+            self._slots.release()
+
+
+network = Limiter("network", max_concurrent=NETWORK_MAX_CONCURRENCY)
+google_news = Limiter("google_news", max_concurrent=2, min_interval=GOOGLE_NEWS_MIN_INTERVAL)
+inoreader = Limiter("inoreader", max_concurrent=INOREADER_MAX_CONCURRENCY)
+llm = Limiter("llm", max_concurrent=2, min_interval=LLM_MIN_CALL_INTERVAL, wait_stage="llm.rate_wait")
@@ -5,7 +5,10 @@ import logging
 import re
 import threading
 import time
+from typing import Optional
 
+import limiters
+import perf
 from config import (
     GEMINI_API_KEY,
     LLM_BATCH_SIZE,
@@ -17,18 +20,30 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
-# ── Gemini 무료 티어 속도 제한 ──
-_rate_lock = threading.Lock()
-_last_call_time = 0.0
-_MIN_CALL_INTERVAL = 7.0  # 초 (10 req/min → 6초 간격 + 1초 여유)
+# ── Gemini 무료 티어 속도 제한 (호출 간격은 limiters.llm이 프로세스 전체에서 관리) ──
 _daily_quota_exhausted = False  # 일일 한도 소진 시 True
 
+LLM_NEUTRAL_SCORE = 5  # 응답에서 점수를 읽지 못한 기사의 순위 계산용 중립값
+
+# Gemini 클라이언트는 첫 LLM 호출 때 생성 (google-genai 로드 비용을 시작 시점에서 제외)
 _client = None
-try:
-    from google import genai
-    _client = genai.Client(api_key=GEMINI_API_KEY)
-except Exception:
-    logger.info("Gemini 초기화 실패 — LLM 스코어링 비활성화")
+_client_initialized = False
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Gemini 클라이언트 반환. 초기화에 실패하면 None (이후 재시도하지 않음)."""
+    global _client, _client_initialized
+    if not _client_initialized:
+        with _client_lock:
+            if not _client_initialized:
+                try:
+                    from google import genai
+                    _client = genai.Client(api_key=GEMINI_API_KEY)
+                except Exception:
+                    logger.info("Gemini 초기화 실패 — LLM 스코어링 비활성화")
+                _client_initialized = True
+    return _client
 
 SYSTEM_PROMPT = (
     "You are a senior biohealth industry analyst at a Korean government research institute. "
@@ -63,24 +78,12 @@ def _strip_markdown_json(text: str) -> str:
     return text.strip()
 
 
-def _wait_rate_limit():
-    """무료 티어 속도 제한 준수를 위한 대기."""
-    global _last_call_time
-    with _rate_lock:
-        now = time.time()
-        elapsed = now - _last_call_time
-        if elapsed < _MIN_CALL_INTERVAL:
-            wait = _MIN_CALL_INTERVAL - elapsed
-            logger.info("Rate limit 대기: %.1f초", wait)
-            time.sleep(wait)
-        _last_call_time = time.time()
-
-
 def _is_daily_quota_error(error_msg: str) -> bool:
     """일일 한도 소진 에러인지 확인."""
     return "PerDay" in str(error_msg) or "per_day" in str(error_msg)
 
 
+@perf.timed("llm.call")
 def _call_gemini(prompt: str, *, system: str = None, max_tokens: int = 1024) -> str:
     """Gemini API 호출 (속도 제한 + 재시도 포함)."""
     global _daily_quota_exhausted
@@ -92,17 +95,17 @@ def _call_gemini(prompt: str, *, system: str = None, max_tokens: int = 1024) ->
     last_error = None
 
     for attempt in range(1, LLM_MAX_RETRIES + 1):
-        _wait_rate_limit()
         try:
-            response = _client.models.generate_content(
-                model=LLM_MODEL,
-                contents=prompt,
-                config={
-                    "system_instruction": sys_prompt,
-                    "temperature": 0.1,
-                    "max_output_tokens": max_tokens,
-                },
-            )
+            with limiters.llm():
+                response = _get_client().models.generate_content(
+                    model=LLM_MODEL,
+                    contents=prompt,
+                    config={
+                        "system_instruction": sys_prompt,
+                        "temperature": 0.1,
+                        "max_output_tokens": max_tokens,
+                    },
+                )
             return response.text.strip()
         except Exception as e:
             last_error = e
@@ -124,11 +127,12 @@ def _call_gemini(prompt: str, *, system: str = None, max_tokens: int = 1024) ->
 
 # ── Pass 2: 적합도 스코어링 ──────────────────────────────────
 
+@perf.timed("llm.score")
 def apply_llm_scores(
     articles: list[dict], folder_name: str, criteria: dict
 ) -> list[dict]:
     """배치 단위로 LLM 스코어링 후 키워드 점수와 결합하여 반환."""
-    if not _client:
+    if not _get_client():
         logger.warning("Gemini 모델 없음 — LLM 스코어링 건너뜀")
         return articles
 
@@ -143,8 +147,11 @@ def apply_llm_scores(
             parsed = _parse_llm_response(raw, len(batch))
 
             for i, art in enumerate(batch):
+                # 읽지 못한 점수는 순위에만 중립값을 쓰고 llm_score는 비워 둠 (캐시 · 표시 제외)
                 art["llm_score"] = parsed[i]
-                art["score"] = _combine_scores(art["keyword_score"], parsed[i])
+                art["score"] = _combine_scores(
+                    art["keyword_score"], parsed[i] if parsed[i] is not None else LLM_NEUTRAL_SCORE,
+                )
         except Exception as e:
             logger.warning(
                 "LLM 배치(%d~%d) 실패, 키워드 점수 유지: %s",
@@ -179,8 +186,8 @@ def _build_batch_prompt(
     return "\n".join(lines)
 
 
-def _parse_llm_response(response_text: str, expected_count: int) -> list[int]:
-    """LLM 응답에서 JSON 배열 파싱. 실패 시 중립값(5) 사용."""
+def _parse_llm_response(response_text: str, expected_count: int) -> list[Optional[int]]:
+    """LLM 응답에서 JSON 배열 파싱. 점수를 읽지 못한 항목은 None (호출 측에서 중립값 사용)."""
     text = _strip_markdown_json(response_text)
     start = text.find("[")
     end = text.rfind("]")
@@ -190,14 +197,14 @@ def _parse_llm_response(response_text: str, expected_count: int) -> list[int]:
     try:
         scores = json.loads(text)
         if isinstance(scores, list):
-            result = [max(1, min(10, int(s))) for s in scores]
-            while len(result) < expected_count:
-                result.append(5)
-            return result[:expected_count]
+            result: list[Optional[int]] = [max(1, min(10, int(s))) for s in scores[:expected_count]]
+            if len(result) < expected_count:
+                logger.warning("LLM 응답 점수 부족 (%d/%d) — 나머지는 중립값(5) 사용", len(result), expected_count)
+            return result + [None] * (expected_count - len(result))
     except (json.JSONDecodeError, ValueError, TypeError) as e:
         logger.warning("LLM 응답 파싱 실패: %s — 중립값(5) 사용", e)
 
-    return [5] * expected_count
+    return [None] * expected_count
 
 
 def _combine_scores(keyword_score: float, llm_score: int) -> float:
@@ -221,9 +228,10 @@ TRANSLATE_SYSTEM_PROMPT = (
 )
 
 
+@perf.timed("llm.translate")
 def translate_summaries(articles: list[dict]) -> list[dict]:
     """선별된 기사들의 제목+요약을 한국어로 번역."""
-    if not _client or not articles:
+    if not articles or not _get_client():
         return articles
 
     for batch_start in range(0, len(articles), LLM_BATCH_SIZE):
@@ -305,9 +313,10 @@ ANALYZE_SYSTEM_PROMPT = (
 )
 
 
+@perf.timed("llm.analyze")
 def analyze_articles_for_excel(articles: list[dict]) -> list[dict]:
     """기사 목록을 분석하여 엑셀 메타데이터 추가."""
-    if not _client or not articles:
+    if not articles or not _get_client():
         return articles
 
     for batch_start in range(0, len(articles), LLM_BATCH_SIZE):
@@ -0,0 +1,222 @@
+"""단계별 소요 시간 계측 모듈.
+
+수집(RSS · Google News) · 키워드 스코어링 · Gemini 호출과 속도 제한 대기 ·
+Google 번역 · 본문 스크래핑 · 내보내기 파일 생성 등 각 단계의
+소요 시간, 호출 수, 처리 건수/바이트, 캐시 적중률을 실행(run) · 분야별로 기록한다.
+
+현재 실행 ID와 분야는 contextvars로 전달되므로, 스레드 풀에서 실행할 때는
+contextvars.copy_context()로 감싸 제출해야 같은 실행·분야로 집계된다.
+
+사용 예:
+    @perf.timed("score.keyword")
+    def select_top_articles(...): ...
+
+    with perf.folder_scope("제약"), perf.stage("article_text") as span:
+        span.bytes = len(resp.content)
+"""
+
+import contextvars
+import datetime
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+_current_run: contextvars.ContextVar[str] = contextvars.ContextVar("perf_run", default="")
+_current_folder: contextvars.ContextVar[str] = contextvars.ContextVar("perf_folder", default="")
+
+
+def new_run_id() -> str:
+    """새 실행 ID (시각 기반)."""
+    return datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+
+
+def set_run(run_id: str) -> None:
+    """현재 컨텍스트의 실행 ID 지정."""
+    _current_run.set(run_id)
+
+
+def current_run() -> str:
+    return _current_run.get()
+
+
+@contextmanager
+def folder_scope(folder_name: str):
+    """블록 안에서 기록되는 측정값을 해당 분야로 집계."""
+    token = _current_folder.set(folder_name)
+    try:
+        yield
+    finally:
+        _current_folder.reset(token)
+
+
+class Span:
+    """stage() 블록에서 처리 건수 · 바이트를 채우는 측정 단위."""
+
+    __slots__ = ("items", "bytes", "error")
+
+    def __init__(self):
+        self.items = 0
+        self.bytes = 0
+        self.error = False
+
+
+class PerfRecorder:
+    """측정 이벤트 보관 및 (실행, 분야, 단계) 단위 집계 (스레드 안전)."""
+
+    def __init__(self, max_events: int = 20000, max_runs: int = 50):
+        self._lock = threading.Lock()
+        self._events: deque = deque(maxlen=max_events)
+        self.max_runs = max_runs
+        # 실행 → {(분야, 단계): 집계} — 이벤트 버퍼처럼 최근 max_runs개 실행만 보관
+        self._stats: OrderedDict[str, dict[tuple[str, str], dict]] = OrderedDict()
+
+    def _stat_locked(self, stage_name: str) -> dict:
+        run_id = _current_run.get()
+        run_stats = self._stats.get(run_id)
+        if run_stats is None:
+            run_stats = self._stats[run_id] = {}
+            while len(self._stats) > self.max_runs:
+                self._stats.popitem(last=False)
+        key = (_current_folder.get(), stage_name)
+        stat = run_stats.get(key)
+        if stat is None:
+            stat = {
+                "calls": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0,
+                "items": 0, "bytes": 0, "hits": 0, "misses": 0,
+            }
+            run_stats[key] = stat
+        return stat
+
+    def _event(self, stage_name: str, **values) -> dict:
+        return {
+            "ts": round(time.time(), 3),
+            "run": _current_run.get(),
+            "folder": _current_folder.get(),
+            "stage": stage_name,
+            **values,
+        }
+
+    def record(
+        self, stage_name: str, seconds: float, items: int = 0, nbytes: int = 0, error: bool = False
+    ) -> None:
+        """단계 1회 실행 기록."""
+        event = self._event(
+            stage_name, seconds=round(seconds, 6), items=items, bytes=nbytes, error=error
+        )
+        with self._lock:
+            stat = self._stat_locked(stage_name)
+            stat["calls"] += 1
+            stat["errors"] += int(error)
+            stat["seconds"] += seconds
+            stat["max_seconds"] = max(stat["max_seconds"], seconds)
+            stat["items"] += items
+            stat["bytes"] += nbytes
+            self._events.append(event)
+
+    def cache(self, cache_name: str, hit: bool, count: int = 1) -> None:
+        """캐시 조회 기록 (적중/실패, count회)."""
+        if count <= 0:
+            return
+        event = self._event(cache_name, cache_hit=hit, lookups=count)
+        with self._lock:
+            stat = self._stat_locked(cache_name)
+            stat["hits" if hit else "misses"] += count
+            self._events.append(event)
+
+    def summary(self, run: Optional[str] = None, folder: Optional[str] = None) -> list[dict]:
+        """(실행, 분야, 단계)별 집계 행 목록. run/folder로 거를 수 있음."""
+        with self._lock:
+            items = [
+                (run_id, k, dict(v))
+                for run_id, run_stats in self._stats.items()
+                for k, v in run_stats.items()
+            ]
+        rows = []
+        for run_id, (folder_name, stage_name), stat in items:
+            if run is not None and run_id != run:
+                continue
+            if folder is not None and folder_name != folder:
+                continue
+            lookups = stat["hits"] + stat["misses"]
+            rows.append({
+                "run": run_id,
+                "folder": folder_name,
+                "stage": stage_name,
+                "calls": stat["calls"],
+                "errors": stat["errors"],
+                "total_s": round(stat["seconds"], 3),
+                "mean_ms": round(stat["seconds"] / stat["calls"] * 1000, 1) if stat["calls"] else 0.0,
+                "max_ms": round(stat["max_seconds"] * 1000, 1),
+                "items": stat["items"],
+                "bytes": stat["bytes"],
+                "hit_rate": round(stat["hits"] / lookups, 3) if lookups else None,
+                "hits": stat["hits"],
+                "misses": stat["misses"],
+            })
+        rows.sort(key=lambda r: (r["run"], r["folder"], -r["total_s"]))
+        return rows
+
+    def events(self, run: Optional[str] = None) -> list[dict]:
+        with self._lock:
+            return [dict(e) for e in self._events if run is None or e["run"] == run]
+
+    def to_jsonl(self, run: Optional[str] = None) -> str:
+        """측정 이벤트를 JSON Lines 문자열로 반환."""
+        return "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in self.events(run))
+
+    def write_jsonl(self, path: str, run: Optional[str] = None) -> None:
+        """측정 이벤트를 JSON Lines 파일로 저장 (기존 파일에 이어서 기록)."""
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(self.to_jsonl(run))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._stats.clear()
+
+
+recorder = PerfRecorder()
+
+
+@contextmanager
+def stage(stage_name: str):
+    """블록 소요 시간 측정. 예외는 그대로 전파하고 오류로 기록."""
+    span = Span()
+    started = time.perf_counter()
+    try:
+        yield span
+    except BaseException:
+        span.error = True
+        raise
+    finally:
+        recorder.record(
+            stage_name, time.perf_counter() - started, span.items, span.bytes, span.error
+        )
+
+
+def timed(stage_name: str, count: Optional[Callable[[object], int]] = None):
+    """
+    함수 실행 시간을 측정하는 데코레이터.
+    count: 반환값에서 처리 건수를 계산하는 함수 (없으면 list/dict 길이)
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name) as span:
+                result = fn(*args, **kwargs)
+                if count is not None:
+                    span.items = count(result)
+                elif isinstance(result, (list, dict)):
+                    span.items = len(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def cache_lookup(cache_name: str, hit: bool, count: int = 1) -> None:
+    """캐시 적중/실패 기록."""
+    recorder.cache(cache_name, hit, count)
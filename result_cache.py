@@ -0,0 +1,153 @@
+"""세션 간 공유 수집 결과 캐시.
+
+분야 · 날짜 범위 · 분야 설정 버전을 키로 수집/스코어링/번역 결과를 보관한다.
+프로세스 메모리에 두고 디스크(.cache/results)에도 기록하여,
+여러 분석자가 동시에 대시보드를 열거나 서버가 재시작되어도
+같은 주의 결과를 다시 수집하지 않고 그대로 읽는다.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import perf
+from utils import dumps_json, loads_json
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache", "results")
+
+# 범위 끝이 아직 지나지 않은(오늘을 포함하는) 결과는 새 기사가 계속 올라오므로 유효 기간을 둠
+OPEN_WINDOW_TTL = 3 * 60 * 60
+
+
+def _folder_prefix(folder_name: str) -> str:
+    return hashlib.sha1(folder_name.encode("utf-8")).hexdigest()[:12]
+
+
+class ResultCache:
+    """메모리 + 디스크 2단 수집 결과 캐시 (스레드 안전)."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_entries: int = 64):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory: OrderedDict[tuple, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(folder_name: str, newer_than, older_than, version: str) -> tuple:
+        return (folder_name, newer_than, older_than, version)
+
+    def _path(self, key: tuple) -> str:
+        folder_name, newer_than, older_than, version = key
+        name = f"{_folder_prefix(folder_name)}__{newer_than}_{older_than}_{version}.json"
+        return os.path.join(self.cache_dir, name)
+
+    @staticmethod
+    def _is_fresh(entry: dict) -> bool:
+        older_than = entry.get("older_than")
+        created_at = entry.get("created_at", 0)
+        if older_than is None or older_than > created_at:
+            return time.time() - created_at < OPEN_WINDOW_TTL
+        return True
+
+    def get(self, folder_name: str, newer_than, older_than, version: str) -> Optional[dict]:
+        """캐시된 결과 반환. 없거나 만료되었으면 None."""
+        with perf.folder_scope(folder_name):
+            result = self._get(folder_name, newer_than, older_than, version)
+            perf.cache_lookup("result_cache", result is not None)
+        return result
+
+    def _get(self, folder_name: str, newer_than, older_than, version: str) -> Optional[dict]:
+        key = self.make_key(folder_name, newer_than, older_than, version)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._is_fresh(entry):
+                    self._memory.move_to_end(key)
+                    return entry["result"]
+                del self._memory[key]
+
+        entry = self._read_disk(key)
+        if entry is None or not self._is_fresh(entry):
+            return None
+        with self._lock:
+            self._remember_locked(key, entry)
+        return entry["result"]
+
+    def put(self, folder_name: str, newer_than, older_than, version: str, result: dict) -> None:
+        """결과 저장 (메모리 + 디스크)."""
+        key = self.make_key(folder_name, newer_than, older_than, version)
+        entry = {
+            "folder": folder_name,
+            "newer_than": newer_than,
+            "older_than": older_than,
+            "version": version,
+            "created_at": time.time(),
+            "result": result,
+        }
+        with self._lock:
+            self._remember_locked(key, entry)
+        self._write_disk(key, entry)
+
+    def invalidate(self, folder_name: Optional[str] = None) -> None:
+        """분야(없으면 전체)의 캐시 결과 삭제."""
+        with self._lock:
+            for key in list(self._memory):
+                if folder_name is None or key[0] == folder_name:
+                    del self._memory[key]
+
+        if not os.path.isdir(self.cache_dir):
+            return
+        prefix = _folder_prefix(folder_name) + "__" if folder_name else ""
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".json") and name.startswith(prefix):
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    def _remember_locked(self, key: tuple, entry: dict) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: tuple) -> Optional[dict]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return loads_json(f.read())
+        except (OSError, ValueError) as e:
+            logger.warning("캐시 파일 읽기 실패 (%s): %s", path, e)
+            return None
+
+    def _write_disk(self, key: tuple, entry: dict) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(dumps_json(entry))
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError) as e:
+            logger.warning("캐시 파일 저장 실패: %s", e)
+
+
+_default_cache: Optional[ResultCache] = None
+_default_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """프로세스 전체에서 공유하는 기본 캐시 인스턴스."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResultCache()
+        return _default_cache
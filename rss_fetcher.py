@@ -1,17 +1,59 @@
 """Google RSS 피드 직접 파싱 모듈."""
 
 import calendar
+import contextvars
+import functools
+import html
+import logging
 import re
+import threading
 import time
-from datetime import datetime
-from typing import Optional
-from urllib.parse import urlparse, unquote, quote
-
-import feedparser
-
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Callable, Optional, Union
+from urllib.parse import quote, urljoin, urlparse
+
+import limiters
+import perf
+from article import Article
+from config import FETCH_MAX_WORKERS, GOOGLE_NEWS_BASE_URL
+from feed_health import get_feed_health
+from feed_stream import FeedStreamError, iter_entries
+from search_cache import get_search_cache
 from feeds import RSS_FEEDS
+from url_canon import canonical_url, clean_url, unwrap_redirect
 from utils import strip_html_tags
 
+logger = logging.getLogger(__name__)
+
+# 소스 하나가 끝날 때마다 (완료 수, 전체 수)로 호출되는 콜백
+FetchProgress = Callable[[int, int], None]
+
+# 피드 하나를 가져올 때마다 (피드 URL, 전체 항목 발행 시각, 실패 시 예외)로 호출되는 콜백
+FeedPolled = Callable[[str, list[int], Optional[Exception]], None]
+
+FEED_TIMEOUT = 20  # 초
+
+# 이만큼 연속으로 발행 시각이 내림차순이면 최신순 피드로 보고 범위 밖에서 읽기를 멈춤
+STREAM_SORTED_RUN = 3
+
+# feedparser로 직접 요청하던 때와 같은 User-Agent (피드 서버 응답이 달라지지 않도록)
+FEED_USER_AGENT = "feedparser/6.0.14 +https://github.com/kurtmckee/feedparser/"
+
+# 피드 다운로드는 requests로 하고 파싱은 feed_stream(대체: feedparser)이 담당
+# (연결 재사용 + http_replay 기록/재생 대상). Session은 스레드별로 하나씩 사용
+_local = threading.local()
+
+
+def _session():
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+
+        session = _local.session = requests.Session()
+        session.headers["User-Agent"] = FEED_USER_AGENT
+    return session
+
 
 def _extract_source_from_title(raw_title: str) -> tuple[str, str]:
     """
@@ -36,13 +78,8 @@ def _extract_source_from_title(raw_title: str) -> tuple[str, str]:
 
 def _extract_domain_source(url: str) -> str:
     """URL에서 도메인을 추출하여 출처명으로 사용."""
-    # Google redirect URL에서 실제 URL 추출
-    if "google.com/url" in url and "url=" in url:
-        real_url = url.split("url=")[1].split("&")[0]
-        url = unquote(real_url)
-
     try:
-        domain = urlparse(url).netloc
+        domain = urlparse(unwrap_redirect(url)).netloc
         # www. 제거
         domain = re.sub(r"^www\.", "", domain)
         return domain
@@ -50,74 +87,284 @@ def _extract_domain_source(url: str) -> str:
         return ""
 
 
+def _count_fetched(results: dict) -> int:
+    return sum(len(v) for v in results.values() if isinstance(v, list))
+
+
+def _fetch_concurrently(
+    keys: list[str],
+    fetch_one: Callable[[str], list[dict]],
+    progress: Optional[FetchProgress] = None,
+) -> dict[str, Union[list[dict], Exception]]:
+    """
+    키(피드 URL 또는 검색어)별로 fetch_one을 동시에 실행하여 {키: 기사 리스트 또는 예외} 반환.
+    실제 요청 수는 limiters가 프로세스 전체에서 제한하며, 결과는 keys 순서를 유지한다.
+    """
+    if not keys:
+        return {}
+
+    def _run(key: str):
+        try:
+            return fetch_one(key)
+        except Exception as e:
+            return e
+
+    fetched: dict[str, Union[list[dict], Exception]] = {}
+    workers = min(FETCH_MAX_WORKERS, len(keys))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+        # 측정 컨텍스트(실행 ID · 분야)를 작업 스레드로 전달
+        futures = {
+            pool.submit(contextvars.copy_context().run, _run, key): key for key in keys
+        }
+        for future in as_completed(futures):
+            fetched[futures[future]] = future.result()
+            if progress:
+                progress(len(fetched), len(keys))
+    return {key: fetched[key] for key in keys}
+
+
+def _in_window(published_ts: Optional[int], newer_than: Optional[int], older_than: Optional[int]) -> bool:
+    if published_ts is None:
+        return True
+    if newer_than is not None and published_ts < newer_than:
+        return False
+    if older_than is not None and published_ts > older_than:
+        return False
+    return True
+
+
+def _to_article(
+    raw_title: str,
+    link: str,
+    entry_source: str,
+    summary_html: str,
+    categories: list[str],
+    published_ts: Optional[int],
+) -> Article:
+    """피드 항목 원문 값을 Article로 정규화 (날짜 범위 안 항목에만 호출)."""
+    # 제목에서 언론사명 분리 (Google Alerts 특성)
+    title, source_from_title = _extract_source_from_title(raw_title)
+
+    # 출처 우선순위: 제목에서 추출 → entry.source → URL 도메인
+    source = source_from_title or entry_source or _extract_domain_source(link)
+
+    return Article(
+        title=title,
+        url=clean_url(link),
+        source=source,
+        published=datetime.fromtimestamp(published_ts, timezone.utc).replace(tzinfo=None) if published_ts is not None else None,
+        # 요약 추출 (HTML 태그 제거)
+        summary=strip_html_tags(summary_html),
+        categories=", ".join(categories),
+    )
+
+
+def _entry_article(fields: dict, base_url: str, published_ts: Optional[int]) -> Article:
+    """feed_stream 항목 필드를 Article로 (상대 링크는 피드 주소 기준 절대 주소로)."""
+    link = fields["link"]
+    if link and "://" not in link:
+        link = urljoin(base_url, link)
+    return _to_article(
+        fields["title"], link, fields["source"], fields["summary"], fields["categories"], published_ts,
+    )
+
+
+def _parse_streaming(
+    content: bytes,
+    base_url: str,
+    newer_than: Optional[int],
+    older_than: Optional[int],
+    entry_times: Optional[list[int]],
+    stop_early: bool,
+) -> list[Article]:
+    """
+    feed_stream으로 항목을 하나씩 읽어 발행 시각이 범위 안인 항목만 정규화.
+    stop_early이고 피드가 최신순으로 보이면(STREAM_SORTED_RUN개 이상 연속 내림차순)
+    범위보다 오래된 항목이 나온 시점에서 나머지를 읽지 않는다.
+    수집 주기 학습용 발행 시각(entry_times)은 그때까지 읽은 항목의 것만 모은다
+    (최신 항목부터이므로 발행 간격 추정에 충분).
+    """
+    articles: list[Article] = []
+    previous: Optional[int] = None
+    sorted_run = 0
+    for entry in iter_entries(content):
+        ts = entry.published_ts
+        if ts is not None:
+            if entry_times is not None:
+                entry_times.append(ts)
+            sorted_run = sorted_run + 1 if previous is None or ts <= previous else 0
+            previous = ts
+            if newer_than is not None and ts < newer_than:
+                if stop_early and sorted_run >= STREAM_SORTED_RUN:
+                    break
+                continue
+        if not _in_window(ts, newer_than, older_than):
+            continue
+        articles.append(_entry_article(entry.fields(), base_url, ts))
+    return articles
+
+
+def _feedparser_markup(entry, key: str) -> str:
+    """feedparser 항목 값을 HTML 문자열로 (text/plain 값은 escape — feed_stream._markup과 같은 형태)."""
+    value = entry.get(key, "")
+    detail = entry.get(f"{key}_detail") or {}
+    if value and detail.get("type", "text/html") not in ("text/html", "application/xhtml+xml"):
+        return html.escape(value, quote=False)
+    return value
+
+
+def _parse_feedparser(
+    resp,
+    newer_than: Optional[int],
+    older_than: Optional[int],
+    entry_times: Optional[list[int]],
+) -> list[Article]:
+    """스트리밍 파서로 처리할 수 없는 피드 (깨진 XML, 비표준 날짜 등)는 feedparser로 전체 파싱."""
+    import feedparser  # 대체 경로에서만 로드
+
+    feed = feedparser.parse(
+        resp.content,
+        response_headers={
+            "content-type": resp.headers.get("Content-Type", ""),
+            "content-location": resp.url,
+        },
+    )
+    articles: list[Article] = []
+
+    for entry in feed.entries:
+        published_ts = None
+        time_struct = entry.get("published_parsed") or entry.get("updated_parsed")
+        if time_struct:
+            published_ts = int(calendar.timegm(time_struct))
+            if entry_times is not None:
+                entry_times.append(published_ts)
+
+        # 날짜 필터링
+        if not _in_window(published_ts, newer_than, older_than):
+            continue
+
+        entry_source = ""
+        if hasattr(entry, "source") and isinstance(entry.source, dict):
+            entry_source = entry.source.get("title", "")
+        articles.append(_to_article(
+            _feedparser_markup(entry, "title"),
+            entry.get("link", ""),
+            entry_source,
+            _feedparser_markup(entry, "summary"),
+            [t.get("term", "") for t in entry.get("tags", [])],
+            published_ts,
+        ))
+
+    return articles
+
+
+def _download(feed_url: str):
+    """피드 본문 요청 (limiters.network 동시 실행 제한, 실패 응답은 예외)."""
+    with limiters.network():
+        resp = _session().get(feed_url, timeout=FEED_TIMEOUT)
+    resp.raise_for_status()
+    return resp
+
+
+def fetch_feed_entries(feed_url: str) -> list[tuple[Optional[int], Callable[[], Article]]]:
+    """
+    피드 전체 항목을 (발행 시각, 정규화 함수) 목록으로 반환 (문서 순서).
+    날짜 범위를 모른 채 전체 결과를 보관하는 호출 측(search_cache)이 실제로 요청받은
+    범위 안 항목만 정규화하도록, 항목 필드만 꺼내 두고 Article 변환은 미룬다.
+    """
+    resp = _download(feed_url)
+    with perf.stage("rss.parse") as span:
+        try:
+            entries = [
+                (entry.published_ts, functools.partial(_entry_article, entry.fields(), resp.url, entry.published_ts))
+                for entry in iter_entries(resp.content)
+            ]
+        except FeedStreamError as e:
+            logger.debug("스트리밍 파싱 불가, feedparser 사용 (%s): %s", feed_url, e)
+            entries = [
+                (calendar.timegm(article["published"].timetuple()) if article.get("published") else None, article.copy)
+                for article in _parse_feedparser(resp, None, None, None)
+            ]
+        span.items = len(entries)
+    return entries
+
+
 def fetch_rss_articles(
     feed_url: str,
     newer_than: Optional[int] = None,
     older_than: Optional[int] = None,
+    entry_times: Optional[list[int]] = None,
 ) -> list[dict]:
     """
     RSS 피드 URL을 파싱하여 기사 목록을 반환.
 
+    항목별 발행 시각을 먼저 확인하여 날짜 범위 안 항목만 정규화하며(feed_stream),
+    스트리밍 파서로 처리할 수 없는 피드는 feedparser로 다시 파싱한다.
+
     Args:
         feed_url: RSS 피드 URL
         newer_than: 이 Unix timestamp 이후의 기사만 포함 (선택)
         older_than: 이 Unix timestamp 이전의 기사만 포함 (선택)
+        entry_times: 주면 날짜 필터 전 항목의 발행 시각을 추가 (수집 주기 학습용,
+            최신순 피드에서 범위보다 오래된 항목이 나와 읽기를 멈추면 그때까지의 항목만)
 
     Returns:
-        기존 article dict 형식의 리스트:
+        Article 리스트 (dict 방식 접근 가능):
         [{title, url, source, published, summary, categories}, ...]
     """
-    feed = feedparser.parse(feed_url)
-    articles: list[dict] = []
-
-    for entry in feed.entries:
-        # 발행일 파싱
-        published_dt = None
-        published_ts = None
-
-        time_struct = entry.get("published_parsed") or entry.get("updated_parsed")
-        if time_struct:
-            published_ts = int(calendar.timegm(time_struct))
-            published_dt = datetime.utcfromtimestamp(published_ts)
-
-        # 날짜 필터링
-        if published_ts is not None:
-            if newer_than is not None and published_ts < newer_than:
-                continue
-            if older_than is not None and published_ts > older_than:
-                continue
-
-        # 제목에서 언론사명 분리 (Google Alerts 특성)
-        raw_title = entry.get("title", "")
-        title, source_from_title = _extract_source_from_title(raw_title)
+    resp = _download(feed_url)
+    with perf.stage("rss.parse") as span:
+        times: Optional[list[int]] = [] if entry_times is not None else None
+        try:
+            articles = _parse_streaming(resp.content, resp.url, newer_than, older_than, times, True)
+        except FeedStreamError as e:
+            logger.debug("스트리밍 파싱 불가, feedparser 사용 (%s): %s", feed_url, e)
+            times = [] if entry_times is not None else None
+            articles = _parse_feedparser(resp, newer_than, older_than, times)
+        if entry_times is not None:
+            entry_times.extend(times)
+        span.items = len(articles)
+    return articles
 
-        # 출처 우선순위: 제목에서 추출 → entry.source → URL 도메인
-        source = ""
-        if source_from_title:
-            source = source_from_title
-        elif hasattr(entry, "source") and isinstance(entry.source, dict):
-            source = entry.source.get("title", "")
-        else:
-            source = _extract_domain_source(entry.get("link", ""))
 
-        # 요약 추출 (HTML 태그 제거)
-        summary_html = entry.get("summary", "") or entry.get("description", "")
-        summary = strip_html_tags(summary_html)
-
-        articles.append(
-            {
-                "title": title,
-                "url": entry.get("link", ""),
-                "source": source,
-                "published": published_dt,
-                "summary": summary,
-                "categories": ", ".join(
-                    t.get("term", "") for t in entry.get("tags", [])
-                ),
-            }
-        )
+@perf.timed("rss.fetch", count=_count_fetched)
+def fetch_feeds(
+    feed_list: list[dict],
+    newer_than: Optional[int] = None,
+    older_than: Optional[int] = None,
+    progress: Optional[FetchProgress] = None,
+    on_polled: Optional[FeedPolled] = None,
+) -> dict[str, Union[list[dict], Exception]]:
+    """
+    피드별로 기사를 동시에 수집하여 {피드 URL: 기사 리스트 또는 예외} 형태로 반환.
+    실패한 피드는 예외 객체를 값으로 가짐 (호출 측에서 구분 처리).
+    연속 실패로 차단된 피드는 요청하지 않고 FeedCircuitOpen을 값으로 가짐 (feed_health).
+    progress: 피드 하나가 끝날 때마다 (완료 수, 전체 수)로 호출
+    on_polled: 피드 하나를 가져올 때마다 (URL, 전체 항목 발행 시각, 예외 또는 None)로 호출
+    """
+    health = get_feed_health()
 
-    return articles
+    def _fetch(url: str) -> list[dict]:
+        health.check(url)
+        times: list[int] = []
+        started = time.perf_counter()
+        try:
+            articles = fetch_rss_articles(url, newer_than, older_than, entry_times=times)
+        except Exception as e:
+            health.record_failure(url, time.perf_counter() - started, e)
+            if on_polled is not None:
+                on_polled(url, times, e)
+            raise
+        health.record_success(url, time.perf_counter() - started, len(times))
+        if on_polled is not None:
+            on_polled(url, times, None)
+        return articles
+
+    urls = list(dict.fromkeys(f.get("url", "") for f in feed_list if f.get("url")))
+    try:
+        return _fetch_concurrently(urls, _fetch, progress)
+    finally:
+        health.flush()
 
 
 def fetch_folder_articles(
@@ -142,16 +389,12 @@ def fetch_folder_articles(
         feed_list = RSS_FEEDS.get(folder_name, [])
     all_articles: list[dict] = []
 
-    for feed_info in feed_list:
-        url = feed_info.get("url", "")
-        if not url:
-            continue
-        try:
-            articles = fetch_rss_articles(url, newer_than, older_than)
-            all_articles.extend(articles)
-        except Exception:
-            # 개별 피드 실패 시 건너뜀 (호출 측에서 경고 표시)
+    for url, articles in fetch_feeds(feed_list, newer_than, older_than).items():
+        # 개별 피드 실패 시 경고만 남기고 건너뜀 (피드별 상태는 feed_health에 기록)
+        if isinstance(articles, Exception):
+            logger.warning("'%s' 피드 수집 실패 (%s): %s", folder_name, url, articles)
             continue
+        all_articles.extend(articles)
 
     return all_articles
 
@@ -170,6 +413,9 @@ def fetch_google_news_articles(
     """
     Google News RSS 검색으로 기사를 수집.
 
+    검색 결과 전체를 (검색어, 지역) 키로 잠시 보관하여(search_cache) 다른 분야 · 새로고침의
+    같은 검색어는 요청 없이 날짜 범위로 걸러서 반환. 실제 요청만 limiters.google_news 간격을 따름.
+
     Args:
         query: 검색어
         newer_than: 이 Unix timestamp 이후의 기사만 포함 (선택)
@@ -181,17 +427,56 @@ def fetch_google_news_articles(
     encoded_query = quote(query)
 
     if _is_korean(query):
-        url = (
-            f"https://news.google.com/rss/search?"
-            f"q={encoded_query}+when:14d&hl=ko&gl=KR&ceid=KR:ko"
-        )
+        locale = "hl=ko&gl=KR&ceid=KR:ko"
     else:
-        url = (
-            f"https://news.google.com/rss/search?"
-            f"q={encoded_query}+when:14d&hl=en&gl=US&ceid=US:en"
-        )
+        locale = "hl=en&gl=US&ceid=US:en"
+    url = f"{GOOGLE_NEWS_BASE_URL}/rss/search?q={encoded_query}+when:14d&{locale}"
+
+    def _fetch_all() -> list[tuple[Optional[int], Callable[[], Article]]]:
+        with limiters.google_news():
+            # 검색 결과는 관련도순이므로 전체 항목을 받아 두고, 정규화는 요청 범위 안 항목만
+            return fetch_feed_entries(url)
 
-    return fetch_rss_articles(url, newer_than, older_than)
+    return get_search_cache().get_or_fetch(query, locale, _fetch_all, newer_than, older_than)
+
+
+@perf.timed("search.fetch", count=_count_fetched)
+def fetch_search_queries(
+    search_queries: list[str],
+    newer_than: Optional[int] = None,
+    older_than: Optional[int] = None,
+    progress: Optional[FetchProgress] = None,
+) -> dict[str, Union[list[dict], Exception]]:
+    """
+    검색어별로 Google News를 검색하여 {검색어: 기사 리스트 또는 예외} 형태로 반환.
+    호출 간격은 limiters.google_news가 모든 분야에 걸쳐 유지한다 (공유 캐시 적중 시 요청 없음).
+    progress: 검색어 하나가 끝날 때마다 (완료 수, 전체 수)로 호출
+    """
+    queries = list(dict.fromkeys(q.strip() for q in search_queries if q.strip()))
+    return _fetch_concurrently(
+        queries, lambda query: fetch_google_news_articles(query, newer_than, older_than), progress
+    )
+
+
+def dedupe_articles(article_lists, seen: Optional[set[str]] = None) -> list[dict]:
+    """
+    여러 기사 리스트를 정규 URL과 제목 기준으로 중복 제거하여 합침 (먼저 나온 기사 유지).
+    seen: 이미 포함한 기사 키 집합 (여러 번 호출해 이어서 중복 제거할 때 공유)
+    """
+    seen = set() if seen is None else seen
+    merged: list[dict] = []
+    for articles in article_lists:
+        for art in articles:
+            url_key = canonical_url(art.get("url") or "")
+            title = art.get("title", "").strip().lower()
+            title_key = f"title:{title}" if title else ""
+            if not url_key and not title_key:
+                continue
+            if (url_key and url_key in seen) or (title_key and title_key in seen):
+                continue
+            seen.update(k for k in (url_key, title_key) if k)
+            merged.append(art)
+    return merged
 
 
 def fetch_keyword_search_articles(
@@ -210,21 +495,7 @@ def fetch_keyword_search_articles(
     Returns:
         중복 제거된 기사 dict 리스트
     """
-    all_articles: list[dict] = []
-    seen_titles: set[str] = set()
-
-    for query in search_queries:
-        if not query.strip():
-            continue
-        try:
-            articles = fetch_google_news_articles(query.strip(), newer_than, older_than)
-            for art in articles:
-                title_key = art.get("title", "").strip().lower()
-                if title_key and title_key not in seen_titles:
-                    seen_titles.add(title_key)
-                    all_articles.append(art)
-        except Exception:
-            continue
-        time.sleep(0.5)
-
-    return all_articles
+    results = fetch_search_queries(search_queries, newer_than, older_than)
+    return dedupe_articles(
+        articles for articles in results.values() if not isinstance(articles, Exception)
+    )
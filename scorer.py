@@ -1,9 +1,17 @@
 """기사 스코어링 및 우수 기사 선별 모듈 (2-Pass: 키워드 + LLM)."""
 
+import hashlib
+import json
 import logging
 import re
+import threading
+from collections import OrderedDict
+from typing import Optional
 
+import perf
+from article import Article
 from config import MIN_KEYWORD_SCORE, LLM_SCORING_ENABLED
+from url_canon import article_key, unwrap_redirect
 
 logger = logging.getLogger(__name__)
 
@@ -315,12 +323,11 @@ def _is_video_source(article: dict) -> bool:
 
 def _is_korean_source(article: dict) -> bool:
     """한국 언론매체 여부 판별. 글로벌 기사만 통과."""
-    url = (article.get("url") or "").lower()
+    raw_url = article.get("url") or ""
+    url = raw_url.lower()
 
     # Google redirect URL 안의 실제 URL 추출
-    real_url = url
-    if "url=" in url:
-        real_url = url.split("url=")[-1].split("&")[0].lower()
+    real_url = unwrap_redirect(raw_url).lower()
 
     # URL 패턴 체크 (원본 + 실제 URL 모두)
     for pattern in KOREAN_URL_PATTERNS:
@@ -453,17 +460,94 @@ def score_article(article: dict, folder_name: str, settings: dict = None) -> tup
     return score, matched_keywords, matched_countries
 
 
-def select_top_articles(articles: list[dict], folder_name: str, settings: dict = None) -> list[dict]:
+# 키워드 단계 결과에 영향을 주는 선별 기준 항목 (설명 · top_n은 제외)
+KEYWORD_CRITERIA_FIELDS = (
+    "keywords", "keywords_en", "negative_keywords", "exclude_keywords", "country_boost",
+)
+
+
+def _criteria_hash(criteria: dict, fields) -> str:
+    payload = json.dumps({f: criteria.get(f) for f in fields}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+class ScoringCache:
     """
-    기사 목록에서 스코어링 후 상위 N개를 선별.
-    유료 기사(score == -1)는 제외.
-    MIN_KEYWORD_SCORE 미만 기사 제외.
-    LLM_SCORING_ENABLED일 때 Pass 2 LLM 스코어링 적용.
-    반환되는 각 dict에 'score', 'keyword_score', 'llm_score' 필드가 추가됨.
+    스코어링 단계별 결과 캐시 (스레드 안전).
+
+    - 키워드 단계: (분야, 키워드 기준 해시, 입력 기사 지문) → 정렬 · 중복 제거된 후보 전체
+      → 설명 · top_n만 바뀌면 키워드 스코어링 생략
+    - LLM 단계: (분야, 설명 해시, 기사 키) → LLM 점수
+      → 키워드 · top_n만 바뀌면 새로 후보에 든 기사만 LLM 호출
     """
-    criteria = get_criteria_for_folder(folder_name, settings)
-    top_n = criteria["top_n"]
 
+    def __init__(self, max_candidate_sets: int = 32, max_llm_scores: int = 20000):
+        self.max_candidate_sets = max_candidate_sets
+        self.max_llm_scores = max_llm_scores
+        self._candidates: OrderedDict[tuple, list] = OrderedDict()
+        self._llm_scores: OrderedDict[tuple, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(articles: list[dict]) -> str:
+        h = hashlib.sha1()
+        for a in articles:
+            h.update(article_key(a).encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get_candidates(self, key: tuple) -> Optional[list]:
+        with self._lock:
+            cached = self._candidates.get(key)
+            if cached is not None:
+                self._candidates.move_to_end(key)
+        perf.cache_lookup("scoring_cache.keyword", cached is not None)
+        return cached
+
+    def put_candidates(self, key: tuple, candidates: list) -> None:
+        with self._lock:
+            self._candidates[key] = candidates
+            self._candidates.move_to_end(key)
+            while len(self._candidates) > self.max_candidate_sets:
+                self._candidates.popitem(last=False)
+
+    def get_llm_scores(self, folder_name: str, description_hash: str, keys: list[str]) -> dict[str, int]:
+        with self._lock:
+            found = {
+                k: self._llm_scores[(folder_name, description_hash, k)]
+                for k in keys if (folder_name, description_hash, k) in self._llm_scores
+            }
+        perf.cache_lookup("scoring_cache.llm", True, len(found))
+        perf.cache_lookup("scoring_cache.llm", False, len(keys) - len(found))
+        return found
+
+    def put_llm_scores(self, folder_name: str, description_hash: str, scores: dict[str, int]) -> None:
+        with self._lock:
+            for k, v in scores.items():
+                self._llm_scores[(folder_name, description_hash, k)] = v
+            while len(self._llm_scores) > self.max_llm_scores:
+                self._llm_scores.popitem(last=False)
+
+
+_default_scoring_cache: Optional[ScoringCache] = None
+_default_scoring_lock = threading.Lock()
+
+
+def get_scoring_cache() -> ScoringCache:
+    """프로세스 전체에서 공유하는 기본 스코어링 캐시 인스턴스."""
+    global _default_scoring_cache
+    with _default_scoring_lock:
+        if _default_scoring_cache is None:
+            _default_scoring_cache = ScoringCache()
+        return _default_scoring_cache
+
+
+@perf.timed("score.keyword")
+def keyword_candidates(articles: list[dict], folder_name: str, settings: dict = None) -> list[Article]:
+    """
+    Pass 1: 키워드 점수 계산 → 점수순 정렬 → 제목 중복 제거.
+    유료 기사(score == -1)와 MIN_KEYWORD_SCORE 미만 기사는 제외. top_n으로 자르기 전 전체 목록.
+    """
     scored = []
     for article in articles:
         s, matched_kws, matched_countries = score_article(article, folder_name, settings)
@@ -471,7 +555,7 @@ def select_top_articles(articles: list[dict], folder_name: str, settings: dict =
             continue
         if s < MIN_KEYWORD_SCORE:
             continue
-        entry = dict(article)
+        entry = Article.from_dict(article)
         entry["score"] = s
         entry["keyword_score"] = s
         entry["llm_score"] = None
@@ -491,16 +575,72 @@ def select_top_articles(articles: list[dict], folder_name: str, settings: dict =
         if title_key:
             seen_titles.add(title_key)
         deduped.append(entry)
-    scored = deduped
+    return deduped
+
+
+def _apply_llm_stage(
+    candidates: list[Article], folder_name: str, criteria: dict, cache: Optional[ScoringCache]
+) -> list[Article]:
+    """Pass 2: LLM 스코어링. 캐시에 점수가 있는 기사는 호출 없이 결합 점수만 다시 계산."""
+    from llm_scorer import _combine_scores, apply_llm_scores
+
+    if cache is None:
+        return apply_llm_scores(candidates, folder_name, criteria)
+
+    description_hash = _criteria_hash(criteria, ("description",))
+    known = cache.get_llm_scores(folder_name, description_hash, [article_key(a) for a in candidates])
+    missing = []
+    for art in candidates:
+        llm_score = known.get(article_key(art))
+        if llm_score is None:
+            missing.append(art)
+        else:
+            art["llm_score"] = llm_score
+            art["score"] = _combine_scores(art["keyword_score"], llm_score)
+
+    if missing:
+        apply_llm_scores(missing, folder_name, criteria)
+        cache.put_llm_scores(folder_name, description_hash, {
+            article_key(a): a["llm_score"] for a in missing if a.get("llm_score") is not None
+        })
+    return candidates
+
+
+def select_top_articles(
+    articles: list[dict], folder_name: str, settings: dict = None, cache: Optional[ScoringCache] = None
+) -> list[dict]:
+    """
+    기사 목록에서 스코어링 후 상위 N개를 선별.
+    유료 기사(score == -1)는 제외.
+    MIN_KEYWORD_SCORE 미만 기사 제외.
+    LLM_SCORING_ENABLED일 때 Pass 2 LLM 스코어링 적용.
+    반환되는 각 기사(Article 사본)에 'score', 'keyword_score', 'llm_score' 필드가 추가됨.
+    cache를 주면 키워드 단계 후보와 LLM 점수를 재사용 (설정 중 바뀐 부분만 다시 계산).
+    """
+    criteria = get_criteria_for_folder(folder_name, settings)
+    top_n = criteria["top_n"]
 
-    # 키워드 점수 기준 상위 선별 (LLM 입력용, 여유분 포함)
+    scored = None
+    if cache is not None:
+        cache_key = (
+            folder_name,
+            _criteria_hash(criteria, KEYWORD_CRITERIA_FIELDS),
+            ScoringCache.fingerprint(articles),
+        )
+        scored = cache.get_candidates(cache_key)
+    if scored is None:
+        scored = keyword_candidates(articles, folder_name, settings)
+        if cache is not None:
+            cache.put_candidates(cache_key, scored)
+
+    # 키워드 점수 기준 상위 선별 (LLM 입력용, 여유분 포함) — 캐시된 후보는 사본으로 사용
     candidates = scored[:top_n * 2] if LLM_SCORING_ENABLED else scored[:top_n]
+    candidates = [a.copy() for a in candidates]
 
     # Pass 2: LLM 스코어링
     if LLM_SCORING_ENABLED and candidates:
         try:
-            from llm_scorer import apply_llm_scores
-            candidates = apply_llm_scores(candidates, folder_name, criteria)
+            candidates = _apply_llm_stage(candidates, folder_name, criteria, cache)
             candidates.sort(key=lambda x: x["score"], reverse=True)
         except Exception as e:
             logger.warning("LLM 스코어링 실패, 키워드 점수만 사용: %s", e)
@@ -0,0 +1,121 @@
+"""Google News 검색 결과 공유 캐시.
+
+검색어가 비어 있는 분야는 키워드 앞 3개로 검색어를 만들기 때문에 "FDA", "AI"처럼
+여러 분야가 같은 검색어를 쓰는 경우가 많다. 검색 주소는 날짜 범위와 관계없이
+검색어와 지역(hl/gl)만으로 정해지므로(when:14d), 한 번 가져온 전체 결과를
+(정규화한 검색어, 지역) 키로 짧게 보관해 두고 분야 · 새로고침마다 요청한 날짜 범위로
+걸러서 돌려준다. 항목은 (발행 시각, 정규화 함수)로 보관하고, 어떤 요청 범위에 처음
+들어올 때 한 번만 Article로 정규화한다 (범위 밖 항목은 정규화하지 않음).
+
+- 같은 키를 여러 분야가 동시에 요청하면 한 번만 가져오고 나머지는 그 결과를 기다림
+- 실패한 요청은 보관하지 않음
+- 프로세스 메모리에만 보관 (유효 기간이 짧아 디스크에 둘 필요 없음)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import perf
+from config import GOOGLE_NEWS_CACHE_TTL
+
+# (발행 시각, 정규화 함수) — rss_fetcher.fetch_feed_entries 항목
+LazyEntry = tuple[Optional[int], Callable[[], dict]]
+
+
+def normalize_query(query: str) -> str:
+    """대소문자 · 공백 차이를 무시한 검색어 키."""
+    return " ".join(query.split()).casefold()
+
+
+class SearchCache:
+    """(검색어, 지역)별 전체 검색 결과 캐시 (스레드 안전)."""
+
+    def __init__(self, ttl: float = GOOGLE_NEWS_CACHE_TTL, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+
+    def _fresh_locked(self, key: tuple[str, str]) -> Optional[list]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        fetched_at, items = entry
+        if time.time() - fetched_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return items
+
+    def _cached(self, key: tuple[str, str]) -> Optional[list]:
+        with self._lock:
+            return self._fresh_locked(key)
+
+    def get_or_fetch(
+        self,
+        query: str,
+        locale: str,
+        fetch: Callable[[], list[LazyEntry]],
+        newer_than: Optional[int] = None,
+        older_than: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        캐시된 전체 결과(없으면 fetch()로 가져와 보관)에서 날짜 범위 안 기사 사본을 반환.
+        fetch는 날짜 필터 없이 검색 결과 전체를 (발행 시각, 정규화 함수) 목록으로 돌려줘야 한다.
+        """
+        key = (normalize_query(query), locale)
+        items = self._cached(key)
+        hit = items is not None
+        if items is None:
+            with self._lock:
+                key_lock = self._key_locks.setdefault(key, threading.Lock())
+            try:
+                with key_lock:
+                    # 먼저 요청한 분야가 가져오는 동안 기다렸다면 그 결과 사용
+                    items = self._cached(key)
+                    hit = items is not None
+                    if items is None:
+                        # [발행 시각, 정규화 함수, 정규화된 기사(처음 요청될 때 채움)]
+                        items = [[ts, build, None] for ts, build in fetch()]
+                        with self._lock:
+                            self._entries[key] = (time.time(), items)
+                            self._entries.move_to_end(key)
+                            while len(self._entries) > self.max_entries:
+                                self._entries.popitem(last=False)
+            finally:
+                # 가져오기가 실패해도 검색어별 잠금은 남기지 않음
+                with self._lock:
+                    self._key_locks.pop(key, None)
+        perf.cache_lookup("search_cache", hit)
+
+        articles = []
+        for item in items:
+            ts = item[0]
+            if ts is not None and (
+                (newer_than is not None and ts < newer_than) or (older_than is not None and ts > older_than)
+            ):
+                continue
+            if item[2] is None:
+                item[2] = item[1]()  # 동시에 정규화해도 결과가 같으므로 잠금 없이 채움
+            articles.append(item[2].copy())
+        return articles
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_default_cache: Optional[SearchCache] = None
+_default_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """프로세스 전체에서 공유하는 기본 검색 결과 캐시."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = SearchCache()
+        return _default_cache
@@ -2,13 +2,41 @@
 
 settings.json에 분야별 스코어링 기준과 RSS 피드 URL을 저장.
 파일이 없으면 scorer.py와 feeds.py의 기본값으로 초기화.
+
+- 저장: 임시 파일에 쓴 뒤 os.replace로 교체 (중간에 중단돼도 파일이 잘리지 않음),
+  스레드 락 + 잠금 파일로 여러 세션 · 프로세스의 동시 저장을 직렬화
+- 로드: 파일 수정 시각 · 크기가 그대로면 메모리 캐시에서 반환 (호출 측이 수정하므로 깊은 복사)
+- 버전: 내용이 바뀔 때마다 1씩 증가하는 settings_revision()으로 하위 캐시 무효화 시점 판단
 """
 
+import hashlib
 import json
+import logging
 import os
 import copy
+import secrets
+import stat
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+logger = logging.getLogger(__name__)
 
 SETTINGS_FILE = os.path.join(os.path.dirname(__file__), "settings.json")
+LOCK_FILE = SETTINGS_FILE + ".lock"
+
+_lock = threading.RLock()
+_cache: dict = {"stat": None, "data": None, "hash": None}
+_revision = 0
 
 
 def _get_defaults() -> dict:
@@ -38,25 +66,124 @@ def _get_defaults() -> dict:
     return {"folders": folders}
 
 
+@contextmanager
+def _file_lock():
+    """설정 파일 저장용 프로세스 간 잠금 (잠금 파일 기반)."""
+    with _lock:
+        with open(LOCK_FILE, "a+b") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _file_stat():
+    try:
+        st = os.stat(SETTINGS_FILE)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _content_hash(value) -> str:
+    """JSON 값의 내용 해시 (키 순서 무관)."""
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _existing_mode() -> Optional[int]:
+    """기존 설정 파일의 권한 (없으면 None — 새 파일은 umask를 따름)."""
+    try:
+        return stat.S_IMODE(os.stat(SETTINGS_FILE).st_mode)
+    except OSError:
+        return None
+
+
+def _remember(settings: dict, stat) -> None:
+    """캐시 갱신. 내용이 달라졌으면 리비전 증가 (호출 측에서 _lock 보유)."""
+    global _revision
+    content_hash = _content_hash(settings)
+    if content_hash != _cache["hash"]:
+        _revision += 1
+    _cache.update(stat=stat, data=settings, hash=content_hash)
+
+
+def settings_revision() -> int:
+    """
+    설정 내용이 바뀔 때마다 증가하는 번호 (하위 캐시 무효화 판단용, 프로세스 내 단조 증가).
+    다른 프로세스가 파일을 바꿨으면 다시 읽어 반영.
+    """
+    with _lock:
+        if _file_stat() != _cache["stat"]:
+            load_settings()
+        return _revision
+
+
 def load_settings() -> dict:
-    """설정 파일 로드. 없으면 기본값으로 생성."""
-    if os.path.exists(SETTINGS_FILE):
-        try:
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            pass
-
-    # 기본값으로 초기화
-    settings = _get_defaults()
-    save_settings(settings)
-    return settings
+    """설정 파일 로드. 없으면 기본값으로 생성. 반환값은 호출 측이 자유롭게 수정 가능한 사본."""
+    with _lock:
+        stat = _file_stat()
+        if stat is not None and stat == _cache["stat"]:
+            return copy.deepcopy(_cache["data"])
+
+        if stat is not None:
+            try:
+                with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+                    settings = json.load(f)
+                _remember(settings, stat)
+                return copy.deepcopy(settings)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning("설정 파일 읽기 실패, 기본값 사용: %s", e)
+
+        # 기본값으로 초기화
+        settings = _get_defaults()
+        save_settings(settings)
+        return settings
 
 
 def save_settings(settings: dict):
-    """설정을 JSON 파일에 저장."""
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, ensure_ascii=False, indent=2)
+    """설정을 JSON 파일에 원자적으로 저장 (임시 파일 → 교체)."""
+    payload = json.dumps(settings, ensure_ascii=False, indent=2)
+    directory = os.path.dirname(SETTINGS_FILE)
+    with _file_lock():
+        # mkstemp(0o600)와 달리 일반 파일처럼 0o666에서 umask를 뺀 권한으로 생성
+        tmp_path = os.path.join(directory, f".settings.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            mode = _existing_mode()
+            if mode is not None:  # 기존 파일 권한 유지
+                os.chmod(tmp_path, mode)
+            os.replace(tmp_path, SETTINGS_FILE)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        _remember(copy.deepcopy(settings), _file_stat())
+
+
+def settings_version(settings: dict) -> str:
+    """설정 내용의 해시. 설정이 바뀌면 값이 달라지므로 캐시 키로 사용."""
+    return _content_hash(settings)[:12]
+
+
+def folder_settings_version(settings: dict, folder_name: str) -> str:
+    """특정 폴더 설정만의 해시. 다른 폴더 설정 변경에는 영향받지 않음."""
+    return _content_hash(settings.get("folders", {}).get(folder_name, {}))[:12]
 
 
 def get_folder_names(settings: dict) -> list[str]:
@@ -147,3 +274,50 @@ def update_search_queries(settings: dict, folder_name: str, queries: list[str])
     if folder_name in settings.get("folders", {}):
         settings["folders"][folder_name]["search_queries"] = queries
     return settings
+
+
+# ── 분야별 설정 변경 비교 ──────────────────────────────────────
+
+# 변경 종류 → 다시 해야 하는 작업
+#   feeds / search_queries : 추가된 소스만 수집 (기존 소스는 기사 저장소 사용)
+#   keywords               : 저장된 기사로 키워드 재스코어링 (수집 없음)
+#   description            : LLM 스코어링만 다시 실행
+#   top_n                  : 후보 목록에서 다시 자르기 (새로 든 기사만 LLM)
+_KEYWORD_FIELDS = ("keywords", "keywords_en", "negative_keywords", "exclude_keywords", "country_boost")
+
+
+def diff_folder_settings(old: dict, new: dict) -> dict[str, set[str]]:
+    """
+    두 설정의 분야별 변경 항목 반환. 바뀐 분야만 포함.
+    항목: added, removed, feeds, search_queries, keywords, description, top_n
+    """
+    old_folders = old.get("folders", {})
+    new_folders = new.get("folders", {})
+    changes: dict[str, set[str]] = {}
+
+    for name in set(old_folders) | set(new_folders):
+        if name not in old_folders:
+            changes[name] = {"added"}
+            continue
+        if name not in new_folders:
+            changes[name] = {"removed"}
+            continue
+
+        before, after = old_folders[name], new_folders[name]
+        kinds: set[str] = set()
+        if before.get("feeds", []) != after.get("feeds", []):
+            kinds.add("feeds")
+        if before.get("search_queries", []) != after.get("search_queries", []):
+            kinds.add("search_queries")
+
+        c_before, c_after = before.get("criteria", {}), after.get("criteria", {})
+        if any(c_before.get(f) != c_after.get(f) for f in _KEYWORD_FIELDS):
+            kinds.add("keywords")
+        if c_before.get("description", "") != c_after.get("description", ""):
+            kinds.add("description")
+        if c_before.get("top_n") != c_after.get("top_n"):
+            kinds.add("top_n")
+
+        if kinds:
+            changes[name] = kinds
+    return changes
@@ -0,0 +1,13 @@
+"""진입 모듈 임포트 시간 예산 점검 (import_budget.DEFAULT_BUDGETS_MS)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import import_budget  # noqa: E402
+
+
+def test_import_budgets():
+    failures = import_budget.check(import_budget.DEFAULT_BUDGETS_MS)
+    assert not failures, "\n".join(failures)
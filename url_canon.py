@@ -0,0 +1,114 @@
+"""기사 URL 정규화 모듈.
+
+Google Alerts · Google News 검색 · Inoreader에서 들어온 같은 기사를 하나로 묶기 위해
+리디렉션 해제, 추적 파라미터 제거, 스킴 · 호스트 정규화를 한곳에서 처리한다.
+같은 URL을 반복해서 다루므로 결과는 URL별로 메모이즈한다.
+
+- clean_url: 리디렉션 해제 + 추적 파라미터 · 프래그먼트 제거 (링크로 그대로 사용 가능)
+- canonical_url: clean_url + https · 소문자 호스트 · www 제거 · 파라미터 정렬 (비교 · 캐시 키용)
+- article_key: 기사 식별 키 (정규 URL, 없으면 제목)
+"""
+
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 실제 기사 URL을 쿼리에 담아 넘기는 리디렉션 (호스트 접미사, 경로) → 파라미터 후보
+_REDIRECTS = (
+    ("google.com", "/url", ("url", "q")),
+    ("google.co.kr", "/url", ("url", "q")),
+)
+
+# 기사 내용과 무관한 추적 파라미터
+_TRACKING_PARAMS = frozenset((
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid",
+    "mc_cid", "mc_eid", "igshid", "_ga", "_gl", "ocid", "cmpid",
+))
+_TRACKING_PREFIXES = ("utm_",)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# 리디렉션이 중첩된 경우 최대 해제 횟수
+_MAX_UNWRAP = 3
+
+
+def _is_tracking(name: str) -> bool:
+    lowered = name.lower()
+    return lowered in _TRACKING_PARAMS or lowered.startswith(_TRACKING_PREFIXES)
+
+
+def _redirect_target(parts) -> str:
+    host = (parts.hostname or "").lower()
+    for suffix, path, params in _REDIRECTS:
+        if (host == suffix or host.endswith("." + suffix)) and parts.path == path:
+            query = dict(parse_qsl(parts.query, keep_blank_values=False))
+            for name in params:
+                target = query.get(name, "")
+                if target.startswith(("http://", "https://")):
+                    return target
+    return ""
+
+
+@lru_cache(maxsize=65536)
+def unwrap_redirect(url: str) -> str:
+    """Google redirect URL(google.com/url?url=… 또는 ?q=…)에서 실제 기사 URL 추출."""
+    for _ in range(_MAX_UNWRAP):
+        try:
+            target = _redirect_target(urlsplit(url))
+        except ValueError:
+            break
+        if not target:
+            break
+        url = target
+    return url
+
+
+@lru_cache(maxsize=65536)
+def clean_url(url: str) -> str:
+    """리디렉션 해제 후 추적 파라미터와 프래그먼트를 제거한 URL. 해석할 수 없으면 그대로."""
+    if not url:
+        return ""
+    url = unwrap_redirect(url.strip())
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.netloc:
+        return url
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    kept = [(k, v) for k, v in params if not _is_tracking(k)]
+    # 제거할 파라미터가 없으면 원래 쿼리 문자열(인코딩 포함)을 그대로 유지
+    query = parts.query if len(kept) == len(params) else urlencode(kept)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+@lru_cache(maxsize=65536)
+def canonical_url(url: str) -> str:
+    """같은 기사를 같은 문자열로 만드는 정규 URL (비교 · 중복 제거 · 캐시 키용)."""
+    url = clean_url(url)
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.hostname:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = parts.hostname.lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    netloc = host if port is None or port == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+    if scheme == "http":
+        scheme = "https"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/")
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def article_key(article) -> str:
+    """기사 식별 키: 정규 URL, URL이 없으면 제목."""
+    url = article.get("url")
+    return canonical_url(url) if url else article.get("title", "")
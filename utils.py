@@ -1,58 +1,199 @@
 import re
 import io
-import pandas as pd
+import json
+import numbers
+import os
+import tempfile
+from datetime import date, datetime
+from html import unescape
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Optional, Union
+
+from article import Article
+
+if TYPE_CHECKING:  # pandas · xlsxwriter는 엑셀 변환 시에만 로드
+    import pandas as pd
+
+HEADER_FORMAT = {"bold": True, "bg_color": "#4472C4", "font_color": "#FFFFFF"}
+MAX_COLUMN_WIDTH = 60
+# pandas to_excel 기본값과 같은 날짜 셀 서식
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+DATE_FORMAT = "yyyy-mm-dd"
 
 
 def strip_html_tags(html: str) -> str:
-    """HTML 태그를 제거하고 텍스트만 반환."""
+    """HTML 태그를 제거하고 엔티티(&amp;, &#39; 등)를 풀어 텍스트만 반환."""
     if not html:
         return ""
-    text = re.sub(r"<[^>]+>", "", html)
+    text = unescape(re.sub(r"<[^>]+>", "", html))
     text = re.sub(r"\s+", " ", text).strip()
     return text
 
 
-def dataframe_to_excel(df: pd.DataFrame) -> bytes:
-    """DataFrame을 xlsx 바이트로 변환. 헤더 서식 적용."""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        df.to_excel(writer, index=False, sheet_name="Articles")
-        workbook = writer.book
-        worksheet = writer.sheets["Articles"]
-
-        header_fmt = workbook.add_format(
-            {"bold": True, "bg_color": "#4472C4", "font_color": "#FFFFFF"}
-        )
-        for col_idx, col_name in enumerate(df.columns):
-            worksheet.write(0, col_idx, col_name, header_fmt)
-            max_len = max(df[col_name].astype(str).str.len().max(), len(col_name)) + 2
-            max_len = min(max_len, 60)
-            worksheet.set_column(col_idx, col_idx, max_len)
+def _json_default(obj):
+    """datetime/date/Article을 태그가 붙은 dict로 인코딩 (loads_json에서 복원)."""
+    if isinstance(obj, Article):
+        return {"__article__": obj.to_dict()}
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, date):
+        return {"__date__": obj.isoformat()}
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(obj).__name__}")
+
+
+def _json_object_hook(obj: dict):
+    if len(obj) == 1:
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+        if "__article__" in obj:
+            return Article.from_dict(obj["__article__"])
+    return obj
+
+
+def dumps_json(obj) -> str:
+    """기사 dict 등을 JSON 문자열로 변환 (발행일 datetime 보존)."""
+    return json.dumps(obj, ensure_ascii=False, default=_json_default)
+
+
+def loads_json(text: str):
+    """dumps_json으로 만든 JSON 문자열 복원."""
+    return json.loads(text, object_hook=_json_object_hook)
+
+
+def atomic_write_text(path: str, text: str) -> None:
+    """
+    같은 디렉터리의 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 파일 유지).
+    쓰기 · 교체가 실패하면 임시 파일을 지우고 예외를 그대로 전파.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _cell_value(value):
+    """xlsxwriter가 쓸 수 있는 값으로 변환 (None/NaN은 빈 칸, 목록 · 사전 등은 문자열)."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value != value:
+        return ""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)  # 엑셀 날짜는 시간대 정보가 없음
+    if isinstance(value, (str, date, numbers.Real)):
+        return value
+    return str(value)
+
+
+def _write_sheet(worksheet, rows: Iterable[dict], columns: Optional[list[str]], formats: dict) -> None:
+    """행을 하나씩 스트리밍으로 기록하면서 열 너비를 누적 계산."""
+    rows = iter(rows)
+    first = None
+    if columns is None:
+        first = next(rows, None)
+        columns = list(first.keys()) if first else []
 
+    widths = [len(str(c)) for c in columns]
+    for col_idx, col_name in enumerate(columns):
+        worksheet.write(0, col_idx, col_name, formats["header"])
+
+    def _emit(row_idx: int, row: dict) -> None:
+        for col_idx, col_name in enumerate(columns):
+            value = _cell_value(row.get(col_name))
+            if isinstance(value, datetime):
+                worksheet.write_datetime(row_idx, col_idx, value, formats["datetime"])
+                length = len("0000-00-00 00:00:00")
+            elif isinstance(value, date):
+                worksheet.write_datetime(row_idx, col_idx, value, formats["date"])
+                length = len("0000-00-00")
+            else:
+                worksheet.write(row_idx, col_idx, value)
+                length = len(str(value))
+            if length > widths[col_idx]:
+                widths[col_idx] = length
+
+    row_idx = 1
+    if first is not None:
+        _emit(row_idx, first)
+        row_idx += 1
+    for row in rows:
+        _emit(row_idx, row)
+        row_idx += 1
+
+    for col_idx, width in enumerate(widths):
+        worksheet.set_column(col_idx, col_idx, min(width + 2, MAX_COLUMN_WIDTH))
+
+
+def write_excel_stream(
+    sheets: dict[str, Iterable[dict]],
+    output: Union[str, BinaryIO],
+    columns: Union[list[str], dict[str, list[str]], None] = None,
+) -> None:
+    """
+    행 딕셔너리를 시트별로 xlsx에 스트리밍 기록 (constant_memory 모드).
+
+    DataFrame을 만들지 않고 기사 레코드에서 바로 행을 기록하며,
+    열 너비는 기록하면서 누적 계산한다.
+
+    Args:
+        sheets: {시트 이름: 행 딕셔너리 iterable}
+        output: 파일 경로 또는 쓰기 가능한 바이너리 파일 객체 (응답 스트림 등)
+        columns: 열 순서 — 모든 시트 공통 리스트 또는 {시트 이름: 열 순서}
+            (없으면 각 시트 첫 행의 키 순서)
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+    try:
+        formats = {
+            "header": workbook.add_format(HEADER_FORMAT),
+            "datetime": workbook.add_format({"num_format": DATETIME_FORMAT}),
+            "date": workbook.add_format({"num_format": DATE_FORMAT}),
+        }
+        for sheet_name, rows in sheets.items():
+            # 시트 이름 31자 제한
+            worksheet = workbook.add_worksheet(sheet_name[:31])
+            sheet_columns = columns.get(sheet_name) if isinstance(columns, dict) else columns
+            _write_sheet(worksheet, rows, sheet_columns, formats)
+    finally:
+        workbook.close()
+
+
+def rows_to_excel(sheets: dict[str, Iterable[dict]], columns: Optional[list[str]] = None) -> bytes:
+    """행 딕셔너리를 시트별로 나눈 xlsx 바이트로 변환."""
+    output = io.BytesIO()
+    write_excel_stream(sheets, output, columns)
     return output.getvalue()
 
 
-def dataframes_to_excel(sheets: dict[str, pd.DataFrame]) -> bytes:
+def _dataframe_rows(df: "pd.DataFrame") -> Iterable[dict]:
+    columns = [str(c) for c in df.columns]
+    for values in df.itertuples(index=False, name=None):
+        yield dict(zip(columns, values))
+
+
+def dataframe_to_excel(df: "pd.DataFrame") -> bytes:
+    """DataFrame을 xlsx 바이트로 변환. 헤더 서식 적용."""
+    return dataframes_to_excel({"Articles": df})
+
+
+def dataframes_to_excel(sheets: dict[str, "pd.DataFrame"]) -> bytes:
     """여러 DataFrame을 시트별로 나눈 xlsx 바이트로 변환."""
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="xlsxwriter") as writer:
-        for sheet_name, df in sheets.items():
-            # 시트 이름 31자 제한
-            safe_name = sheet_name[:31]
-            df.to_excel(writer, index=False, sheet_name=safe_name)
-
-            workbook = writer.book
-            worksheet = writer.sheets[safe_name]
-
-            header_fmt = workbook.add_format(
-                {"bold": True, "bg_color": "#4472C4", "font_color": "#FFFFFF"}
-            )
-            for col_idx, col_name in enumerate(df.columns):
-                worksheet.write(0, col_idx, col_name, header_fmt)
-                max_len = max(
-                    df[col_name].astype(str).str.len().max(), len(str(col_name))
-                ) + 2
-                max_len = min(max_len, 60)
-                worksheet.set_column(col_idx, col_idx, max_len)
-
+    write_excel_stream(
+        {name: _dataframe_rows(df) for name, df in sheets.items()},
+        output,
+        {name: [str(c) for c in df.columns] for name, df in sheets.items()},
+    )
     return output.getvalue()